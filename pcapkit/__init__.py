@@ -101,7 +101,7 @@ __all__ = [
 
     'TREE', 'JSON', 'PLIST', 'PCAP',                        # Format Macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # Layer Macros
-    'DPKT', 'Scapy', 'PyShark', 'PCAPKit',                  # Engine Macros
+    'DPKT', 'Scapy', 'PyShark', 'PCAPKit', 'MMAP',          # Engine Macros
 
     'LINKTYPE', 'ETHERTYPE', 'TRANSTYPE', 'APPTYPE',        # Protocol Numbers
 
@@ -81,11 +81,21 @@ def get_parser() -> 'ArgumentParser':
                         help='Indicate extraction stops after which protocol.')
     parser.add_argument('-L', '--layer', action='store', dest='layer', default='None', metavar='LAYER',
                         help='Indicate extract frames until which layer.')
+    parser.add_argument('-I', '--index', action='store_true', default=False,
+                        help=('Print frame count and time range from the frame offset index '
+                              '(building and saving the sidecar index file if necessary), '
+                              'then exit without extraction.'))
     parser.add_argument('-B', '--buffer-save', action='store_true', default=False,
                         help='Indicate if store buffer to file when reading from stdin.')
     parser.add_argument('-O', '--buffer-path', action='store', metavar='file-name', dest='buffer_path',
                         help=('The name of buffer storage file. If `--buffer-save` is set and this '
                               'omits, it will be automatically assigned.'))
+    parser.add_argument('-W', '--follow', action='store_true', default=False,
+                        help=('Keep waiting for new frames when reaching EOF, e.g., to follow '
+                              'a capture file as it is being written. This is implied when '
+                              'reading from `stdin\'.'))
+    parser.add_argument('--idle-timeout', action='store', type=float, metavar='SECONDS', dest='idle_timeout',
+                        help='Stop waiting for new frames after being idle for the given seconds.')
     return parser
 
 
@@ -105,7 +115,18 @@ def main() -> 'int':
     else:
         fmt = None
 
-    no_eof = args.fin == '-'
+    if args.index:
+        from pcapkit.foundation.index import \
+            FrameIndex  # pylint: disable=import-outside-toplevel
+
+        index = FrameIndex.from_file(args.fin)
+        print(f'[*] {args.fin!r}: {index.length} frames ({index.format})')
+        if (time_range := index.time_range) is not None:
+            print(f'[*] Time range: {time_range[0] / 1_000_000_000:.9f} - '
+                  f'{time_range[1] / 1_000_000_000:.9f}')
+        return 0
+
+    no_eof = args.follow or args.fin == '-'
     if args.fin == '-':
         args.fin = sys.stdin.buffer
 
@@ -115,7 +136,8 @@ def main() -> 'int':
                           layer=args.layer, protocol=args.protocol,
                           engine=args.engine, extension=args.auto_extension,
                           verbose=args.verbose, buffer_save=args.buffer_save,
-                          no_eof=no_eof, buffer_path=args.buffer_path)  # type: ignore[var-annotated]
+                          no_eof=no_eof, idle_timeout=args.idle_timeout,
+                          buffer_path=args.buffer_path)  # type: ignore[var-annotated]
 
     if args.verbose:
         try:
@@ -16,18 +16,19 @@ and :class:`~pcapkit.corekit.multidict.MultiDict` family inspired from
 etc.
 
 """
-from pcapkit.corekit.io import SeekableReader
+from pcapkit.corekit.io import MemoryReader, ParallelGzipReader, SeekableReader
 from pcapkit.corekit.fields import *
 from pcapkit.corekit.infoclass import Info, info_final
 from pcapkit.corekit.module import ModuleDescriptor
 from pcapkit.corekit.multidict import MultiDict, OrderedMultiDict
 from pcapkit.corekit.protochain import ProtoChain
+from pcapkit.corekit.threshold import Threshold
 from pcapkit.corekit.version import VersionInfo
 
 __all__ = [
     'Info', 'info_final',
 
-    'ProtoChain',
+    'ProtoChain', 'Threshold',
 
     'VersionInfo',
 
@@ -53,7 +54,7 @@ __all__ = [
     'IPv4AddressField', 'IPv6AddressField',
     'IPv4InterfaceField', 'IPv6InterfaceField',
 
-    'SeekableReader',
+    'SeekableReader', 'ParallelGzipReader', 'MemoryReader',
 
     'ModuleDescriptor',
 ]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Code Generation
+=====================
+
+.. module:: pcapkit.corekit.codegen
+
+:mod:`pcapkit.corekit.codegen` contains the helper function
+:func:`~pcapkit.corekit.codegen.create_fn` for generating
+methods from source code, e.g., the ``__init__`` methods of
+:class:`~pcapkit.corekit.infoclass.Info` and
+:class:`~pcapkit.protocols.schema.schema.Schema` classes.
+
+The compiled code objects are cached on disk, such that
+short-lived processes need not to compile the same source
+code again upon each import. The cache directory can be
+customised through the ``PCAPKIT_CACHE_DIR`` environment
+variable, and setting it to an empty string disables the
+on-disk cache.
+
+"""
+import atexit
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+import tempfile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import CodeType
+    from typing import Any, Callable, Optional
+
+__all__ = ['create_fn']
+
+
+def _cache_file() -> 'Optional[str]':
+    """Get path to the on-disk code cache.
+
+    Returns:
+        Path to the cache file, or :obj:`None` if the cache is disabled.
+
+    Notes:
+        The cache file is versioned by the interpreter implementation
+        and its bytecode magic number, such that code objects compiled
+        by other interpreters will never be loaded.
+
+    """
+    root = os.environ.get('PCAPKIT_CACHE_DIR')
+    if root is None:
+        root = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join('~', '.cache'), 'pcapkit')
+    if not root:
+        return None
+
+    tag = sys.implementation.cache_tag
+    if tag is None:
+        return None
+    return os.path.join(os.path.expanduser(root), 'codegen',
+                        f'{tag}-{importlib.util.MAGIC_NUMBER.hex()}.marshal')
+
+
+#: Optional[str]: Path to the on-disk code cache.
+CACHE_FILE = _cache_file()
+
+#: dict[str, CodeType]: Cached code objects, keyed by SHA-256 digest of the source code.
+_CODE_CACHE = {}  # type: dict[str, CodeType]
+#: bool: Whether the on-disk code cache has been loaded.
+_CACHE_LOADED = False
+#: bool: Whether new code objects were compiled since the cache was loaded.
+_CACHE_DIRTY = False
+
+
+def _load_cache() -> 'None':
+    """Load code objects from the on-disk cache.
+
+    Notes:
+        Any error upon loading, e.g., missing or corrupted cache file,
+        will be silently ignored, and the code objects shall be
+        compiled (and later cached) again.
+
+    """
+    global _CACHE_LOADED  # pylint: disable=global-statement
+    _CACHE_LOADED = True
+
+    if CACHE_FILE is None:
+        return
+
+    try:
+        with open(CACHE_FILE, 'rb') as file:
+            cache = marshal.load(file)
+    except Exception:  # pylint: disable=broad-except
+        return
+
+    if isinstance(cache, dict):
+        _CODE_CACHE.update(cache)
+
+
+@atexit.register
+def _dump_cache() -> 'None':
+    """Write code objects to the on-disk cache.
+
+    Notes:
+        The cache file is written atomically, i.e., written to a temporary
+        file and then renamed, such that concurrent processes will never
+        load a partially written cache. Any :exc:`OSError` will be silently
+        ignored.
+
+    """
+    global _CACHE_DIRTY  # pylint: disable=global-statement
+    if CACHE_FILE is None or not _CACHE_DIRTY:
+        return
+    _CACHE_DIRTY = False
+
+    path = os.path.dirname(CACHE_FILE)
+    try:
+        os.makedirs(path, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path, prefix='.codegen-')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                marshal.dump(_CODE_CACHE, file)
+            os.replace(temp, CACHE_FILE)
+        except BaseException:
+            os.unlink(temp)
+            raise
+    except OSError:
+        pass
+
+
+def create_fn(source: 'str', globals: 'Optional[dict[str, Any]]' = None,  # pylint: disable=redefined-builtin
+              name: 'str' = '__create_fn__') -> 'Callable[..., Any]':
+    """Create function from source code.
+
+    Args:
+        source: Source code, which defines a factory function.
+        globals: Global namespace for the generated code.
+        name: Name of the factory function defined in ``source``.
+
+    Returns:
+        The return value of the factory function, i.e., the generated
+        function (or method).
+
+    Notes:
+        The code object is looked up from the cache by the SHA-256 digest
+        of ``source``, and only compiled upon cache miss.
+
+    """
+    global _CACHE_DIRTY  # pylint: disable=global-statement
+    if not _CACHE_LOADED:
+        _load_cache()
+
+    key = hashlib.sha256(source.encode()).hexdigest()
+    code = _CODE_CACHE.get(key)
+    if code is None:
+        code = compile(source, f'<{name}>', 'exec')
+        _CODE_CACHE[key] = code
+        _CACHE_DIRTY = True
+
+    ns = {}  # type: dict[str, Any]
+    exec(code, {} if globals is None else globals, ns)  # pylint: disable=exec-used # nosec
+    return ns[name]()
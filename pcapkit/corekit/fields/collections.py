@@ -5,7 +5,7 @@ import copy
 import io
 from typing import TYPE_CHECKING, Generic, TypeVar, cast
 
-from pcapkit.corekit.fields.field import FieldBase
+from pcapkit.corekit.fields.field import FieldBase, noop_callback
 from pcapkit.corekit.multidict import OrderedMultiDict
 from pcapkit.utilities.compat import List
 from pcapkit.utilities.exceptions import FieldValueError
@@ -53,9 +53,14 @@ class ListField(FieldBase[List[_TL]], Generic[_TL]):
         """Field is optional."""
         return True
 
+    @property
+    def static(self) -> 'bool':
+        """Field attributes are independent of the packet data."""
+        return self._length_callback is None and super().static
+
     def __init__(self, length: 'int | Callable[[dict[str, Any]], int]' = lambda _: -1,
                  item_type: 'Optional[FieldBase]' = None,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         #self._name = '<list>'
         self._callback = callback
         self._item_type = item_type
@@ -66,8 +71,8 @@ class ListField(FieldBase[List[_TL]], Generic[_TL]):
         self._length = length
         self._template = '0s'
 
-    def __call__(self, packet: 'dict[str, Any]') -> 'Self':
-        """Update field attributes.
+    def _resolve(self, packet: 'dict[str, Any]') -> 'Self':
+        """Create a new instance with field attributes updated.
 
         Args:
             packet: Packet data.
@@ -75,9 +80,6 @@ class ListField(FieldBase[List[_TL]], Generic[_TL]):
         Returns:
             Updated field instance.
 
-        This method will return a new instance of :class:`ListField`
-        instead of updating the current instance.
-
         """
         new_self = copy.copy(self)
         new_self._callback(self, packet)
@@ -205,12 +207,23 @@ class OptionField(ListField, Generic[_TS]):
         """Length option padding data."""
         return self._option_padding
 
+    @property
+    def static(self) -> 'bool':
+        """Field attributes are independent of the packet data.
+
+        Note:
+            :class:`OptionField` is never static, as the option padding
+            length is recorded per unpacking.
+
+        """
+        return False
+
     def __init__(self, length: 'int | Callable[[dict[str, Any]], int]' = lambda _: -1,
                  base_schema: 'Optional[Type[_TS]]' = None,
                  type_name: 'str' = 'type',
                  registry: 'Optional[defaultdict[int | StdlibEnum | AenumEnum, Type[_TS]]]' = None,
                  eool: 'Optional[int | StdlibEnum | AenumEnum]' = None,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         super().__init__(length, None, callback)
         #self._name = '<option>'
         self._eool = eool
@@ -251,6 +264,10 @@ class OptionField(ListField, Generic[_TS]):
         else:
             file = buffer
 
+        # NOTE: The option schemas update the ``packet`` dict upon
+        # unpacking, thus we make a copy of it in the first place.
+        packet = packet.copy()
+
         # make a copy of the ``packet`` dict so that we can include
         # parsed option schema in the ``packet`` dict
         new_packet = packet.copy()
@@ -34,6 +34,16 @@ class NoValueType:
 NoValue = NoValueType()
 
 
+def noop_callback(field: 'FieldBase', packet: 'dict[str, Any]') -> 'None':  # pylint: disable=unused-argument
+    """Default callback function for fields, which does nothing.
+
+    Args:
+        field: Field instance.
+        packet: Packet data.
+
+    """
+
+
 class FieldMeta(abc.ABCMeta, Generic[_T]):
     """Meta class to add dynamic support to :class:`FieldBase`.
 
@@ -64,6 +74,8 @@ class FieldBase(Generic[_T], metaclass=FieldMeta):
         _default: '_T | NoValueType'
         _template: 'str'
         _callback: 'Callable[[Self, dict[str, Any]], None]'
+        #: Shared resolved instance of static fields.
+        _resolved: 'Self'
 
     @property
     def name(self) -> 'str':
@@ -105,6 +117,11 @@ class FieldBase(Generic[_T], metaclass=FieldMeta):
         """Field is optional."""
         return False
 
+    @property
+    def static(self) -> 'bool':
+        """Field attributes are independent of the packet data."""
+        return self._callback is noop_callback
+
     def __call__(self, packet: 'dict[str, Any]') -> 'Self':
         """Update field attributes.
 
@@ -115,7 +132,31 @@ class FieldBase(Generic[_T], metaclass=FieldMeta):
             Updated field instance.
 
         This method will return a new instance of :class:`FieldBase` instead of
-        updating the current instance.
+        updating the current instance, c.f. :meth:`_resolve`.
+
+        Note:
+            For :attr:`static` fields, the resolved instance is created upon
+            the first call and shared thereafter, which shall be treated as
+            read-only.
+
+        """
+        if not self.static:
+            return self._resolve(packet)
+
+        try:
+            return self.__dict__['_resolved']
+        except KeyError:
+            resolved = self._resolved = self._resolve(packet)
+        return resolved
+
+    def _resolve(self, packet: 'dict[str, Any]') -> 'Self':
+        """Create a new instance with field attributes updated.
+
+        Arguments:
+            packet: Packet data.
+
+        Returns:
+            Updated field instance.
 
         """
         new_self = copy.copy(self)
@@ -129,7 +170,7 @@ class FieldBase(Generic[_T], metaclass=FieldMeta):
 
         self._default = NoValue
         self._template = '0s'
-        self._callback = lambda *_: None
+        self._callback = noop_callback
 
     def __repr__(self) -> 'str':
         if not self.name.isidentifier():
@@ -197,7 +238,7 @@ class FieldBase(Generic[_T], metaclass=FieldMeta):
         """
         return cast('_T', value)
 
-    def unpack(self, buffer: 'bytes | IO[bytes]', packet: 'dict[str, Any]') -> '_T':
+    def unpack(self, buffer: 'bytes | memoryview | IO[bytes]', packet: 'dict[str, Any]') -> '_T':
         """Unpack field value from :obj:`bytes`.
 
         Args:
@@ -209,7 +250,9 @@ class FieldBase(Generic[_T], metaclass=FieldMeta):
 
         """
         if not isinstance(buffer, bytes):
-            buffer = buffer.read(self.length)
+            if not isinstance(buffer, memoryview):
+                buffer = buffer.read(self.length)
+            buffer = bytes(buffer[:self.length])
         value = struct.unpack(self.template, buffer[:self.length].rjust(self.length, b'\x00'))[0]
         return self.post_process(value, packet)
 
@@ -236,7 +279,7 @@ class Field(FieldBase[_T], Generic[_T]):
 
     def __init__(self, length: 'int | Callable[[dict[str, Any]], int]',
                  default: '_T | NoValueType' = NoValue,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         #self._name = '<unknown>'
         if not hasattr(self, '_name'):
             self._name = f'<{type(self).__name__[:-5].lower()}>'
@@ -249,8 +292,13 @@ class Field(FieldBase[_T], Generic[_T]):
             self._length_callback, length = length, -1
         self._length = length
 
-    def __call__(self, packet: 'dict[str, Any]') -> 'Self':
-        """Update field attributes.
+    @property
+    def static(self) -> 'bool':
+        """Field attributes are independent of the packet data."""
+        return self._length_callback is None and super().static
+
+    def _resolve(self, packet: 'dict[str, Any]') -> 'Self':
+        """Create a new instance with field attributes updated.
 
         Args:
             packet: Packet data.
@@ -258,9 +306,6 @@ class Field(FieldBase[_T], Generic[_T]):
         Returns:
             New instance of :class:`Field`.
 
-        This method will return a new instance of :class:`Field` instead of
-        updating the current instance.
-
         """
         new_self = copy.copy(self)
         new_self._callback(new_self, packet)
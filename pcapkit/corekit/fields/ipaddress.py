@@ -5,7 +5,7 @@ import abc
 import ipaddress
 from typing import TYPE_CHECKING, Generic, TypeVar, cast
 
-from pcapkit.corekit.fields.field import Field, NoValue
+from pcapkit.corekit.fields.field import Field, NoValue, noop_callback
 from pcapkit.utilities.exceptions import FieldValueError
 
 __all__ = [
@@ -107,7 +107,7 @@ class IPv4AddressField(_IPAddressField[ipaddress.IPv4Address]):
         return 4
 
     def __init__(self, default: 'IPv4Address | NoValueType' = NoValue,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         super().__init__(4, default, callback)
 
         self._template = f'4s'
@@ -129,7 +129,7 @@ class IPv6AddressField(_IPAddressField[ipaddress.IPv6Address]):
         return 6
 
     def __init__(self, default: 'IPv6Address | NoValueType' = NoValue,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         super().__init__(16, default, callback)
 
         self._template = f'16s'
@@ -164,7 +164,7 @@ class IPv4InterfaceField(_IPInterfaceField[ipaddress.IPv4Interface]):
         return 4
 
     def __init__(self, default: 'IPv4Interface | NoValueType' = NoValue,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         super().__init__(8, default, callback)
 
         self._template = f'8s'
@@ -227,7 +227,7 @@ class IPv6InterfaceField(_IPInterfaceField[ipaddress.IPv6Interface]):
         return 6
 
     def __init__(self, default: 'IPv6Interface | NoValueType' = NoValue,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         super().__init__(17, default, callback)
 
         self._template = f'17s'
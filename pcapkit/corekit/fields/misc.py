@@ -5,7 +5,7 @@ import copy
 import io
 from typing import TYPE_CHECKING, TypeVar, cast
 
-from pcapkit.corekit.fields.field import FieldBase, NoValue
+from pcapkit.corekit.fields.field import FieldBase, NoValue, noop_callback
 from pcapkit.utilities.exceptions import FieldError, NoDefaultValue
 
 __all__ = [
@@ -132,8 +132,13 @@ class ConditionalField(FieldBase[_TC]):
         self._field = field  # type: FieldBase[_TC]
         self._condition = condition
 
-    def __call__(self, packet: 'dict[str, Any]') -> 'Self':
-        """Update field attributes.
+    @property
+    def static(self) -> 'bool':
+        """Field attributes are independent of the packet data."""
+        return False
+
+    def _resolve(self, packet: 'dict[str, Any]') -> 'Self':
+        """Create a new instance with field attributes updated.
 
         Arguments:
             packet: Packet data.
@@ -141,9 +146,6 @@ class ConditionalField(FieldBase[_TC]):
         Returns:
             Updated field instance.
 
-        This method will return a new instance of :class:`ConditionalField`
-        instead of updating the current instance.
-
         """
         new_self = copy.copy(self)
         if new_self._condition(packet):
@@ -271,7 +273,7 @@ class PayloadField(FieldBase[_TP]):
     def __init__(self, length: 'int | Callable[[dict[str, Any]], int]' = lambda _: -1,
                  default: '_TP | NoValueType | bytes' = NoValue,
                  protocol: 'Optional[Type[_TP]]' = None,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         #self._name = '<payload>'
         self._default = default  # type: ignore[assignment]
         self._protocol = protocol  # type: ignore[assignment]
@@ -283,8 +285,13 @@ class PayloadField(FieldBase[_TP]):
         self._length = length
         self._template = f'{self._length}s' if self._length >= 0 else '1024s'  # use a reasonable default
 
-    def __call__(self, packet: 'dict[str, Any]') -> 'Self':
-        """Update field attributes.
+    @property
+    def static(self) -> 'bool':
+        """Field attributes are independent of the packet data."""
+        return self._length_callback is None and super().static
+
+    def _resolve(self, packet: 'dict[str, Any]') -> 'Self':
+        """Create a new instance with field attributes updated.
 
         Args:
             packet: Packet data.
@@ -292,9 +299,6 @@ class PayloadField(FieldBase[_TP]):
         Returns:
             Updated field instance.
 
-        This method will return a new instance of :class:`PayloadField`
-        instead of updating the current instance.
-
         """
         new_self = copy.copy(self)
         new_self._callback(new_self, packet)
@@ -411,8 +415,13 @@ class SwitchField(FieldBase[_TC]):
         self._field = cast('FieldBase[_TC]', NoValueField())
         self._selector = selector
 
-    def __call__(self, packet: 'dict[str, Any]') -> 'SwitchField[_TC]':
-        """Call field.
+    @property
+    def static(self) -> 'bool':
+        """Field attributes are independent of the packet data."""
+        return False
+
+    def _resolve(self, packet: 'dict[str, Any]') -> 'SwitchField[_TC]':
+        """Create a new instance with the field selected.
 
         Args:
             packet: Packet data.
@@ -420,9 +429,6 @@ class SwitchField(FieldBase[_TC]):
         Returns:
             New field instance.
 
-        This method will return a new instance of :class:`SwitchField`
-        instead of updating the current instance.
-
         """
         new_self = copy.copy(self)
         new_self._field = new_self._selector(packet)(packet)
@@ -523,7 +529,7 @@ class SchemaField(FieldBase[_TS]):
                  schema: 'Optional[Type[_TS]]' = None,
                  default: '_TS | NoValueType | bytes' = NoValue,
                  packet: 'Optional[dict[str, Any]]' = None,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         #self._name = '<schema>'
         self._callback = callback
 
@@ -545,8 +551,13 @@ class SchemaField(FieldBase[_TS]):
         self._length = length
         self._template = f'{self._length}s' if self._length >= 0 else '1024s'  # use a reasonable default
 
-    def __call__(self, packet: 'dict[str, Any]') -> 'Self':
-        """Update field attributes.
+    @property
+    def static(self) -> 'bool':
+        """Field attributes are independent of the packet data."""
+        return self._length_callback is None and super().static
+
+    def _resolve(self, packet: 'dict[str, Any]') -> 'Self':
+        """Create a new instance with field attributes updated.
 
         Args:
             packet: Packet data.
@@ -554,9 +565,6 @@ class SchemaField(FieldBase[_TS]):
         Returns:
             New field instance.
 
-        This method will return a new instance of :class:`SchemaField`
-        instead of updating the current instance.
-
         """
         new_self = copy.copy(self)
         new_self._callback(new_self, packet)
@@ -615,9 +623,8 @@ class SchemaField(FieldBase[_TS]):
         else:
             file = buffer
 
-        packet.update(self._packet)
         return cast('_TS', self._schema.unpack(file, self.length, {  # type: ignore[call-arg,misc]
-            '__packet__': packet,
+            '__packet__': {**packet, **self._packet},
         }))
 
 
@@ -678,8 +685,13 @@ class ForwardMatchField(FieldBase[_TC]):
         #self._name = '<forward_match>'
         self._field = field
 
-    def __call__(self, packet: 'dict[str, Any]') -> 'Self':
-        """Update field attributes.
+    @property
+    def static(self) -> 'bool':
+        """Field attributes are independent of the packet data."""
+        return self._field.static
+
+    def _resolve(self, packet: 'dict[str, Any]') -> 'Self':
+        """Create a new instance with field attributes updated.
 
         Arguments:
             packet: Packet data.
@@ -687,9 +699,6 @@ class ForwardMatchField(FieldBase[_TC]):
         Returns:
             Updated field instance.
 
-        This method will return a new instance of :class:`ConditionalField`
-        instead of updating the current instance.
-
         """
         new_self = copy.copy(self)
         new_self._field = new_self._field(packet)
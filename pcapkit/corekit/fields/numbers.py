@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Generic, TypeVar, Union, cast
 
 import aenum
 
-from pcapkit.corekit.fields.field import Field, NoValue
+from pcapkit.corekit.fields.field import Field, NoValue, noop_callback
 from pcapkit.utilities.exceptions import IntError
 
 __all__ = [
@@ -59,7 +59,7 @@ class NumberField(Field[int], Generic[_T]):
                  default: 'int | NoValueType' = NoValue, signed: 'bool' = False,
                  byteorder: 'Literal["little", "big"]' = 'big',
                  bit_length: 'Optional[int]' = None,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         if length is None:
             if self.__length__ is None:
                 raise IntError(f'Field has no length.')
@@ -83,8 +83,8 @@ class NumberField(Field[int], Generic[_T]):
             struct_fmt = self.build_template(self._length, signed)
         self._template = f'{endian}{struct_fmt}'
 
-    def __call__(self, packet: 'dict[str, Any]') -> 'Self':
-        """Update field attributes.
+    def _resolve(self, packet: 'dict[str, Any]') -> 'Self':
+        """Create a new instance with field attributes updated.
 
         Args:
             packet: Packet data.
@@ -92,11 +92,8 @@ class NumberField(Field[int], Generic[_T]):
         Returns:
             New instance of :class:`NumberField`.
 
-        This method will return a new instance of :class:`NumberField` instead of
-        updating the current instance.
-
         """
-        new_self = super().__call__(packet)
+        new_self = super()._resolve(packet)
 
         if new_self._bit_length < 0:
             new_self._bit_length = new_self._length * 8
@@ -350,7 +347,7 @@ class EnumField(NumberField[Union[enum.IntEnum, aenum.IntEnum]]):
                  byteorder: 'Literal["little", "big"]' = 'big',
                  bit_length: 'Optional[int]' = None,
                  namespace: 'Optional[Type[StdlibEnum] | Type[AenumEnum]]' = None,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         super().__init__(length, default, signed, byteorder, bit_length, callback)
 
         self._namespace = namespace
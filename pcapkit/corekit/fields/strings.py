@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import chardet
 
-from pcapkit.corekit.fields.field import Field, NoValue
+from pcapkit.corekit.fields.field import Field, NoValue, noop_callback
 from pcapkit.utilities.compat import Dict
 
 __all__ = [
@@ -42,13 +42,13 @@ class _TextField(Field[_T], Generic[_T]):
 
     def __init__(self, length: 'int | Callable[[dict[str, Any]], int]',
                  default: '_T | NoValueType' = NoValue,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         super().__init__(length, default, callback)  # type: ignore[arg-type]
 
         self._template = f'{self._length}s' if self._length >= 0 else '1024s'  # reasonable default
 
-    def __call__(self, packet: 'dict[str, Any]') -> 'Self':
-        """Update field attributes.
+    def _resolve(self, packet: 'dict[str, Any]') -> 'Self':
+        """Create a new instance with field attributes updated.
 
         Args:
             packet: Packet data.
@@ -56,11 +56,8 @@ class _TextField(Field[_T], Generic[_T]):
         Returns:
             New instance of :class:`_TextField`.
 
-        This method will return a new instance of :class:`_TextField` instead of
-        updating the current instance.
-
         """
-        new_self = super().__call__(packet)
+        new_self = super()._resolve(packet)
         new_self._template = f'{new_self._length}s'
         return new_self
 
@@ -124,7 +121,7 @@ class StringField(_TextField[str]):
                  default: 'str | NoValueType' = NoValue, encoding: 'Optional[str]' = None,
                  errors: 'Literal["strict", "ignore", "replace"]' = 'strict',
                  unquote: 'bool' = False,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         super().__init__(length, default, callback)
 
         self._encoding = encoding
@@ -191,7 +188,7 @@ class BitField(_TextField[Dict[str, Any]]):
     def __init__(self, length: 'int',
                  default: 'dict[str, Any] | NoValueType' = NoValue,
                  namespace: 'Optional[dict[str, NamespaceEntry]]' = None,
-                 callback: 'Callable[[Self, dict[str, Any]], None]' = lambda *_: None) -> 'None':
+                 callback: 'Callable[[Self, dict[str, Any]], None]' = noop_callback) -> 'None':
         super().__init__(length, default, callback)
 
         self._namespace = namespace or {}
@@ -207,11 +204,11 @@ class BitField(_TextField[Dict[str, Any]]):
             Processed field value.
 
         """
-        buffer = bytearray(self.length * 8)
+        bits = self.length * 8
+        buffer = 0
         for name, (start, len) in self._namespace.items():
-            end = start + len
-            buffer[start:end] = f'{value[name]:0{end - start}b}'.encode()
-        return int(b''.join(map(lambda x: b'1' if x else b'0', buffer)), 2).to_bytes(self.length, 'big')
+            buffer |= (int(value[name]) & ((1 << len) - 1)) << (bits - start - len)
+        return buffer.to_bytes(self.length, 'big')
 
     def post_process(self, value: 'bytes', packet: 'dict[str, Any]') -> 'dict[str, Any]':  # pylint: disable=unused-argument
         """Process field value after parsing (unpacked).
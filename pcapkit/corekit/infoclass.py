@@ -14,8 +14,10 @@ import abc
 import collections.abc
 import enum
 import itertools
+import keyword
 from typing import TYPE_CHECKING, Generic, TypeVar, final
 
+from pcapkit.corekit.codegen import create_fn
 from pcapkit.utilities.compat import Mapping
 from pcapkit.utilities.exceptions import UnsupportedCall, stacklevel
 from pcapkit.utilities.warnings import InfoWarning, warn
@@ -69,10 +71,11 @@ def info_final(cls: 'ST', *, _finalised: 'bool' = True) -> 'ST':
              InfoWarning, stacklevel=stacklevel())
         return cls
 
-    temp = ['__map__', '__map_reverse__', '__builtin__', '__finalised__']
+    temp = ['__map__', '__map_reverse__', '__builtin__', '__finalised__',
+            '__layout__', '__extended__']
     temp.extend(cls.__additional__)
     for obj in cls.mro():
-        temp.extend(dir(obj))
+        temp.extend(el for el in dir(obj) if el not in cls.__layout__)
     cls.__builtin__ = set(temp)
     cls.__excluded__.extend(cls.__builtin__)
 
@@ -97,6 +100,11 @@ def info_final(cls: 'ST', *, _finalised: 'bool' = True) -> 'ST':
                 if key in args_:
                     continue
 
+                # NOTE: Fields named after preserved keywords (e.g., ``class``)
+                # can only be set thru :meth:`Info.from_dict`.
+                if keyword.iskeyword(key):
+                    continue
+
                 args_.append(key)
                 dict_.append(f'{key}={key}')
 
@@ -127,10 +135,7 @@ def info_final(cls: 'ST', *, _finalised: 'bool' = True) -> 'ST':
                 '    return __init__\n'
             )
 
-        ns = {}  # type: dict[str, Any]
-        exec(init_, None, ns)  # pylint: disable=exec-used # nosec
-
-        cls.__init__ = ns['__create_fn__']()  # type: ignore[misc]
+        cls.__init__ = create_fn(init_, globals())  # type: ignore[misc]
         cls.__init__.__qualname__ = f'{cls.__name__}.__init__'  # type: ignore[misc]
 
     if not _finalised:
@@ -176,6 +181,26 @@ class InfoMeta(abc.ABCMeta):
             print(B.__additional__)  # ['a', 'b', 'c', 'd']
             print(C.__additional__)  # ['a', 'b', 'c', 'd', 'e', 'f']
 
+    * :attr:`Info.__slots__` is generated from the type annotations of
+      the class, such that the annotated fields are stored in a compact
+      slotted layout rather than the per-instance :attr:`__dict__`. The
+      slot descriptors of the class and its base classes are collected
+      as :attr:`Info.__layout__`, in the same order as the arguments of
+      the generated ``__init__`` method.
+
+      .. note::
+
+         Fields already defined by the base classes (e.g., built-in
+         methods, or slots of the base classes), as well as fields with
+         default values, will not be slotted, and they will still be
+         stored in the :attr:`__dict__` of the instance, as with any
+         other non-annotated fields.
+
+    * :attr:`Info.__map__` and :attr:`Info.__map_reverse__` are the
+      mappings of name conflicts with builtin methods, which are shared
+      by all instances of the class, as the transformed names are only
+      determined by the class name.
+
     """
 
     def __new__(cls, name: 'str', bases: 'tuple[type, ...]', attrs: 'dict[str, Any]', **kwargs: 'Any') -> 'Type[Info]':
@@ -190,7 +215,32 @@ class InfoMeta(abc.ABCMeta):
                     name for name in base.__additional__ if name not in attrs['__additional__'])
             if hasattr(base, '__excluded__'):
                 attrs['__excluded__'].extend(name for name in base.__excluded__ if name not in attrs['__excluded__'])
-        return super().__new__(cls, name, bases, attrs, **kwargs)  # type: ignore[return-value]
+
+        if '__slots__' not in attrs:
+            attrs['__slots__'] = tuple(
+                key for key in attrs.get('__annotations__', {})
+                if not (key.startswith('__') and key.endswith('__'))
+                and key not in attrs and key not in attrs['__additional__']
+                and not any(hasattr(base, key) for base in bases)
+            )
+        attrs['__map__'] = {}
+        attrs['__map_reverse__'] = {}
+
+        new_cls = super().__new__(cls, name, bases, attrs, **kwargs)
+
+        # NOTE: We collect the slot descriptors in the same order as the
+        # arguments of the generated ``__init__`` method, c.f. ``info_final``.
+        order = []  # type: list[str]
+        slots = {}  # type: dict[str, Any]
+        for cls_ in new_cls.__mro__:
+            for key in reversed(cls_.__dict__.get('__annotations__', {})):
+                if key not in order:
+                    order.append(key)
+            if isinstance(cls_, InfoMeta):
+                for key in cls_.__dict__['__slots__']:
+                    slots.setdefault(key, cls_.__dict__[key])
+        new_cls.__layout__ = {key: slots[key] for key in reversed(order) if key in slots}
+        return new_cls  # type: ignore[return-value]
 
 
 class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
@@ -209,8 +259,15 @@ class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
         accessing such renamed keys, the original key name should always be
         used, i.e., such renaming is totally transparent to the user.
 
+    Note:
+        Annotated fields are stored in the generated :attr:`__slots__` of the
+        class, whilst other fields are stored in the :attr:`__dict__` of the
+        instance, which is only created upon the first non-slotted field.
+
     """
 
+    __slots__ = ('__dict__', '__weakref__')
+
     if TYPE_CHECKING:
         #: Mapping of name conflicts with builtin methods (original names to
         #: transformed names).
@@ -220,9 +277,13 @@ class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
         __map_reverse__: 'dict[str, str]'
         #: List of builtin methods.
         __builtin__: 'set[str]'
+        #: Slot descriptors of annotated fields.
+        __layout__: 'dict[str, Any]'
 
     #: Flag for finalised class initialisation.
     __finalised__: 'FinalisedState' = FinalisedState.NONE
+    #: Flag for any instance of the class having non-slotted fields.
+    __extended__: 'bool' = False
 
     #: List of additional built-in names.
     __additional__: 'list[str]' = []
@@ -243,15 +304,7 @@ class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
         """
         if cls.__finalised__ == FinalisedState.NONE:
             cls = info_final(cls, _finalised=False)
-        self = super().__new__(cls)
-
-        # NOTE: We define the ``__map__`` and ``__map_reverse__`` attributes
-        # here under ``self`` to avoid them being considered as class variables
-        # and thus being shared by all instances.
-        super().__setattr__(self, '__map__', {})
-        super().__setattr__(self, '__map_reverse__', {})
-
-        return self
+        return super().__new__(cls)
 
     def __post_init__(self) -> 'None':
         """Customisation method to be called after initialisation."""
@@ -264,6 +317,7 @@ class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
         # within: attr: `__map__` attribute.
 
         __name__ = type(self).__name__  # pylint: disable=redefined-builtin
+        layout = self.__layout__
 
         if dict_ is None:
             data_iter = kwargs.items()  # type: Iterable[tuple[str, Any]]
@@ -273,6 +327,11 @@ class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
             data_iter = itertools.chain(dict_, kwargs.items())
 
         for (key, value) in data_iter:
+            # NOTE: Slotted fields are never builtin names, c.f. ``info_final``.
+            if key in layout:
+                layout[key].__set__(self, value)
+                continue
+
             if key in self.__builtin__:
                 new_key = f'_{__name__}{key}'
 
@@ -291,13 +350,42 @@ class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
 
             # if isinstance(key, str):
             #     key = re.sub(r'\W', '_', key)
+            if not self.__extended__:
+                type(self).__extended__ = True
             self.__dict__[key] = value
 
     __init__ = __update__
 
+    def __entries__(self) -> 'Iterator[tuple[str, VT]]':
+        """Iterate over the stored fields.
+
+        Yields:
+            Stored (possibly transformed) field names and values, including
+            the excluded ones, with slotted fields first.
+
+        Note:
+            The :attr:`__dict__` of the instance is only accessed if any
+            instance of the class has non-slotted fields, so that it will
+            not be created needlessly.
+
+        """
+        for (key, slot) in self.__layout__.items():
+            try:
+                yield key, slot.__get__(self, None)
+            except AttributeError:
+                continue
+        if self.__extended__:
+            yield from self.__dict__.items()
+
+    def __getstate__(self) -> 'dict[str, VT]':
+        return {self.__map_reverse__.get(key, key): value for (key, value) in self.__entries__()}
+
+    def __setstate__(self, state: 'dict[str, VT]') -> 'None':
+        self.__update__(state)
+
     def __str__(self) -> 'str':
         temp = []  # type: list[str]
-        for (key, value) in self.__dict__.items():
+        for (key, value) in self.__entries__():
             if key in self.__excluded__:
                 continue
 
@@ -308,7 +396,7 @@ class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
 
     def __repr__(self) -> 'str':
         temp = []  # type: list[str]
-        for (key, value) in self.__dict__.items():
+        for (key, value) in self.__entries__():
             if key in self.__excluded__:
                 continue
 
@@ -321,16 +409,25 @@ class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
         return f'<{type(self).__name__} {args}>'
 
     def __len__(self) -> 'int':
-        return len(self.__dict__)
+        return sum(1 for _ in self.__entries__())
 
     def __iter__(self) -> 'Iterator[str]':
-        for key in self.__dict__:
+        for (key, _) in self.__entries__():
             if key in self.__excluded__:
                continue
             yield self.__map_reverse__.get(key, key)
 
     def __getitem__(self, name: 'str') -> 'VT':
         key = self.__map__.get(name, name)
+
+        slot = self.__layout__.get(key)
+        if slot is not None:
+            try:
+                return slot.__get__(self, None)
+            except AttributeError:
+                raise KeyError(name) from None
+        if not self.__extended__:
+            raise KeyError(name)
         return self.__dict__[key]
 
     def __setattr__(self, name: 'str', value: 'VT') -> 'NoReturn':
@@ -372,7 +469,7 @@ class Info(Mapping[str, VT], Generic[VT], metaclass=InfoMeta):
 
         """
         dict_ = {}  # type: dict[str, Any]
-        for (key, value) in self.__dict__.items():
+        for (key, value) in self.__entries__():
             if key in self.__excluded__:
                 continue
 
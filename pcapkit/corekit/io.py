@@ -6,24 +6,32 @@
 
 :mod:`pcapkit.corekit.io` contains seekable I/O object
 :class:`~pcapkit.corekit.io.SeekableReader`, which is a customised
-implementation to :class:`io.BufferedReader`.
+implementation to :class:`io.BufferedReader`,
+:class:`~pcapkit.corekit.io.ParallelGzipReader`, which decompresses
+multi-member gzip streams with a pool of worker threads, and
+:class:`~pcapkit.corekit.io.MemoryReader`, which reads from a memory
+buffer without copying.
 
 """
+import collections
+import concurrent.futures
 import io
 import tempfile
+import zlib
 from typing import TYPE_CHECKING, cast
 
-from pcapkit.utilities.exceptions import (SeekError, TruncateError, UnsupportedCall,
+from pcapkit.utilities.exceptions import (FormatError, SeekError, TruncateError, UnsupportedCall,
                                           UnsupportedOperation, stacklevel)
 from pcapkit.utilities.warnings import SeekWarning, warn
 
 if TYPE_CHECKING:
     from io import BytesIO, RawIOBase
-    from typing import IO, Iterable, Optional
+    from concurrent.futures import Future
+    from typing import IO, Deque, Iterable, Optional
 
     from typing_extensions import Buffer
 
-__all__ = ['SeekableReader']
+__all__ = ['SeekableReader', 'ParallelGzipReader', 'MemoryReader']
 
 
 class SeekableReader(io.BufferedReader):
@@ -501,3 +509,299 @@ class SeekableReader(io.BufferedReader):
                         self._write_buffer(buf_tmp)
                         buf += buf_tmp
         return buf
+
+
+class ParallelGzipReader(io.BufferedIOBase):
+    """Multi-member gzip reader.
+
+    A gzip stream may consist of multiple concatenated *members*, e.g., as
+    produced by ``bgzip`` or ``pigz --independent``. Should a member record its
+    compressed size in the ``BC`` subfield of the gzip extra field (i.e., the
+    BGZF convention), it can be decompressed independently of its preceding
+    members; such members are hence dispatched to a pool of worker threads,
+    whilst the decompressed data are still returned in order. Members without
+    such information are decompressed sequentially in the calling thread.
+
+    The reader is *not* seekable. It is meant to be wrapped with
+    :class:`~pcapkit.corekit.io.SeekableReader` when random access within
+    a limited window is needed.
+
+    Args:
+        raw: Underlying gzip compressed stream.
+        workers: Number of worker threads.
+        stream_closing: Whether the stream should be closed upon exiting.
+
+    """
+
+    if TYPE_CHECKING:
+        #: Whether the stream should be closed upon exiting.
+        _closing: 'bool'
+        #: Underlying compressed stream.
+        _stream: 'IO[bytes]'
+
+        #: Worker thread pool.
+        _executor: 'concurrent.futures.ThreadPoolExecutor'
+        #: Maximum number of pending members.
+        _window: 'int'
+        #: Pending decompressed members, in stream order.
+        _pending: 'Deque[Future[bytes]]'
+        #: Decompressor for the current sequentially decompressed member.
+        _inflater: 'Optional[zlib._Decompress]'
+
+        #: Compressed data read ahead from the underlying stream.
+        _rawbuf: 'bytes'
+        #: Decompressed data not yet returned.
+        _buffer: 'bytearray'
+        #: Current position of the decompressed stream.
+        _tell: 'int'
+        #: Whether the end of the compressed stream is reached.
+        _eof: 'bool'
+
+    #: Size of chunks read from the underlying stream for sequential decompression.
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, raw: 'IO[bytes]', workers: 'int' = 1, *,
+                 stream_closing: 'bool' = True) -> 'None':
+        super().__init__()
+
+        self._closing = stream_closing
+        self._stream = raw
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max(workers, 1))
+        self._window = 2 * max(workers, 1)
+        self._pending = collections.deque()
+        self._inflater = None
+
+        self._rawbuf = b''
+        self._buffer = bytearray()
+        self._tell = 0
+        self._eof = False
+
+    @staticmethod
+    def _inflate(data: 'bytes') -> 'bytes':
+        """Decompress a single gzip member.
+
+        Truncated members are decompressed as much as possible,
+        as what :class:`gzip.GzipFile` does for truncated files.
+
+        """
+        return zlib.decompressobj(zlib.MAX_WBITS | 16).decompress(data)
+
+    @staticmethod
+    def _resolve(data: 'bytes') -> 'Future[bytes]':
+        """Wrap sequentially decompressed data as a finished future."""
+        future = concurrent.futures.Future()  # type: Future[bytes]
+        future.set_result(data)
+        return future
+
+    def _read_raw(self, size: 'int') -> 'bytes':
+        """Read ``size`` bytes of compressed data."""
+        buf, self._rawbuf = self._rawbuf[:size], self._rawbuf[size:]
+        if len(buf) < size:
+            buf += self._stream.read(size - len(buf))
+        return buf
+
+    def _read_member(self) -> 'None':
+        """Read the next gzip member and schedule its decompression.
+
+        Raises:
+            FormatError: If the stream contains non-gzip data.
+
+        """
+        head = self._read_raw(10)
+        if len(head) < 10 or not head.strip(b'\x00'):
+            # NOTE: trailing (zero) padding and truncated headers are
+            # treated as the end of the compressed stream
+            self._eof = True
+            return
+        if head[:3] != b'\x1f\x8b\x08':
+            raise FormatError(f'not a gzip member: {head[:3]!r}')
+
+        bsize = None
+        if head[3] & 0x04:  # FEXTRA
+            xlen = self._read_raw(2)
+            extra = self._read_raw(int.from_bytes(xlen, 'little'))
+            head += xlen + extra
+
+            ptr = 0
+            while ptr + 4 <= len(extra):
+                slen = int.from_bytes(extra[ptr+2:ptr+4], 'little')
+                if extra[ptr:ptr+2] == b'BC' and slen == 2:
+                    bsize = int.from_bytes(extra[ptr+4:ptr+6], 'little') + 1
+                    break
+                ptr += 4 + slen
+
+        if bsize is None:
+            self._inflater = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            self._pending.append(self._resolve(self._inflater.decompress(head)))
+        else:
+            member = head + self._read_raw(bsize - len(head))
+            self._pending.append(self._executor.submit(self._inflate, member))
+
+    def _schedule(self) -> 'None':
+        """Schedule decompression of upcoming members."""
+        while len(self._pending) < self._window:
+            if self._inflater is not None:
+                chunk = self._read_raw(self.CHUNK_SIZE)
+                self._pending.append(self._resolve(self._inflater.decompress(chunk)))
+                if self._inflater.eof or not chunk:
+                    self._rawbuf = self._inflater.unused_data + self._rawbuf
+                    self._inflater = None
+            elif self._eof:
+                break
+            else:
+                self._read_member()
+
+    def _fill(self, size: 'int') -> 'None':
+        """Fill the decompressed buffer with at least ``size`` bytes,
+        or until the end of stream if ``size`` is negative."""
+        while size < 0 or len(self._buffer) < size:
+            self._schedule()
+            if not self._pending:
+                break
+            self._buffer.extend(self._pending.popleft().result())
+
+    def close(self) -> 'None':
+        """Flush and close this stream. This method has no effect if the file is already closed."""
+        if self.closed:
+            return
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+        if self._closing:
+            self._stream.close()
+        super().close()
+
+    def readable(self) -> 'bool':
+        """Return :data:`True` if the stream can be read from."""
+        return True
+
+    def seekable(self) -> 'bool':
+        """Return :data:`False` as the stream does not support random access."""
+        return False
+
+    def tell(self) -> 'int':
+        """Return the current stream position."""
+        return self._tell
+
+    def read(self, size: 'int | None' = -1, /) -> 'bytes':
+        """Read and return ``size`` bytes, or if ``size`` is not given or negative, until EOF."""
+        if size is None or size < 0:
+            size = -1
+        self._fill(size)
+
+        if size < 0:
+            size = len(self._buffer)
+        buf = bytes(self._buffer[:size])
+        del self._buffer[:size]
+
+        self._tell += len(buf)
+        return buf
+
+    def read1(self, size: 'int | None' = -1, /) -> 'bytes':
+        """Read and return up to ``size`` bytes. If ``size`` is not given or negative,
+        return the buffered data, decompressing at most one more member if no data
+        is buffered.
+
+        Note:
+            As members can be rather small (e.g., BGZF blocks are no larger than
+            64 KiB), non-negative ``size`` is always fulfilled as :meth:`read` does.
+
+        """
+        if size is None or size < 0:
+            if not self._buffer:
+                self._fill(1)
+            size = len(self._buffer)
+        return self.read(size)
+
+    def peek(self, size: 'int' = 0) -> 'bytes':
+        """Return bytes from the stream without advancing the position."""
+        self._fill(max(size, 1))
+        return bytes(self._buffer)
+
+
+class MemoryReader(io.BufferedIOBase):
+    """Zero-copy binary reader over a memory buffer.
+
+    Unlike :class:`io.BytesIO`, which copies any buffer other than
+    :obj:`bytes` upon construction, the reader keeps a :class:`memoryview`
+    over the given buffer and :meth:`read` returns slices of it, i.e., no
+    data is copied until the caller explicitly does so.
+
+    Args:
+        buffer: Underlying memory buffer, e.g., a :class:`memoryview` over
+            a memory-mapped file.
+
+    """
+
+    if TYPE_CHECKING:
+        #: Memory view over the underlying buffer.
+        _view: 'memoryview'
+        #: Current position of the stream.
+        _tell: 'int'
+
+    def __init__(self, buffer: 'Buffer') -> 'None':
+        super().__init__()
+
+        self._view = memoryview(buffer)
+        self._tell = 0
+
+    def getbuffer(self) -> 'memoryview':
+        """Return the memory view over the underlying buffer."""
+        return self._view
+
+    def readable(self) -> 'bool':
+        """Return :data:`True` if the stream can be read from."""
+        return True
+
+    def seekable(self) -> 'bool':
+        """Return :data:`True` if the stream supports random access."""
+        return True
+
+    def seek(self, offset: 'int', whence: 'int' = io.SEEK_SET, /) -> 'int':
+        """Change the stream position to the given byte offset, interpreted
+        relative to the position indicated by ``whence``.
+
+        Raises:
+            SeekError: If ``whence`` is invalid or the resulting position is negative.
+
+        """
+        if whence == io.SEEK_SET:
+            tell = offset
+        elif whence == io.SEEK_CUR:
+            tell = self._tell + offset
+        elif whence == io.SEEK_END:
+            tell = len(self._view) + offset
+        else:
+            raise SeekError(f'invalid whence ({whence}, should be {io.SEEK_SET}, {io.SEEK_CUR} or {io.SEEK_END})')
+
+        if tell < 0:
+            raise SeekError(f'negative seek value {tell}')
+        self._tell = tell
+        return tell
+
+    def tell(self) -> 'int':
+        """Return the current stream position."""
+        return self._tell
+
+    def read(self, size: 'int | None' = -1, /) -> 'memoryview':  # type: ignore[override]
+        """Read and return up to ``size`` bytes as a :class:`memoryview` slice,
+        or if ``size`` is not given or negative, until EOF."""
+        start = self._tell
+        if size is None or size < 0:
+            data = self._view[start:]
+        else:
+            data = self._view[start:start+size]
+        self._tell = start + len(data)
+        return data
+
+    def read1(self, size: 'int | None' = -1, /) -> 'memoryview':  # type: ignore[override]
+        """Read and return up to ``size`` bytes as a :class:`memoryview` slice."""
+        return self.read(size)
+
+    def readinto(self, b: 'Buffer', /) -> 'int':
+        """Read bytes into a pre-allocated, writable bytes-like object ``b``
+        and return the number of bytes read."""
+        view = memoryview(b).cast('B')
+        data = self.read(len(view))
+        view[:len(data)] = data
+        return len(data)
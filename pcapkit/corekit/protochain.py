@@ -10,13 +10,15 @@ collection class :class:`~pcapkit.corekit.protochain.ProtoChain`.
 """
 import collections.abc
 import copy
+import functools
+import itertools
 from typing import TYPE_CHECKING, overload
 
 from pcapkit.utilities.compat import cached_property
 from pcapkit.utilities.exceptions import IndexNotFound
 
 if TYPE_CHECKING:
-    from typing import Iterator, Optional, Type
+    from typing import Any, Callable, Iterable, Iterator, Optional, Type
 
     from typing_extensions import Self
 
@@ -38,6 +40,11 @@ class ProtoChain(collections.abc.Sequence):
     #: Internal data storage for protocol chain.
     __data__: 'tuple[tuple[str, Type[Protocol]], ...]'
 
+    if TYPE_CHECKING:
+        #: Loader of the protocol chain data, if the chain is to be resolved
+        #: upon access, c.f. :meth:`from_loader`.
+        _loader: 'Callable[[], Iterable[tuple[str, Type[Protocol]]]]'
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -86,6 +93,22 @@ class ProtoChain(collections.abc.Sequence):
         obj.__data__ = tuple(temp_data)
         return obj
 
+    @classmethod
+    def from_loader(cls, loader: 'Callable[[], Iterable[tuple[str, Type[Protocol]]]]') -> 'Self':
+        """Create a protocol chain to be resolved upon access.
+
+        This is used for protocols decoded lazily, where the protocol chain
+        is not available until the remaining layers have been decoded.
+
+        Args:
+            loader: Callable returning the protocol chain, e.g., a
+                :class:`ProtoChain` instance.
+
+        """
+        obj = cls.__new__(cls)
+        obj._loader = loader
+        return obj
+
     def index(self, value: 'str | Protocol | Type[Protocol]',
               start: 'Optional[int]' = None, stop: 'Optional[int]' = None) -> 'int':
         """First index of ``value``.
@@ -167,9 +190,29 @@ class ProtoChain(collections.abc.Sequence):
 
         temp_data = [(alias, proto)]
         if basis is not None:
+            if '__data__' not in basis.__dict__:
+                # NOTE: The basis chain is yet to be resolved (c.f. :meth:`from_loader`),
+                # thus we defer the concatenation until the chain is accessed.
+                self._loader = functools.partial(itertools.chain, temp_data, basis)
+                return
             temp_data.extend(basis)
         self.__data__ = tuple(temp_data)
 
+    def __getattr__(self, name: 'str') -> 'Any':
+        """Resolve the protocol chain data upon access.
+
+        Args:
+            name: Attribute name.
+
+        Raises:
+            AttributeError: If the attribute does not exist.
+
+        """
+        if name == '__data__' and (loader := self.__dict__.pop('_loader', None)) is not None:
+            self.__data__ = tuple(loader())
+            return self.__data__
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
     def __repr__(self) -> 'str':
         """Returns representation of protocol chain data.
 
@@ -260,6 +303,9 @@ class ProtoChain(collections.abc.Sequence):
             Merged protocol chain.
 
         """
+        if '__data__' not in other.__dict__:
+            return self.from_loader(functools.partial(itertools.chain, self, other))
+
         new = copy.copy(self)
         new.__data__ += other.__data__
         return new
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Termination Threshold
+===========================
+
+.. module:: pcapkit.corekit.threshold
+
+:mod:`pcapkit.corekit.threshold` contains the compiled termination
+plan class :class:`~pcapkit.corekit.threshold.Threshold`, which
+decides upon which protocol the decoding chain shall stop.
+
+"""
+from typing import TYPE_CHECKING
+
+__all__ = ['Threshold']
+
+if TYPE_CHECKING:
+    from typing import Optional, Type
+
+    from pcapkit.protocols.protocol import ProtocolBase as Protocol
+
+
+class Threshold:
+    """Compiled termination plan for the ``layer`` and ``protocol``
+    thresholds.
+
+    The thresholds are resolved once upon construction into a frozen set
+    of terminating protocol classes, such that checking whether a protocol
+    reaches the thresholds is but a set membership test, c.f.
+    :meth:`Protocol._check_term_threshold <pcapkit.protocols.protocol.Protocol._check_term_threshold>`.
+
+    Args:
+        layer: Parse packet until such layer.
+        protocol: Parse packet until such protocol.
+
+    """
+
+    __slots__ = ('layer', 'protocol', 'terminal', '_known', '_names', '_extra')
+
+    #: Parse packet until such layer.
+    layer: 'Optional[str]'
+    #: Parse packet until such protocol.
+    protocol: 'Optional[str | Protocol | Type[Protocol]]'
+    #: Terminating protocol classes.
+    terminal: 'frozenset[Type[Protocol]]'
+
+    if TYPE_CHECKING:
+        #: Protocol classes resolved upon compilation.
+        _known: 'frozenset[Type[Protocol]]'
+        #: Protocol names (in upper case) of the ``protocol`` threshold.
+        _names: 'frozenset[str]'
+        #: Check results of protocol classes imported after compilation.
+        _extra: 'dict[Type[Protocol], bool]'
+
+    def __init__(self, layer: 'Optional[str]' = None,
+                 protocol: 'Optional[str | Protocol | Type[Protocol]]' = None) -> 'None':
+        from pcapkit.protocols.protocol import \
+            ProtocolBase  # pylint: disable=import-outside-toplevel # isort: skip
+
+        self.layer = layer
+        self.protocol = protocol
+
+        if protocol is None:
+            self._names = frozenset()
+        else:
+            self._names = frozenset(name for name in ProtocolBase.expand_comp(protocol)
+                                    if isinstance(name, str))
+
+        known = set()  # type: set[Type[Protocol]]
+        stack = [ProtocolBase]  # type: list[Type[Protocol]]
+        while stack:
+            for klass in stack.pop().__subclasses__():
+                if klass not in known:
+                    known.add(klass)
+                    stack.append(klass)
+
+        self._known = frozenset(known)
+        self.terminal = frozenset(klass for klass in known if self._match(klass))
+        self._extra = {}
+
+    def __contains__(self, protocol: 'Type[Protocol]') -> 'bool':
+        """Check if ``protocol`` reaches the thresholds.
+
+        Args:
+            protocol: Protocol class.
+
+        Note:
+            Protocol classes imported after the plan was compiled are
+            checked against the thresholds upon first encounter, and the
+            results are cached thereafter.
+
+        """
+        if protocol in self.terminal:
+            return True
+        if protocol in self._known:
+            return False
+        if (match := self._extra.get(protocol)) is None:
+            match = self._extra[protocol] = self._match(protocol)
+        return match
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}(layer={self.layer!r}, protocol={self.protocol!r})'
+
+    def __reduce__(self) -> 'tuple[Type[Threshold], tuple[Optional[str], Optional[str | Protocol | Type[Protocol]]]]':
+        return type(self), (self.layer, self.protocol)
+
+    def _match(self, protocol: 'Type[Protocol]') -> 'bool':
+        """Check if ``protocol`` matches the thresholds.
+
+        Args:
+            protocol: Protocol class.
+
+        """
+        if self.layer is not None and (layer := protocol.__layer__) is not None:
+            if layer.upper() == self.layer.upper():
+                return True
+        if self._names:
+            for name in protocol.id():
+                if name.upper() in self._names:
+                    return True
+        return False
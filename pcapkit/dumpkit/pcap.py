@@ -9,7 +9,11 @@ specifically for PCAP format, which is alike those described in
 :mod:`dictdumper`.
 
 """
+import datetime
+import decimal
+import struct
 import sys
+import time
 from typing import TYPE_CHECKING
 
 from pcapkit.dumpkit.common import DumperBase as Dumper
@@ -19,7 +23,7 @@ from pcapkit.protocols.misc.pcap.header import Header
 
 if TYPE_CHECKING:
     from enum import IntEnum as StdlibIntEnum
-    from typing import IO, Any, Optional
+    from typing import IO, Any, Iterable, Optional
 
     from aenum import IntEnum as AenumIntEnum
     from typing_extensions import Literal
@@ -97,6 +101,56 @@ class PCAPIO(Dumper):
             self._append_value(value, file, name or '')
         return self
 
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def dump_packets(self, packets: 'Iterable[bytes]', *,
+                     timestamp: 'Optional[float | decimal.Decimal | int | datetime.datetime]' = None,
+                     interval: 'float | decimal.Decimal | int' = 0) -> 'PCAPIO':
+        """Dump raw packets in bulk.
+
+        Args:
+            packets: Raw packet data of each frame.
+            timestamp: UNIX-Epoch timestamp of the first frame, default to
+                current time.
+            interval: Time interval between frames (in seconds).
+
+        Returns:
+            The dumper class itself (to support chain calling).
+
+        Notes:
+            Unlike :meth:`__call__`, the frame headers are packed directly
+            rather than thru :class:`~pcapkit.protocols.misc.pcap.frame.Frame`,
+            and all frames are written with the output file opened only once.
+            Packets longer than the snapshot length are truncated.
+
+        """
+        resolution = 1_000_000_000 if self._nsec else 1_000_000
+        if timestamp is None:
+            current = time.time_ns() // (1_000_000_000 // resolution)
+        else:
+            if isinstance(timestamp, datetime.datetime):
+                timestamp = timestamp.timestamp()
+            current = int(decimal.Decimal(timestamp) * resolution)
+        step = int(decimal.Decimal(interval) * resolution)
+
+        snaplen = self._ghdr.snaplen
+        header = struct.Struct('>IIII' if self._ghdr.magic_number.byteorder == 'big' else '<IIII')
+
+        with open(self._file, 'ab') as file:
+            write = file.write
+            for packet in packets:
+                ts_sec, ts_frac = divmod(current, resolution)
+                incl_len = min(len(packet), snaplen)
+
+                write(header.pack(ts_sec, ts_frac, incl_len, len(packet)))
+                write(packet[:incl_len])
+
+                current += step
+                self._fnum += 1
+        return self
+
     ##########################################################################
     # Utilities.
     ##########################################################################
@@ -7,18 +7,22 @@
 
 :mod:`pcapkit.foundation` is a collection of foundations for
 :mod:`pcapkit`, including PCAP file extraction tool
-:class:`~pcapkit.foundation.extraction.Extrator`, flow tracing
+:class:`~pcapkit.foundation.extraction.Extrator` and its :mod:`asyncio`
+counterpart :class:`~pcapkit.foundation.aio.AsyncExtractor`, flow tracing
 :mod:`~pcapkit.foundation.tractflow`, registry management
-APIs for :mod:`pcapkit`, and TCP/IP reassembly implementations.
+APIs for :mod:`pcapkit`, frame offset index
+:class:`~pcapkit.foundation.index.FrameIndex`, and TCP/IP reassembly implementations.
 
 """
+from pcapkit.foundation.aio import AsyncExtractor
 from pcapkit.foundation.extraction import Extractor
+from pcapkit.foundation.index import FrameIndex
 from pcapkit.foundation.reassembly import *
 from pcapkit.foundation.registry import *
 from pcapkit.foundation.traceflow import *
 
 __all__ = [
-    'Extractor',
+    'Extractor', 'AsyncExtractor', 'FrameIndex',
 
     'IPv4_Reassembly', 'IPv6_Reassembly', 'TCP_Reassembly',
 
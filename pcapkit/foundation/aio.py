@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""Asynchronous Extractor
+============================
+
+.. module:: pcapkit.foundation.aio
+
+:mod:`pcapkit.foundation.aio` contains
+:class:`~pcapkit.foundation.aio.AsyncExtractor` only,
+which drives the built-in PCAP and PCAP-NG extraction
+engines from an :mod:`asyncio` event loop.
+
+The records (i.e., PCAP frames or PCAP-NG blocks) are read from the
+input without blocking the event loop, then handed over to the
+underlying :class:`~pcapkit.foundation.extraction.Extractor` whose
+engine decodes them in an executor.
+
+"""
+import asyncio
+import functools
+import io
+import os
+import stat
+import struct
+from typing import TYPE_CHECKING, cast
+
+from pcapkit.const.pcapng.block_type import BlockType as Enum_BlockType
+from pcapkit.foundation.extraction import Extractor
+from pcapkit.foundation.index import PCAP_MAGIC, PCAPNG_MAGIC
+from pcapkit.utilities.exceptions import FormatError, UnsupportedCall, stacklevel
+from pcapkit.utilities.warnings import EngineWarning, warn
+
+if TYPE_CHECKING:
+    from asyncio import StreamReader
+    from concurrent.futures import Executor
+    from types import TracebackType
+    from typing import IO, Any, Optional, Type
+
+    from typing_extensions import Self
+
+    from pcapkit.foundation.extraction import Packet
+
+__all__ = ['AsyncExtractor']
+
+#: Block types of PCAP-NG packet blocks.
+PCAPNG_PACKET = (
+    Enum_BlockType.Enhanced_Packet_Block,
+    Enum_BlockType.Simple_Packet_Block,
+    Enum_BlockType.Packet_Block,
+)
+
+
+class RecordIO(io.BytesIO):
+    """In-memory input stream of :class:`AsyncExtractor`.
+
+    The stream holds the records read from the actual input, and is used
+    as the input file object of the underlying
+    :class:`~pcapkit.foundation.extraction.Extractor`.
+
+    Args:
+        name: Name of the actual input.
+
+    """
+
+    def __init__(self, name: 'str') -> 'None':
+        super().__init__()
+
+        #: Name of the actual input.
+        self.name = name
+
+    def peek(self, size: 'int' = 0) -> 'bytes':
+        """Return bytes from the stream without advancing the position."""
+        offset = self.tell()
+        buf = self.read(max(size, 1))
+        self.seek(offset, io.SEEK_SET)
+        return buf
+
+    def feed(self, data: 'bytes') -> 'None':
+        """Replace the stream contents with ``data`` and rewind the stream."""
+        self.seek(0, io.SEEK_SET)
+        self.truncate()
+        self.write(data)
+        self.seek(0, io.SEEK_SET)
+
+
+class AsyncExtractor:
+    """Asynchronous extractor for PCAP files.
+
+    The extractor supports ``async for`` iteration over the frames of
+    a PCAP or PCAP-NG input, which can be an :class:`asyncio.StreamReader`,
+    a file name, or a binary IO object of a file, a pipe or a socket, e.g.:
+
+    .. code-block:: python
+
+       async with AsyncExtractor(reader, nofile=True) as extractor:
+           async for frame in extractor:
+               ...
+
+    Pipes, sockets and character devices are read through :meth:`loop.connect_read_pipe
+    <asyncio.loop.connect_read_pipe>`; regular files are read in the executor.
+
+    Each record is read in full before it is passed to the built-in extraction
+    engine of the underlying :class:`~pcapkit.foundation.extraction.Extractor`,
+    which decodes it (as well as dumps, reassembles and traces it, if requested)
+    in ``executor``. Since the records are decoded one at a time and in order,
+    the extractor's state is never accessed concurrently.
+
+    Args:
+        fin: Input file name, binary IO object or :class:`asyncio.StreamReader`.
+        executor: Executor for decoding frames; :obj:`None` for the default executor
+            of the event loop. It must be a thread pool as the extraction state
+            lives in the current process.
+        extension: If append ``.pcap`` file extension to the input file name if
+            ``fin`` does not have such file extension.
+        **kwargs: Arbitrary keyword arguments for
+            :class:`~pcapkit.foundation.extraction.Extractor`, except ``fin``,
+            ``auto`` and ``engine``.
+
+    Warns:
+        pcapkit.utilities.warnings.EngineWarning: If ``engine`` is given, as only the
+            built-in engines are supported.
+
+    """
+
+    if TYPE_CHECKING:
+        #: Input file name.
+        _ifnm: 'str'
+        #: Input file object.
+        _ifile: 'Optional[IO[bytes]]'
+        #: Input file flag, i.e., if the input file is opened by the extractor.
+        _flag_s: 'bool'
+        #: Input stream reader.
+        _reader: 'Optional[StreamReader]'
+        #: Executor for decoding frames.
+        _executor: 'Optional[Executor]'
+        #: Keyword arguments for the underlying extractor.
+        _kwargs: 'dict[str, Any]'
+
+        #: Underlying extractor.
+        _extractor: 'Optional[Extractor]'
+        #: In-memory input stream of the underlying extractor.
+        _record: 'RecordIO'
+        #: Input file format, i.e., ``pcap`` or ``pcapng``.
+        _format: 'str'
+        #: Byte order of the records.
+        _endian: 'str'
+        #: EOF flag.
+        _flag_e: 'bool'
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def extractor(self) -> 'Extractor':
+        """Underlying extractor.
+
+        Raises:
+            UnsupportedCall: If the extraction is not yet started.
+
+        """
+        if self._extractor is None:
+            raise UnsupportedCall(f"{self.__class__.__name__!r} object has not yet started extraction")
+        return self._extractor
+
+    @property
+    def length(self) -> 'int':
+        """Frame number (of current extracted frame)."""
+        if self._extractor is None:
+            return 0
+        return self._extractor.length
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    async def start(self) -> 'Extractor':
+        """Start extraction.
+
+        The method opens the input and reads the PCAP global header (or
+        the first PCAP-NG section header block), then initialises the
+        underlying :class:`~pcapkit.foundation.extraction.Extractor` with it.
+        It is called automatically upon the first iteration.
+
+        Returns:
+            The underlying extractor.
+
+        Raises:
+            FormatError: If the input is neither a PCAP nor a PCAP-NG file.
+
+        """
+        if self._extractor is not None:
+            return self._extractor
+        loop = asyncio.get_running_loop()
+
+        if self._flag_s:
+            self._ifile = await loop.run_in_executor(self._executor, open, self._ifnm, 'rb')
+        if self._reader is None and self._is_pipe(cast('IO[bytes]', self._ifile)):
+            self._reader = asyncio.StreamReader()
+            protocol = asyncio.StreamReaderProtocol(self._reader)
+            await loop.connect_read_pipe(lambda: protocol, self._ifile)
+
+        magic = await self._read(4)
+        if magic in PCAP_MAGIC:
+            self._format = 'pcap'
+            self._endian = PCAP_MAGIC[magic][0]
+            header = magic + await self._read(20)
+        elif magic == PCAPNG_MAGIC:
+            self._format = 'pcapng'
+            header = await self._read_block(magic)
+        else:
+            raise FormatError(f'unknown file format: {magic!r}')
+
+        self._record.feed(header)
+        self._extractor = await loop.run_in_executor(
+            self._executor, functools.partial(Extractor, self._record, auto=False, **self._kwargs),
+        )
+        return self._extractor
+
+    async def aclose(self) -> 'None':
+        """Stop extraction and close the input (if opened by the extractor)."""
+        if self._extractor is not None and not self._flag_e:
+            self._extractor._cleanup()  # pylint: disable=protected-access
+        self._flag_e = True
+
+        if self._flag_s and self._ifile is not None:
+            self._ifile.close()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, fin: 'str | IO[bytes] | StreamReader', *,
+                 executor: 'Optional[Executor]' = None, extension: 'bool' = True,
+                 **kwargs: 'Any') -> 'None':
+        if 'engine' in kwargs:
+            if kwargs.pop('engine') not in (None, 'default', 'pcapkit'):
+                warn(f"{self.__class__.__name__!r} only supports the built-in engines; "
+                     'using default engine instead', EngineWarning, stacklevel=stacklevel())
+        kwargs.pop('auto', None)
+
+        self._ifile = None
+        self._reader = None
+        self._flag_s = isinstance(fin, str)
+        if isinstance(fin, str):
+            self._ifnm = Extractor.make_name(fin, extension=extension, nofile=True)[0]
+        elif isinstance(fin, asyncio.StreamReader):
+            self._ifnm = '<stream>'
+            self._reader = fin
+        else:
+            self._ifnm = getattr(fin, 'name', '<stream>')
+            self._ifile = fin
+
+        self._executor = executor
+        self._kwargs = kwargs
+
+        self._extractor = None
+        self._record = RecordIO(str(self._ifnm))
+        self._format = ''
+        self._endian = '<'
+        self._flag_e = False
+
+    def __aiter__(self) -> 'Self':
+        """Iterate and parse PCAP frames asynchronously."""
+        return self
+
+    async def __anext__(self) -> 'Packet':
+        """Read and parse the next PCAP frame.
+
+        Raises:
+            StopAsyncIteration: Upon EOF of the input.
+
+        """
+        if self._flag_e:
+            raise StopAsyncIteration
+        await self.start()
+        loop = asyncio.get_running_loop()
+
+        while True:
+            data, complete = await self._read_record()
+            if data:
+                frame = await loop.run_in_executor(self._executor, self._decode, data)
+                if complete and frame is not None:
+                    return frame
+            if not complete:
+                await self.aclose()
+                raise StopAsyncIteration
+
+    async def __aenter__(self) -> 'Self':
+        """Uses :class:`AsyncExtractor` as an asynchronous context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: 'Type[BaseException] | None', exc_value: 'BaseException | None',
+                        traceback: 'TracebackType | None') -> 'None':  # pylint: disable=unused-argument
+        """Stop extraction when exits."""
+        await self.aclose()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    async def _read(self, size: 'int') -> 'bytes':
+        """Read up to ``size`` bytes from the input.
+
+        Less than ``size`` bytes are returned only upon EOF.
+
+        """
+        if self._reader is not None:
+            try:
+                return await self._reader.readexactly(size)
+            except asyncio.IncompleteReadError as error:
+                return error.partial
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, cast('IO[bytes]', self._ifile).read, size)
+
+    async def _read_block(self, head: 'bytes' = b'') -> 'bytes':
+        """Read the next PCAP-NG block.
+
+        Args:
+            head: Leading bytes of the block already read.
+
+        Returns:
+            The block data; empty upon EOF or truncated block.
+
+        """
+        head += await self._read(12 - len(head))
+        if len(head) < 12:
+            return b''
+
+        if head[:4] == PCAPNG_MAGIC:
+            self._endian = '>' if head[8:12] == b'\x1a\x2b\x3c\x4d' else '<'
+        length = struct.unpack(f'{self._endian}I', head[4:8])[0]
+        if length < 12:
+            raise FormatError(f'PCAP-NG: invalid block length: {length}')
+
+        body = await self._read(length - 12)
+        if len(body) < length - 12:
+            return b''
+        return head + body
+
+    async def _read_record(self) -> 'tuple[bytes, bool]':
+        """Read the next frame record from the input.
+
+        For PCAP-NG inputs, non-packet blocks preceding the next packet
+        block are read along with it, as the engine processes them all
+        at once.
+
+        Returns:
+            The record data and a flag indicating if the record ends with
+            a frame; empty data upon EOF.
+
+        """
+        if self._format == 'pcap':
+            head = await self._read(16)
+            if len(head) < 16:
+                return b'', False
+
+            incl_len = struct.unpack(f'{self._endian}I', head[8:12])[0]
+            body = await self._read(incl_len)
+            if len(body) < incl_len:
+                return b'', False
+            return head + body, True
+
+        blocks = []  # type: list[bytes]
+        while block := await self._read_block():
+            blocks.append(block)
+            if struct.unpack(f'{self._endian}I', block[:4])[0] in PCAPNG_PACKET:
+                return b''.join(blocks), True
+        return b''.join(blocks), False
+
+    def _decode(self, data: 'bytes') -> 'Optional[Packet]':
+        """Decode a frame record with the extraction engine.
+
+        Args:
+            data: Frame record data.
+
+        Returns:
+            Parsed frame; :obj:`None` if the record does not end with a frame.
+
+        """
+        extractor = cast('Extractor', self._extractor)
+        self._record.feed(data)
+        try:
+            return extractor._exeng.read_frame()  # pylint: disable=protected-access
+        except (EOFError, StopIteration):
+            return None
+
+    @staticmethod
+    def _is_pipe(file: 'IO[bytes]') -> 'bool':
+        """Check if the input file is a pipe, a socket or a character device."""
+        try:
+            mode = os.fstat(file.fileno()).st_mode
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            return False
+        return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or stat.S_ISCHR(mode)
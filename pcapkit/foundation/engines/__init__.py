@@ -23,6 +23,8 @@ from pcapkit.foundation.engines.engine import Engine
 # Built-in engines
 from pcapkit.foundation.engines.pcap import PCAP
 from pcapkit.foundation.engines.pcapng import PCAPNG
+from pcapkit.foundation.engines.mmap import MMAP
+from pcapkit.foundation.engines.merge import Merge
 
 # 3rd party engines
 from pcapkit.foundation.engines.scapy import Scapy
@@ -30,7 +32,7 @@ from pcapkit.foundation.engines.dpkt import DPKT
 from pcapkit.foundation.engines.pyshark import PyShark
 
 __all__ = [
-    'PCAP', 'PCAPNG',
+    'PCAP', 'PCAPNG', 'MMAP', 'Merge',
 
     'Scapy', 'DPKT', 'PyShark',
 ]
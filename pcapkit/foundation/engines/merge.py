@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""Merged PCAP Support
+=========================
+
+.. module:: pcapkit.foundation.engines.merge
+
+This module contains the implementation for extracting multiple PCAP
+files as one frame stream merged by timestamp, as is used by
+:class:`pcapkit.foundation.extraction.Extractor` when a list of input
+files is given.
+
+Similar to ``mergecap``, the engine performs a k-way merge with
+:func:`heapq.merge` over the record headers of the input files, c.f.
+:meth:`FrameIndex.iter_pcap <pcapkit.foundation.index.FrameIndex.iter_pcap>`,
+such that only one pending record header per input file is kept in memory,
+and each frame is parsed from its own file upon its turn.
+
+"""
+import heapq
+import io
+import os
+from typing import TYPE_CHECKING
+
+from pcapkit.foundation.engines.pcap import PCAP
+from pcapkit.foundation.index import PCAP_MAGIC, FrameIndex
+from pcapkit.protocols.misc.pcap.frame import Frame
+from pcapkit.protocols.misc.pcap.header import Header
+from pcapkit.utilities.exceptions import FormatError
+
+__all__ = ['Merge']
+
+if TYPE_CHECKING:
+    from typing import BinaryIO, Iterator
+
+
+class Merge(PCAP):
+    """Merged PCAP files extraction support.
+
+    The engine behaves as :class:`~pcapkit.foundation.engines.pcap.PCAP`,
+    except that frames are read from all input files in the order of their
+    timestamps. Frames with identical timestamps are ordered by the position
+    of their files in the input list, then by their positions in the files.
+
+    Args:
+        extractor: :class:`~pcapkit.foundation.extraction.Extractor` instance.
+
+    Notes:
+        The :attr:`header` is the global header of the first input file. All
+        input files must be PCAP files of the same data link layer protocol;
+        their timestamp resolutions and byte orders may differ.
+
+    """
+
+    if TYPE_CHECKING:
+        #: Input files.
+        _mfile: 'list[BinaryIO]'
+        #: Global headers of input files.
+        _mhdrs: 'list[Header]'
+        #: Merged record stream, i.e., timestamp, file number and record offset.
+        _mrecs: 'Iterator[tuple[int, int, int]]'
+
+    ##########################################################################
+    # Defaults.
+    ##########################################################################
+
+    #: Engine name.
+    __engine_name__ = 'Merge'
+
+    #: Engine module name.
+    __engine_module__ = 'heapq'
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def headers(self) -> 'tuple[Header, ...]':
+        """Global headers of input files."""
+        return tuple(self._mhdrs)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def run(self) -> 'None':
+        """Start extraction.
+
+        This method opens all input files and parses their PCAP global headers,
+        then sets up the k-way merge of their record headers. The global header
+        of the first input file is recorded as what
+        :meth:`PCAP.run <pcapkit.foundation.engines.pcap.PCAP.run>` does.
+
+        Raises:
+            FormatError: If any input file is not a PCAP file, or the input
+                files are of different data link layer protocols.
+
+        """
+        # pylint: disable=attribute-defined-outside-init,protected-access
+        ext = self._extractor
+
+        self._mfile = []
+        self._mhdrs = []
+
+        streams = []  # type: list[Iterator[tuple[int, int, int]]]
+        try:
+            for number, name in enumerate(ext._mfnm):
+                file = open(name, 'rb')  # pylint: disable=consider-using-with
+                self._mfile.append(file)
+
+                magic = file.read(4)
+                if magic not in PCAP_MAGIC:
+                    raise FormatError(f'unsupported file format for merging: {name!r} ({magic!r})')
+                file.seek(0, os.SEEK_SET)
+
+                header = Header(file)
+                if self._mhdrs and header.protocol != self._mhdrs[0].protocol:
+                    raise FormatError(f'cannot merge {name!r} of data link type {header.protocol!r} '
+                                      f'with data link type {self._mhdrs[0].protocol!r}')
+                self._mhdrs.append(header)
+
+                size = file.seek(0, io.SEEK_END)
+                streams.append(self._iter_records(number, file, size))
+        except BaseException:
+            self.close()
+            raise
+
+        self._mrecs = heapq.merge(*streams)
+        self._gbhdr = self._mhdrs[0]
+        self._write_header()
+
+    def close(self) -> 'None':
+        """Close engine.
+
+        This method closes all input files opened by the engine.
+
+        """
+        for file in getattr(self, '_mfile', ()):
+            file.close()
+
+    def _iter_records(self, number: 'int', file: 'BinaryIO', size: 'int') -> 'Iterator[tuple[int, int, int]]':
+        """Iterate over record headers of an input file.
+
+        Args:
+            number: File number, i.e., index in the input list.
+            file: Binary IO object of the input file.
+            size: Size of the input file.
+
+        Yields:
+            Timestamp (in nanoseconds), file number and record offset.
+
+        """
+        header = self._mhdrs[number]
+        endian = '>' if header.info.magic_number.byteorder == 'big' else '<'
+        for offset, timestamp, _, _ in FrameIndex.iter_pcap(file, endian, header.nanosecond, size):
+            yield timestamp, number, offset
+
+    def _read_frame(self) -> 'Frame':
+        """Read the frame of the earliest timestamp among the input files.
+
+        Returns:
+            Parsed frame instance.
+
+        Raises:
+            EOFError: If all input files are exhausted.
+
+        """
+        ext = self._extractor
+        try:
+            _, number, offset = next(self._mrecs)
+        except StopIteration:
+            raise EOFError from None
+
+        file, header = self._mfile[number], self._mhdrs[number]
+        file.seek(offset, os.SEEK_SET)
+        return Frame(file, num=ext._frnum+1, header=header.info,
+                     nanosecond=header.nanosecond, _plan=ext._explan, _lazy=ext._flag_l)
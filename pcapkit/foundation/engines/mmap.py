@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""Memory-Mapped PCAP Support
+================================
+
+.. module:: pcapkit.foundation.engines.mmap
+
+This module contains the implementation for memory-mapped PCAP file
+extraction support, as is used by :class:`pcapkit.foundation.extraction.Extractor`.
+
+Instead of issuing :meth:`~io.BufferedReader.read` calls on the input
+stream for every frame, the engine maps the whole input file into memory
+with :mod:`mmap` and hands slices of a :class:`memoryview` over the mapped
+region to :class:`~pcapkit.protocols.misc.pcap.frame.Frame`, so that the
+frame boundary scanning requires no system calls nor intermediate copies.
+
+"""
+import io
+import mmap
+import struct
+from typing import TYPE_CHECKING
+
+from pcapkit.foundation.engines.pcap import PCAP
+from pcapkit.protocols.misc.pcap.frame import Frame
+from pcapkit.protocols.misc.pcap.header import Header
+from pcapkit.utilities.exceptions import FormatError, stacklevel
+from pcapkit.utilities.warnings import EngineWarning, warn
+
+__all__ = ['MMAP']
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+
+class MMAP(PCAP):
+    """Memory-mapped PCAP file extraction support.
+
+    The engine behaves exactly as :class:`~pcapkit.foundation.engines.pcap.PCAP`,
+    except that frames are sliced out of a read-only memory map of the input
+    file. Should the input not be mappable (e.g., a pipe or an in-memory stream),
+    the engine falls back to the streaming behaviour of its parent class.
+
+    Args:
+        extractor: :class:`~pcapkit.foundation.extraction.Extractor` instance.
+
+    """
+
+    if TYPE_CHECKING:
+        #: Memory-mapped flag.
+        _mflag: 'bool'
+        #: Memory map of the input file.
+        _mmap: 'Optional[mmap.mmap]'
+        #: Memory view over the memory map.
+        _mview: 'Optional[memoryview]'
+        #: Current offset in the memory map.
+        _moff: 'int'
+        #: Frame record header unpacker.
+        _mhdr: 'struct.Struct'
+
+    ##########################################################################
+    # Defaults.
+    ##########################################################################
+
+    #: Engine name.
+    __engine_name__ = 'MMAP'
+
+    #: Engine module name.
+    __engine_module__ = 'mmap'
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def mapped(self) -> 'bool':
+        """Whether the input file is memory-mapped."""
+        return self._mflag
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def run(self) -> 'None':
+        """Start extraction.
+
+        This method maps the input file into memory and then parses the
+        PCAP global header from the memory map, as what
+        :meth:`PCAP.run <pcapkit.foundation.engines.pcap.PCAP.run>` does.
+
+        Warns:
+            pcapkit.utilities.warnings.EngineWarning: If the input file cannot
+                be memory-mapped (e.g., a pipe or a compressed file), or under no
+                EOF mode, in which case the engine falls back to streaming extraction.
+
+        Raises:
+            FormatError: If the input file is not a PCAP file.
+
+        """
+        # pylint: disable=attribute-defined-outside-init,protected-access
+        ext = self._extractor
+
+        self._mflag = False
+        self._mmap = None
+        self._mview = None
+        self._moff = 0
+
+        if ext._magic not in self.MAGIC_NUMBER:
+            raise FormatError(f'unknown file format: {ext._magic!r}')
+
+        if ext._flag_n:
+            warn('cannot memory-map input file under no EOF mode; using streaming extraction instead',
+                 EngineWarning, stacklevel=stacklevel())
+            return super().run()
+
+        if ext._cmpr is not None:
+            warn(f'cannot memory-map {ext._cmpr} compressed input file; using streaming extraction instead',
+                 EngineWarning, stacklevel=stacklevel())
+            return super().run()
+
+        try:
+            self._mmap = mmap.mmap(ext._ifile.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation) as error:
+            warn(f'cannot memory-map input file ({error}); using streaming extraction instead',
+                 EngineWarning, stacklevel=stacklevel())
+            return super().run()
+
+        self._mflag = True
+        self._mview = memoryview(self._mmap)
+        self._moff = ext._ifile.tell()
+
+        # NOTE: the global header is small enough that we simply parse it
+        # from a bytes copy, so that no reference to the memory map is
+        # retained by the header instance.
+        self._gbhdr = Header(bytes(self._mview[self._moff:self._moff+24]))
+        self._moff += 24
+
+        byteorder = self._gbhdr.info.magic_number.byteorder
+        self._mhdr = struct.Struct('>IIII' if byteorder == 'big' else '<IIII')
+        self._write_header()
+
+    def close(self) -> 'None':
+        """Close engine.
+
+        This method releases the memory view and unmaps the input file.
+
+        """
+        mview = getattr(self, '_mview', None)
+        if mview is not None:
+            mview.release()
+            self._mview = None
+
+        mfile = getattr(self, '_mmap', None)
+        if mfile is not None:
+            try:
+                mfile.close()
+            except BufferError:
+                # NOTE: some exported views are still alive; the memory
+                # map will be released upon garbage collection instead
+                pass
+            self._mmap = None
+
+    def _read_frame(self) -> 'Frame':
+        """Read frame from the memory map.
+
+        Returns:
+            Parsed frame instance.
+
+        Raises:
+            EOFError: If reached the end of the memory map.
+
+        """
+        if self._mview is None:
+            return super()._read_frame()
+        ext = self._extractor
+
+        offset = self._moff
+        if offset + 16 > len(self._mview):
+            raise EOFError
+
+        _, _, incl_len, _ = self._mhdr.unpack_from(self._mview, offset)
+        if offset + 16 + incl_len > len(self._mview):
+            raise EOFError
+        self._moff = offset + 16 + incl_len
+
+        return Frame(self._mview[offset:self._moff], num=ext._frnum+1, header=self._gbhdr.info,
+                     nanosecond=self._nnsec, _plan=ext._explan, _lazy=ext._flag_l)
@@ -8,6 +8,7 @@ This module contains the implementation for PCAP file extraction
 support, as is used by :class:`pcapkit.foundation.extraction.Extractor`.
 
 """
+import os
 from typing import TYPE_CHECKING
 
 from pcapkit.foundation.engines.engine import EngineBase as Engine
@@ -17,8 +18,25 @@ from pcapkit.protocols.misc.pcap.header import Header
 __all__ = ['PCAP']
 
 if TYPE_CHECKING:
+    from ipaddress import IPv4Address, IPv6Address
+    from typing import IO, Any, Optional
+
+    from typing_extensions import TypeAlias
+
     from pcapkit.const.reg.linktype import LinkType as Enum_LinkType
     from pcapkit.corekit.version import VersionInfo
+    from pcapkit.foundation.reassembly.data.ip import Packet as IP_Packet
+    from pcapkit.foundation.reassembly.data.tcp import Packet as TCP_Packet
+    from pcapkit.foundation.traceflow.data.tcp import Packet as TF_TCP_Packet
+
+    #: Frame summary for post-processing, c.f. :meth:`PCAP.summarise_frame`.
+    FrameSummary: 'TypeAlias' = tuple[
+        Optional[dict[str, Any]],
+        Optional[IP_Packet[IPv4Address]],
+        Optional[IP_Packet[IPv6Address]],
+        Optional[TCP_Packet],
+        Optional[TF_TCP_Packet],
+    ]
 
 
 class PCAP(Engine[Frame]):
@@ -106,6 +124,19 @@ class PCAP(Engine[Frame]):
         ext = self._extractor
 
         self._gbhdr = Header(ext._ifile)
+        self._write_header()
+
+    def _write_header(self) -> 'None':
+        """Record the parsed PCAP global header.
+
+        This method saves the information from :attr:`self.header <header>` to
+        the current engine instance and dumps the global header to the output
+        file, if necessary.
+
+        """
+        # pylint: disable=attribute-defined-outside-init,protected-access
+        ext = self._extractor
+
         self._vinfo = self._gbhdr.version
         self._dlink = self._gbhdr.protocol
         self._nnsec = self._gbhdr.nanosecond
@@ -136,53 +167,157 @@ class PCAP(Engine[Frame]):
         Returns:
             Parsed frame instance.
 
+        """
+        return self.record_frame(self._read_frame())
+
+    def record_frame(self, frame: 'Frame') -> 'Frame':
+        """Record a parsed frame.
+
+        This method performs the post-processing of a parsed frame, i.e.,
+        all operations as described in :meth:`read_frame` except the actual
+        parsing. It is also used to record frames parsed elsewhere, e.g., by
+        worker processes under multi-process extraction.
+
+        Args:
+            frame: Parsed frame instance.
+
+        Returns:
+            The frame instance.
+
+        """
+        self.record_summary(self.summarise_frame(frame, self.summary_flags, data_link=self._dlink), frame)
+        return frame
+
+    @property
+    def summary_flags(self) -> 'tuple[bool, bool, bool, bool, bool]':
+        """Post-processing flags for :meth:`summarise_frame`, i.e., if write
+        output file, if record data for IPv4, IPv6 and TCP reassembly, and if
+        trace TCP flows."""
+        ext = self._extractor
+        return (
+            not ext._flag_q,
+            ext._flag_r and ext._ipv4,
+            ext._flag_r and ext._ipv6,
+            ext._flag_r and ext._tcp,
+            ext._flag_t and ext._tcp,
+        )
+
+    @staticmethod
+    def summarise_frame(frame: 'Frame', flags: 'tuple[bool, bool, bool, bool, bool]', *,
+                        data_link: 'Enum_LinkType') -> 'FrameSummary':
+        """Summarise a parsed frame for post-processing.
+
+        The summary consists of only the frame data needed by
+        :meth:`record_summary`, as plain :obj:`dict` and
+        :class:`~pcapkit.corekit.infoclass.Info` objects, which are much
+        cheaper to pickle than the frame itself; thus the method is also
+        called in worker processes under multi-process extraction.
+
+        Args:
+            frame: Parsed frame instance.
+            flags: Post-processing flags, c.f. :attr:`summary_flags`.
+            data_link: Data link layer protocol (from global header).
+
+        Returns:
+            Frame info for the output file, data for IPv4, IPv6 and TCP
+            reassembly and data for TCP flow tracing, if applicable.
+
         """
         from pcapkit.toolkit.pcap import (ipv4_reassembly, ipv6_reassembly, tcp_reassembly,
                                           tcp_traceflow)
+        output, ipv4, ipv6, tcp, trace = flags
+
+        return (
+            frame.info.to_dict() if output else None,
+            ipv4_reassembly(frame) if ipv4 else None,
+            ipv6_reassembly(frame) if ipv6 else None,
+            tcp_reassembly(frame) if tcp else None,
+            tcp_traceflow(frame, data_link=data_link) if trace else None,
+        )
+
+    def record_summary(self, summary: 'FrameSummary', frame: 'Optional[Frame]' = None) -> 'None':
+        """Record a frame summary.
+
+        Args:
+            summary: Frame summary, c.f. :meth:`summarise_frame`.
+            frame: Parsed frame instance, if any; it is required for verbose
+                output and frame storage.
+
+        """
         ext = self._extractor
+        info, data_ipv4, data_ipv6, data_tcp, data_tf_tcp = summary
 
-        # read frame header
-        frame = Frame(ext._ifile, num=ext._frnum+1, header=self._gbhdr.info,
-                      layer=ext._exlyr, protocol=ext._exptl, nanosecond=self._nnsec)
+        # increment frame number
         ext._frnum += 1
 
         # verbose output
-        ext._vfunc(ext, frame)
+        if frame is not None:
+            ext._vfunc(ext, frame)
 
         # write plist
         frnum = f'Frame {ext._frnum}'
-        if not ext._flag_q:
+        if info is not None:
             if ext._flag_f:
                 ofile = ext._ofile(f'{ext._ofnm}/{frnum}.{ext._fext}')
-                ofile(frame.info.to_dict(), name=frnum)
+                ofile(info, name=frnum)
             else:
-                ext._ofile(frame.info.to_dict(), name=frnum)
+                ext._ofile(info, name=frnum)
 
         # record fragments
-        if ext._flag_r:
-            if ext._ipv4:
-                data_ipv4 = ipv4_reassembly(frame)
-                if data_ipv4 is not None:
-                    ext._reasm.ipv4(data_ipv4)
-            if ext._ipv6:
-                data_ipv6 = ipv6_reassembly(frame)
-                if data_ipv6 is not None:
-                    ext._reasm.ipv6(data_ipv6)
-            if ext._tcp:
-                data_tcp = tcp_reassembly(frame)
-                if data_tcp is not None:
-                    ext._reasm.tcp(data_tcp)
+        if data_ipv4 is not None:
+            ext._reasm.ipv4(data_ipv4)
+        if data_ipv6 is not None:
+            ext._reasm.ipv6(data_ipv6)
+        if data_tcp is not None:
+            ext._reasm.tcp(data_tcp)
 
         # trace flows
-        if ext._flag_t:
-            if ext._tcp:
-                data_tf_tcp = tcp_traceflow(frame, data_link=self._dlink)
-                if data_tf_tcp is not None:
-                    ext._trace.tcp(data_tf_tcp)
+        if data_tf_tcp is not None:
+            ext._trace.tcp(data_tf_tcp)
 
         # record frames
-        if ext._flag_d:
+        if ext._flag_d and frame is not None:
             ext._frame.append(frame)
 
-        # return frame record
-        return frame
+    def _read_frame(self) -> 'Frame':
+        """Read frame from the input file.
+
+        Returns:
+            Parsed frame instance.
+
+        """
+        ext = self._extractor
+        if ext._flag_n:
+            file = self._read_record()  # type: IO[bytes] | bytes
+        else:
+            file = ext._ifile
+        return Frame(file, num=ext._frnum+1, header=self._gbhdr.info,
+                     nanosecond=self._nnsec, _plan=ext._explan, _lazy=ext._flag_l)
+
+    def _read_record(self) -> 'bytes':
+        """Read a complete frame record from the input file.
+
+        Under no EOF mode, the input file may still be being written, thus the
+        last frame record could be incomplete. Such record is left in the input
+        file and will be read again from its beginning upon the next call.
+
+        Returns:
+            Frame record data, including the frame header.
+
+        Raises:
+            EOFError: If no complete frame record is available; the input file
+                is rewound to the beginning of the frame record.
+
+        """
+        ext = self._extractor
+        seek_set = ext._ifile.tell()
+
+        head = ext._ifile.read(16)
+        if len(head) == 16:
+            incl_len = int.from_bytes(head[8:12], self._gbhdr.info.magic_number.byteorder)
+            body = ext._ifile.read(incl_len)
+            if len(body) == incl_len:
+                return head + body
+
+        ext._ifile.seek(seek_set, os.SEEK_SET)
+        raise EOFError
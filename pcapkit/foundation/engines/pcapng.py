@@ -8,6 +8,7 @@ This module contains the implementation for PCAP-NG file extraction
 support, as is used by :class:`pcapkit.foundation.extraction.Extractor`.
 
 """
+import os
 from typing import TYPE_CHECKING, cast
 
 from pcapkit.const.pcapng.block_type import BlockType as Enum_BlockType
@@ -165,8 +166,9 @@ class PCAPNG(Engine[P_PCAPNG]):
 
         while True:
             # read next block
-            block = P_PCAPNG(ext._ifile, num=ext._frnum+1, sct=len(self._ctx_list),
-                             ctx=self._ctx, layer=ext._exlyr, protocol=ext._exptl,
+            block = P_PCAPNG(self._read_block() if ext._flag_n else ext._ifile,
+                             num=ext._frnum+1, sct=len(self._ctx_list),
+                             ctx=self._ctx, _plan=ext._explan, _lazy=ext._flag_l,
                              __packet__={
                                  'snaplen': self._get_snaplen(),
                              })
@@ -307,3 +309,39 @@ class PCAPNG(Engine[P_PCAPNG]):
         if self._ctx.interfaces:
             return self._ctx.interfaces[0].snaplen
         return 0xFFFF_FFFF_FFFF_FFFF
+
+    def _read_block(self) -> 'bytes':
+        """Read a complete block from the input file.
+
+        Under no EOF mode, the input file may still be being written, thus the
+        last block could be incomplete. Such block is left in the input file and
+        will be read again from its beginning upon the next call.
+
+        Returns:
+            Block data.
+
+        Raises:
+            EOFError: If no complete block is available; the input file is
+                rewound to the beginning of the block.
+            FormatError: If the block length is invalid.
+
+        """
+        ext = self._extractor
+        seek_set = ext._ifile.tell()
+
+        head = ext._ifile.read(12)
+        if len(head) == 12:
+            if head[:4] == self.MAGIC_NUMBER[0]:
+                byteorder = 'big' if head[8:12] == b'\x1a\x2b\x3c\x4d' else 'little'
+            else:
+                byteorder = self._ctx.section.byteorder
+            length = int.from_bytes(head[4:8], byteorder)  # type: ignore[arg-type]
+            if length < 12:
+                raise FormatError(f'PCAP-NG: invalid block length: {length}')
+
+            body = ext._ifile.read(length - 12)
+            if len(body) == length - 12:
+                return head + body
+
+        ext._ifile.seek(seek_set, os.SEEK_SET)
+        raise EOFError
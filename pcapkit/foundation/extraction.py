@@ -17,17 +17,23 @@ import collections
 import importlib
 import io
 import os
+import stat
+import struct
 import sys
-from typing import TYPE_CHECKING, Generic, TypeVar, cast
+import time
+from typing import TYPE_CHECKING, Generic, TypeVar, cast, overload
 
 from dictdumper.dumper import Dumper
 
-from pcapkit.corekit.io import SeekableReader
+from pcapkit.corekit.io import ParallelGzipReader, SeekableReader
 from pcapkit.corekit.module import ModuleDescriptor
+from pcapkit.corekit.threshold import Threshold
 from pcapkit.dumpkit.common import make_dumper
 from pcapkit.foundation.engines.engine import Engine
+from pcapkit.foundation.engines.merge import Merge as Merge_Engine
 from pcapkit.foundation.engines.pcap import PCAP as PCAP_Engine
 from pcapkit.foundation.engines.pcapng import PCAPNG as PCAPNG_Engine
+from pcapkit.foundation.index import FrameIndex
 from pcapkit.foundation.reassembly import ReassemblyManager
 from pcapkit.foundation.reassembly.data import ReassemblyData
 from pcapkit.foundation.reassembly.reassembly import Reassembly
@@ -41,25 +47,32 @@ from pcapkit.utilities.warnings import (EngineWarning, ExtractionWarning, Format
                                         RegistryWarning, warn)
 
 if TYPE_CHECKING:
+    import array
+    from concurrent.futures import Future
     from io import BufferedReader
     from types import ModuleType, TracebackType
-    from typing import IO, Any, Callable, DefaultDict, Optional, Type, Union
+    from typing import IO, Any, Callable, DefaultDict, Deque, Optional, Sequence, Type, Union
 
     from dpkt.dpkt import Packet as DPKTPacket
+    from numpy import ndarray
     from pyshark.packet.packet import Packet as PySharkPacket
     from scapy.packet import Packet as ScapyPacket
     from typing_extensions import Literal
 
+    from pcapkit.const.reg.linktype import LinkType as Enum_LinkType
+    from pcapkit.foundation.engines.pcap import FrameSummary
+    from pcapkit.foundation.engines.pcapng import Context as PCAPNG_Context
     from pcapkit.foundation.reassembly.ipv4 import IPv4 as IPv4_Reassembly
     from pcapkit.foundation.reassembly.ipv6 import IPv6 as IPv6_Reassembly
     from pcapkit.foundation.reassembly.tcp import TCP as TCP_Reassembly
     from pcapkit.foundation.traceflow.tcp import TCP as TCP_TraceFlow
     from pcapkit.protocols.misc.pcap.frame import Frame
+    from pcapkit.protocols.misc.pcap.header import Header as PCAP_Header
     from pcapkit.protocols.misc.pcapng import PCAPNG
     from pcapkit.protocols.protocol import ProtocolBase as Protocol
 
     Formats = Literal['pcap', 'json', 'tree', 'plist']
-    Engines = Literal['default', 'pcapkit', 'dpkt', 'scapy', 'pyshark']
+    Engines = Literal['default', 'pcapkit', 'mmap', 'dpkt', 'scapy', 'pyshark']
     Layers = Literal['link', 'internet', 'transport', 'application', 'none']
 
     Packet = Union[Frame, PCAPNG, ScapyPacket, DPKTPacket, PySharkPacket]
@@ -83,6 +96,8 @@ class Extractor(Generic[_P]):
     if TYPE_CHECKING:
         #: Input file name.
         _ifnm: 'str'
+        #: Input file names to be merged by timestamp, if any.
+        _mfnm: 'Optional[tuple[str, ...]]'
         #: Output file name.
         _ofnm: 'Optional[str]'
         #: Output file extension.
@@ -109,6 +124,15 @@ class Extractor(Generic[_P]):
         #: as the extraction process will not stop until the user interrupt
         #: the process.
         _flag_n: 'bool'
+        #: Lazy decoding flag. If set, the frames will only have their frame
+        #: headers parsed upon extraction, and each of the remaining layers will
+        #: be decoded once accessed.
+        _flag_l: 'bool'
+        #: Idle timeout (in seconds) under no EOF mode.
+        _idle: 'Optional[float]'
+        #: Polling state under no EOF mode, as a tuple of frame number,
+        #: next polling interval and idle deadline.
+        _fstat: 'Optional[tuple[int, float, Optional[float]]]'
         #: Input filename flag. It indicates if the input file is a file
         #: name or a binary IO object. For the latter, we should not close
         #: the file object after extraction.
@@ -137,10 +161,17 @@ class Extractor(Generic[_P]):
         #: is enabled.
         _tcp: 'bool'
 
+        #: Number of worker processes for multi-process extraction.
+        _nproc: 'int'
+        #: Number of worker threads for decompression.
+        _nthrd: 'int'
+
         #: Extract til protocol.
         _exptl: 'Protocols'
         #: Extract til layer.
         _exlyr: 'Layers'
+        #: Compiled termination plan of :attr:`_exlyr` and :attr:`_exptl`.
+        _explan: 'Optional[Threshold]'
         #: Extraction engine name.
         _exnam: 'Engines'
         #: Extraction engine instance.
@@ -148,9 +179,21 @@ class Extractor(Generic[_P]):
 
         #: Input file object.
         _ifile: 'BufferedReader'
+        #: Compression format of the input file.
+        _cmpr: 'Optional[str]'
         #: Output file object.
         _ofile: 'Dumper | Type[Dumper]'
 
+        #: Frame offset index.
+        _index: 'Optional[FrameIndex]'
+        #: Sidecar index file setting, c.f. :meth:`FrameIndex.from_file <pcapkit.foundation.index.FrameIndex.from_file>`.
+        _sidx: 'bool | str'
+        #: PCAP global header for random access.
+        _rhdr: 'Optional[PCAP_Header]'
+        #: PCAP-NG section contexts for random access, as a list of section
+        #: header block offset and corresponding context.
+        _rctx: 'Optional[list[tuple[int, PCAPNG_Context]]]'
+
         #: Magic number.
         _magic: 'bytes'
         #: Output format.
@@ -158,6 +201,16 @@ class Extractor(Generic[_P]):
 
     #: List of potential PCAP file extentions.
     PCAP_EXT = ['.pcap', '.cap', '.pcapng']
+    #: List of potential compressed file extentions.
+    COMPRESS_EXT = ['.gz', '.xz', '.bz2']
+
+    #: Minimum and maximum intervals (in seconds) for polling new data
+    #: under no EOF mode, c.f. :meth:`_follow`.
+    FOLLOW_INTERVAL = (0.01, 1.0)
+
+    #: Number of frames per chunk under multi-process extraction, c.f.
+    #: :meth:`_record_frames_parallel`.
+    PARALLEL_CHUNK_SIZE = 1024
 
     ##########################################################################
     # Defaults.
@@ -184,6 +237,7 @@ class Extractor(Generic[_P]):
     #: the module name and class name, or an :class:`~pcapkit.foundation.engines.engine.Engine`
     #: subclass.
     __engine__ = {
+        'mmap': ModuleDescriptor('pcapkit.foundation.engines.mmap', 'MMAP'),
         'scapy': ModuleDescriptor('pcapkit.foundation.engines.scapy', 'Scapy'),
         'dpkt': ModuleDescriptor('pcapkit.foundation.engines.dpkt', 'DPKT'),
         'pyshark': ModuleDescriptor('pcapkit.foundation.engines.pyshark', 'PyShark'),
@@ -205,6 +259,16 @@ class Extractor(Generic[_P]):
         'tcp': ModuleDescriptor('pcapkit.foundation.traceflow.tcp', 'TCP'),
     }  # type: dict[str, ModuleDescriptor[TraceFlow] | Type[TraceFlow]]
 
+    #: Decompression support mapping for reading compressed input files. The values
+    #: should be a tuple representing the magic number of the compression format, and
+    #: the module name and function name, or a callable, which opens a decompressed
+    #: binary IO object from a binary IO object.
+    __compression__ = {
+        'gzip': (b'\x1f\x8b', ModuleDescriptor('gzip', 'open')),
+        'xz': (b'\xfd7zXZ\x00', ModuleDescriptor('lzma', 'open')),
+        'bz2': (b'BZh', ModuleDescriptor('bz2', 'open')),
+    }  # type: dict[str, tuple[bytes, ModuleDescriptor[IO[bytes]] | Callable[[IO[bytes]], IO[bytes]]]]
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -232,6 +296,12 @@ class Extractor(Generic[_P]):
         """Name of input PCAP file."""
         return self._ifnm
 
+    @property
+    def compression(self) -> 'Optional[str]':
+        """Compression format of input file, c.f. :attr:`__compression__`;
+        :obj:`None` if the input file is not compressed."""
+        return self._cmpr
+
     @property
     def output(self) -> 'str':
         """Name of output file.
@@ -258,6 +328,32 @@ class Extractor(Generic[_P]):
             return tuple(self._frame)
         raise UnsupportedCall("'Extractor(store=False)' object has no attribute 'frame'")
 
+    @property
+    def index(self) -> 'FrameIndex':
+        """Frame offset index of the input file.
+
+        The index will be built upon first access, and loaded from (or saved
+        to) the sidecar index file unless ``sidecar=False`` was given, c.f.
+        :meth:`FrameIndex.from_file <pcapkit.foundation.index.FrameIndex.from_file>`.
+
+        Raises:
+            UnsupportedCall: If the input file is a non-seekable stream, or
+                a compressed file.
+
+        """
+        if self._index is None:
+            if self._mfnm is not None:
+                raise UnsupportedCall(f'{self.__class__.__name__!r} object does not support '
+                                      'random access on merged inputs')
+            if self._cmpr is not None:
+                raise UnsupportedCall(f'{self.__class__.__name__!r} object does not support '
+                                      f'random access on {self._cmpr} compressed input')
+            if self._flag_s:
+                self._index = FrameIndex.from_file(self._ifnm, sidecar=self._sidx)
+            else:
+                self._index = FrameIndex.from_file(self._get_random_file(), sidecar=self._sidx)
+        return self._index
+
     @property
     def reassembly(self) -> 'ReassemblyData':
         """Frame record for reassembly.
@@ -412,9 +508,11 @@ class Extractor(Generic[_P]):
           - PCAP Format: :class:`pcapkit.foundation.engines.pcap.PCAP`
           - PCAP-NG Format: :class:`pcapkit.foundation.engines.pcapng.PCAPNG`
 
+        * Memory-mapped PCAP driver: :class:`pcapkit.foundation.engines.mmap.MMAP`
         * DPKT driver: :class:`pcapkit.foundation.engines.dpkt.DPKT`
         * Scapy driver: :class:`pcapkit.foundation.engines.scapy.Scapy`
         * PyShark driver: :class:`pcapkit.foundation.engines.pyshark.PyShark`
+        * Merged PCAP driver (for multiple input files): :class:`pcapkit.foundation.engines.merge.Merge`
 
         Warns:
             pcapkit.utilities.warnings.EngineWarning: If the extraction engine is not
@@ -423,6 +521,17 @@ class Extractor(Generic[_P]):
 
         :rtype: None
         """
+        if self._mfnm is not None:
+            if self._exnam not in ('default', 'pcapkit'):
+                warn(f'extraction engine {self._exnam} not supported with merged inputs; '
+                     'using merge engine instead', EngineWarning, stacklevel=stacklevel())
+            self._exeng = cast('Engine[_P]', Merge_Engine(self))
+            self._exeng.run()
+
+            # start iteration
+            self.record_frames()
+            return
+
         if self._exnam in self.__engine__:  # check if engine is supported
             eng = self.__engine__[self._exnam]
             if isinstance(eng, ModuleDescriptor):
@@ -490,8 +599,8 @@ class Extractor(Generic[_P]):
         The method will perform following processing:
 
         1. sanitise ``fin`` as the input PCAP filename; ``in.pcap`` as default value and
-           append ``.pcap`` extension if needed and ``extension`` is :data:`True`; as well
-           as test if the file exists;
+           append ``.pcap`` extension if needed and ``extension`` is :data:`True` (compressed
+           files, e.g., ``.pcap.gz``, are accepted as is); as well as test if the file exists;
         2. if ``nofile`` is :data:`True`, skips following processing;
         3. if ``fmt`` provided, then it presumes corresponding output file extension;
         4. if ``fout`` not provided, it presumes the output file name based on the presumptive
@@ -530,7 +639,8 @@ class Extractor(Generic[_P]):
         """
         if isinstance(fin, str):
             if extension:  # pylint: disable=else-if-used
-                ifnm = fin if os.path.splitext(fin)[1] in cls.PCAP_EXT else f'{fin}.pcap'
+                fext = os.path.splitext(fin)[1]
+                ifnm = fin if fext in cls.PCAP_EXT or fext in cls.COMPRESS_EXT else f'{fin}.pcap'
             else:
                 ifnm = fin
 
@@ -605,15 +715,28 @@ class Extractor(Generic[_P]):
             Under non-auto mode, i.e. :attr:`self._flag_a <Extractor._flag_a>` is
             :data:`False`, the method performs no action.
 
+            When multiple worker processes are requested, frames are parsed
+            in parallel by :meth:`_record_frames_parallel` instead.
+
         """
         if self._flag_a:
+            if self._nproc > 1 and self._check_parallel():
+                try:
+                    self._record_frames_parallel()
+                except KeyboardInterrupt:
+                    self._cleanup()
+                    raise
+
+                self._cleanup()
+                return
+
             while True:
                 try:
                     self._exeng.read_frame()
                 except (EOFError, StopIteration):
                     warn('EOF reached', ExtractionWarning, stacklevel=stacklevel())
 
-                    if self._flag_n:
+                    if self._flag_n and self._follow():
                         continue
 
                     # quit when EOF
@@ -624,26 +747,134 @@ class Extractor(Generic[_P]):
 
             self._cleanup()
 
+    @overload  # pragma: no cover
+    def get_frame(self, key: 'int') -> 'Frame | PCAPNG': ...
+    @overload  # pragma: no cover
+    def get_frame(self, key: 'slice') -> 'tuple[Frame | PCAPNG, ...]': ...
+
+    def get_frame(self, key: 'int | slice') -> 'Frame | PCAPNG | tuple[Frame | PCAPNG, ...]':
+        """Random access to frames.
+
+        The method seeks straight to the requested frame(s) through the
+        :attr:`frame offset index <index>` and parses only those frames,
+        regardless of the extraction progress and the ``store`` flag.
+
+        Args:
+            key: Frame index (0-based, as in :attr:`frame`) or a slice of frame
+                indices.
+
+        Returns:
+            Parsed frame, or a tuple of parsed frames for slices. The frames
+            are always parsed with the built-in PCAP/PCAP-NG protocols.
+
+        Raises:
+            IndexError: If the frame index is out of range.
+            UnsupportedCall: If the input file is a non-seekable stream.
+
+        Notes:
+            Frames returned by this method are *not* written to the output
+            file, nor are they recorded for reassembly and flow tracing.
+
+        """
+        index = self.index
+        if isinstance(key, slice):
+            numbers = range(*key.indices(len(index)))  # type: range | tuple[int]
+        else:
+            if key < 0:
+                key += len(index)
+            if not 0 <= key < len(index):
+                raise IndexError('frame index out of range')
+            numbers = (key,)
+
+        if self._flag_d and self._exnam in ('default', 'pcapkit', 'mmap'):
+            stored = self._frame
+        else:
+            stored = []
+
+        frames = []  # type: list[Frame | PCAPNG]
+        if self._flag_s:
+            file = open(self._ifnm, 'rb')  # pylint: disable=consider-using-with
+        else:
+            file = self._get_random_file()
+        seek_cur = file.tell()
+        try:
+            for number in numbers:
+                if number < len(stored):
+                    frames.append(cast('Frame | PCAPNG', stored[number]))
+                else:
+                    frames.append(self._read_frame_at(file, number, index.offset[number]))
+        finally:
+            if self._flag_s:
+                file.close()
+            else:
+                file.seek(seek_cur, os.SEEK_SET)
+
+        if isinstance(key, slice):
+            return tuple(frames)
+        return frames[0]
+
+    def frame_table(self) -> 'ndarray':
+        """Frame metadata table of the input file.
+
+        The table is built from the :attr:`frame offset index <index>`, i.e.,
+        only the record (or block) headers are scanned and no protocol is
+        decoded, c.f. :meth:`FrameIndex.to_numpy <pcapkit.foundation.index.FrameIndex.to_numpy>`.
+
+        Returns:
+            `NumPy`_ structured array with fields ``timestamp`` (in nanoseconds),
+            ``incl_len``, ``orig_len``, ``offset`` and ``interface``, one record
+            per frame.
+
+        Raises:
+            ModuleNotFound: If `NumPy`_ is not installed.
+            UnsupportedCall: If the input file is a non-seekable stream, or
+                a compressed file.
+
+        .. _NumPy: https://numpy.org
+
+        """
+        return self.index.to_numpy()
+
     ##########################################################################
     # Data models.
     ##########################################################################
 
+    @overload  # pragma: no cover
+    def __getitem__(self, key: 'int') -> 'Frame | PCAPNG': ...
+    @overload  # pragma: no cover
+    def __getitem__(self, key: 'slice') -> 'tuple[Frame | PCAPNG, ...]': ...
+
+    def __getitem__(self, key: 'int | slice') -> 'Frame | PCAPNG | tuple[Frame | PCAPNG, ...]':
+        """Random access to frames.
+
+        See Also:
+            :meth:`get_frame`
+
+        """
+        return self.get_frame(key)
+
     def __init__(self,
-                 fin: 'Optional[str | IO[bytes]]' = None, fout: 'Optional[str]' = None, format: 'Optional[Formats]' = None,     # basic settings # pylint: disable=redefined-builtin
+                 fin: 'Optional[str | IO[bytes] | Sequence[str]]' = None, fout: 'Optional[str]' = None,                         # basic settings # pylint: disable=line-too-long
+                 format: 'Optional[Formats]' = None,                                                                            # basic settings # pylint: disable=redefined-builtin
                  auto: 'bool' = True, extension: 'bool' = True, store: 'bool' = True,                                           # internal settings # pylint: disable=line-too-long
                  files: 'bool' = False, nofile: 'bool' = False, verbose: 'bool | VerboseHandler' = False,                       # output settings # pylint: disable=line-too-long
                  engine: 'Optional[Engines]' = None, layer: 'Optional[Layers]' = None, protocol: 'Optional[Protocols]' = None,  # extraction settings # pylint: disable=line-too-long
+                 lazy: 'bool' = False,                                                                                          # extraction settings # pylint: disable=line-too-long
                  reassembly: 'bool' = False, reasm_strict: 'bool' = True, reasm_store: 'bool' = True,                           # reassembly settings # pylint: disable=line-too-long
                  trace: 'bool' = False, trace_fout: 'Optional[str]' = None, trace_format: 'Optional[Formats]' = None,           # trace settings # pylint: disable=line-too-long
                  trace_byteorder: 'Literal["big", "little"]' = sys.byteorder, trace_nanosecond: 'bool' = False,                 # trace settings # pylint: disable=line-too-long
                  ip: 'bool' = False, ipv4: 'bool' = False, ipv6: 'bool' = False, tcp: 'bool' = False,                           # reassembly/trace settings # pylint: disable=line-too-long
                  buffer_size: 'int' = io.DEFAULT_BUFFER_SIZE, buffer_save: 'bool' = False, buffer_path: 'Optional[str]' = None, # buffer settings # pylint: disable=line-too-long
-                 no_eof: 'bool' = False) -> 'None':
+                 sidecar: 'bool | str' = True,                                                                                  # index settings # pylint: disable=line-too-long
+                 no_eof: 'bool' = False, idle_timeout: 'Optional[float]' = None,                                                # EOF settings # pylint: disable=line-too-long
+                 workers: 'Optional[int]' = None, decompress_workers: 'Optional[int]' = None) -> 'None':                         # parallel settings # pylint: disable=line-too-long
         """Initialise PCAP Reader.
 
         Args:
             fin: file name to be read or a binary IO object;
-                if file not exist, raise :exc:`FileNotFound`
+                if file not exist, raise :exc:`FileNotFound`; a :obj:`list`
+                or :obj:`tuple` of PCAP file names to extract them as one frame
+                stream merged by timestamp, c.f. :class:`~pcapkit.foundation.engines.merge.Merge`
             fout: file name to be written
             format: file format of output
 
@@ -660,6 +891,8 @@ class Extractor(Generic[_P]):
             engine: extraction engine to be used
             layer: extract til which layer
             protocol: extract til which protocol
+            lazy: if decode each layer of the frames lazily upon access
+                (for built-in engines only, and ignored under multi-process extraction)
 
             reassembly: if perform reassembly
             reasm_strict: if set strict flag for reassembly
@@ -681,7 +914,21 @@ class Extractor(Generic[_P]):
             buffer_save: if save buffer to file (for :class:`~pcapkit.corekit.io.SeekableReader` only)
             buffer_path: path name for buffer file if necessary (for :class:`~pcapkit.corekit.io.SeekableReader` only)
 
-            no_eof: if raise :exc:`EOFError` when EOF
+            sidecar: if load from and save to the sidecar index file when building
+                the :attr:`frame offset index <index>`; a :obj:`str` value to specify
+                the path to the sidecar file
+
+            no_eof: if not raise :exc:`EOFError` when EOF, but wait for new data instead,
+                e.g., to follow a live capture file as it grows
+            idle_timeout: seconds to wait for new data under no EOF mode before
+                stopping extraction; :obj:`None` to wait indefinitely
+
+            workers: number of worker processes for multi-process extraction
+                (only for PCAP files under auto mode; :obj:`None` or ``1`` to
+                extract in the current process)
+            decompress_workers: number of worker threads for decompression
+                (only for gzip compressed input files; :obj:`None` or ``1`` to
+                decompress in the current thread)
 
         Warns:
             pcapkit.utilities.warnings.FormatWarning: Warns under following circumstances:
@@ -697,6 +944,14 @@ class Extractor(Generic[_P]):
         if format is None:
             format = 'tree'
 
+        if isinstance(fin, (list, tuple)):
+            if not fin:
+                raise FileNotFound(2, 'No such file or directory', fin)
+            self._mfnm = tuple(self.make_name(name, extension=extension, nofile=True)[0] for name in fin)
+            fin = self._mfnm[0]
+        else:
+            self._mfnm = None
+
         ifnm, ofnm, fmt, oext, files = self.make_name(fin, fout, format, extension, files=files, nofile=nofile)
 
         self._ifnm = ifnm  # input file name
@@ -713,6 +968,18 @@ class Extractor(Generic[_P]):
         self._flag_v = False                 # verbose flag
         self._flag_s = isinstance(fin, str)  # input filename flag
         self._flag_n = no_eof                # no EOF flag
+        self._flag_l = lazy                  # lazy decoding flag
+
+        self._idle = idle_timeout  # idle timeout
+        self._fstat = None         # polling state
+
+        if self._mfnm is not None and no_eof:
+            warn("'no_eof=True' not supported with merged inputs; ignored",
+                 ExtractionWarning, stacklevel=stacklevel())
+            self._flag_n = False
+
+        self._nproc = max(workers or 1, 1)             # number of worker processes
+        self._nthrd = max(decompress_workers or 1, 1)  # number of decompression threads
 
         # verbose callback function
         if isinstance(verbose, bool):
@@ -730,12 +997,18 @@ class Extractor(Generic[_P]):
         self._frnum = 0   # frame number
         self._frame = []  # frame record
 
+        self._index = None    # frame offset index
+        self._sidx = sidecar  # sidecar index file
+        self._rhdr = None     # PCAP global header (random access)
+        self._rctx = None     # PCAP-NG section contexts (random access)
+
         self._ipv4 = ipv4 or ip  # IPv4 Reassembly
         self._ipv6 = ipv6 or ip  # IPv6 Reassembly
         self._tcp = tcp          # TCP Reassembly
 
         self._exptl = protocol or 'null'                              # extract til protocol
         self._exlyr = cast('Layers', (layer or 'none').lower())       # extract til layer
+        self._explan = self._compile_threshold()                      # termination plan
         self._exnam = cast('Engines', (engine or 'default').lower())  # extract using engine
 
         if reassembly:
@@ -803,6 +1076,14 @@ class Extractor(Generic[_P]):
             self._ifile = SeekableReader(self._ifile, buffer_size, buffer_save, buffer_path,
                                          stream_closing=not self._flag_s)
 
+        # NOTE: compressed input files are decompressed on the fly; since the
+        # decompressed stream can only be rewound by decompressing from the very
+        # beginning again, we treat it as a non-seekable stream
+        self._cmpr = self._check_compression(self._ifile)
+        if self._cmpr is not None:
+            self._ifile = SeekableReader(self._make_decompressor(self._ifile), buffer_size,
+                                         buffer_save, buffer_path, stream_closing=True)
+
         if not self._flag_q:
             output, ext = self.__output__[fmt]
             if ext is None:
@@ -850,7 +1131,7 @@ class Extractor(Generic[_P]):
             except (EOFError, StopIteration) as error:
                 warn('EOF reached', ExtractionWarning, stacklevel=stacklevel())
 
-                if self._flag_n:
+                if self._flag_n and self._follow():
                     continue
 
                 self._cleanup()
@@ -874,7 +1155,7 @@ class Extractor(Generic[_P]):
                 except (EOFError, StopIteration):
                     warn('EOF reached', ExtractionWarning, stacklevel=stacklevel())
 
-                    if self._flag_n:
+                    if self._flag_n and self._follow():
                         continue
 
                     self._cleanup()
@@ -913,3 +1194,324 @@ class Extractor(Generic[_P]):
         elif not self._flag_s:
             self._ifile.close()
         self._exeng.close()
+
+    def _follow(self) -> 'bool':
+        """Wait for new data of the input file under no EOF mode.
+
+        The method polls the input file with exponential backoff, c.f.
+        :attr:`FOLLOW_INTERVAL`, until its size changes. For inputs whose
+        size cannot be determined (e.g., pipes), the method returns after
+        a single polling interval. The backoff and the idle timeout are only
+        reset once new frames have been extracted.
+
+        Notes:
+            Under no EOF mode, the built-in engines rewind the input file to
+            the beginning of a partially written frame upon :exc:`EOFError`,
+            so that the frame is read again from its start once completed.
+
+        Returns:
+            :data:`False` if the idle timeout expired; :data:`True` otherwise.
+
+        """
+        now = time.monotonic()
+        if self._fstat is None or self._fstat[0] != self._frnum:
+            delay = self.FOLLOW_INTERVAL[0]
+            deadline = None if self._idle is None else now + self._idle
+        else:
+            _, delay, deadline = self._fstat
+
+        size = self._get_size()
+        while deadline is None or now < deadline:
+            time.sleep(delay if deadline is None else min(delay, deadline - now))
+            delay = min(delay * 2, self.FOLLOW_INTERVAL[1])
+            self._fstat = (self._frnum, delay, deadline)
+
+            if size is None or self._get_size() != size:
+                return True
+            now = time.monotonic()
+        return False
+
+    def _compile_threshold(self) -> 'Optional[Threshold]':
+        """Compile the ``layer`` and ``protocol`` thresholds.
+
+        The thresholds are compiled once per extraction and the resulting
+        plan is then passed down the decoding chain of every frame, c.f.
+        :class:`~pcapkit.corekit.threshold.Threshold`.
+
+        Returns:
+            Compiled termination plan, or :obj:`None` if no threshold is set.
+
+        """
+        if self._exlyr == 'none' and self._exptl == 'null':
+            return None
+        return Threshold(None if self._exlyr == 'none' else self._exlyr,
+                         None if self._exptl == 'null' else self._exptl)
+
+    def _get_size(self) -> 'Optional[int]':
+        """Get size of the input file.
+
+        Returns:
+            Size of the input file, or :obj:`None` if the input file
+            is not a regular file.
+
+        """
+        try:
+            stat_result = os.fstat(self._ifile.fileno())
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            return None
+        if stat.S_ISREG(stat_result.st_mode):
+            return stat_result.st_size
+        return None
+
+    def _check_compression(self, file: 'IO[bytes]') -> 'Optional[str]':
+        """Check compression format of the input file.
+
+        The compression format is detected by the magic number of the
+        input file, c.f. :attr:`__compression__`.
+
+        Args:
+            file: Binary IO object of the input file.
+
+        Returns:
+            Compression format name, or :obj:`None` if the input file
+            is not compressed.
+
+        """
+        magic = file.peek(8)
+        for name, (cmagic, _) in self.__compression__.items():
+            if magic.startswith(cmagic):
+                return name
+        return None
+
+    def _make_decompressor(self, file: 'IO[bytes]') -> 'IO[bytes]':
+        """Open decompressed stream of the input file.
+
+        Should :attr:`self._nthrd <pcapkit.foundation.extraction.Extractor._nthrd>`
+        be greater than ``1``, gzip compressed input files will be decompressed by
+        :class:`~pcapkit.corekit.io.ParallelGzipReader` with as many worker threads.
+
+        Args:
+            file: Compressed binary IO object of the input file.
+
+        Returns:
+            Decompressed binary IO object.
+
+        """
+        name = cast('str', self._cmpr)
+        if name == 'gzip' and self._nthrd > 1:
+            return ParallelGzipReader(file, self._nthrd, stream_closing=False)
+
+        magic, opener = self.__compression__[name]
+        if isinstance(opener, ModuleDescriptor):
+            opener = opener.klass
+            self.__compression__[name] = (magic, opener)  # update mapping upon import
+        return cast('Callable[[IO[bytes]], IO[bytes]]', opener)(file)
+
+    def _get_random_file(self) -> 'IO[bytes]':
+        """Get the input file object for random access.
+
+        Returns:
+            The input binary IO object, if it is seekable.
+
+        Raises:
+            UnsupportedCall: If the input file is a non-seekable stream.
+
+        """
+        if isinstance(self._ifile, SeekableReader) or self._ifile.closed:
+            raise UnsupportedCall(f'{self.__class__.__name__!r} object does not support '
+                                  'random access on non-seekable or closed input stream')
+        return self._ifile
+
+    def _read_frame_at(self, file: 'IO[bytes]', number: 'int', offset: 'int') -> 'Frame | PCAPNG':
+        """Parse a single frame at the given offset.
+
+        Args:
+            file: Seekable binary IO object of the input file.
+            number: Frame index (0-based).
+            offset: Offset of the frame in the input file.
+
+        Returns:
+            Parsed frame.
+
+        """
+        if self.index.format == 'pcap':
+            from pcapkit.protocols.misc.pcap.frame import Frame as P_Frame
+            from pcapkit.protocols.misc.pcap.header import Header as P_Header
+
+            if self._rhdr is None:
+                file.seek(0, os.SEEK_SET)
+                self._rhdr = P_Header(file)
+            header = self._rhdr
+
+            file.seek(offset, os.SEEK_SET)
+            return P_Frame(file, num=number+1, header=header.info, nanosecond=header.nanosecond,
+                           _plan=self._explan, _lazy=self._flag_l)
+
+        from pcapkit.protocols.misc.pcapng import PCAPNG as P_PCAPNG
+
+        if self._rctx is None:
+            self._rctx = self._read_pcapng_contexts(file)
+        for sct, (sct_offset, ctx) in reversed(list(enumerate(self._rctx, start=1))):
+            if sct_offset < offset:
+                break
+        else:
+            raise FormatError(f'PCAP-NG: no section header block before offset {offset}')
+
+        file.seek(offset, os.SEEK_SET)
+        return P_PCAPNG(file, num=number+1, sct=sct, ctx=ctx,
+                        _plan=self._explan, _lazy=self._flag_l, __packet__={
+                            'snaplen': ctx.interfaces[0].snaplen if ctx.interfaces else 0xFFFF_FFFF_FFFF_FFFF,
+                        })
+
+    @staticmethod
+    def _read_pcapng_contexts(file: 'IO[bytes]') -> 'list[tuple[int, PCAPNG_Context]]':
+        """Collect section contexts of a PCAP-NG file.
+
+        Only section header blocks and interface description blocks are
+        parsed; all other blocks are skipped by their block length.
+
+        Args:
+            file: Seekable binary IO object of the input file.
+
+        Returns:
+            List of section header block offsets and corresponding contexts.
+
+        """
+        from pcapkit.const.pcapng.block_type import BlockType as Enum_BlockType
+        from pcapkit.foundation.engines.pcapng import Context
+        from pcapkit.protocols.misc.pcapng import PCAPNG as P_PCAPNG
+
+        contexts = []  # type: list[tuple[int, PCAPNG_Context]]
+        endian = '<'
+
+        offset = file.seek(0, os.SEEK_SET)
+        while len(buf := file.read(12)) == 12:
+            if buf[:4] == PCAPNG_Engine.MAGIC_NUMBER[0]:
+                endian = '>' if buf[8:12] == b'\x1a\x2b\x3c\x4d' else '<'
+            block_type, block_len = struct.unpack(f'{endian}II', buf[:8])
+            if block_len < 12:
+                break
+
+            if block_type == Enum_BlockType.Section_Header_Block:
+                file.seek(offset, os.SEEK_SET)
+                shb = P_PCAPNG(file, num=0, sct=len(contexts)+1, ctx=None)
+                contexts.append((offset, Context(shb.info)))
+            elif block_type == Enum_BlockType.Interface_Description_Block and contexts:
+                file.seek(offset, os.SEEK_SET)
+                idb = P_PCAPNG(file, num=0, sct=len(contexts), ctx=contexts[-1][1])
+                contexts[-1][1].interfaces.append(idb.info)
+
+            offset = file.seek(offset + block_len, os.SEEK_SET)
+        return contexts
+
+    def _check_parallel(self) -> 'bool':
+        """Check if multi-process extraction is applicable.
+
+        Multi-process extraction is only available for uncompressed PCAP
+        files, given as file names and extracted with the built-in engines,
+        without EOF handling for live captures.
+
+        Warns:
+            pcapkit.utilities.warnings.ExtractionWarning: If multi-process
+                extraction is not applicable.
+
+        Returns:
+            If multi-process extraction is applicable.
+
+        """
+        if self._mfnm is not None:
+            reason = 'merged inputs'
+        elif not isinstance(self._exeng, PCAP_Engine):
+            reason = f'engine {self._exeng.name!r}'
+        elif not self._flag_s:
+            reason = 'non-file input'
+        elif self._cmpr is not None:
+            reason = f'{self._cmpr} compressed input'
+        elif self._flag_n:
+            reason = "'no_eof=True'"
+        else:
+            return True
+
+        warn(f'multi-process extraction not supported with {reason}; '
+             'using single process instead', ExtractionWarning, stacklevel=stacklevel())
+        return False
+
+    def _record_frames_parallel(self) -> 'None':
+        """Read packet frames with multiple worker processes.
+
+        The input file is split at frame boundaries through the
+        :attr:`frame offset index <index>` into chunks of at most
+        :attr:`PARALLEL_CHUNK_SIZE` frames, which are parsed by a
+        :class:`~concurrent.futures.ProcessPoolExecutor`, with at most two
+        chunks per worker in flight. The results are then recorded in their
+        original order by the engine, such that output, reassembly and flow
+        tracing are performed deterministically as in single process extraction.
+
+        Unless the frames are to be stored or passed to the verbose callback,
+        workers only return the frame summaries, c.f.
+        :meth:`PCAP.summarise_frame <pcapkit.foundation.engines.pcap.PCAP.summarise_frame>`,
+        rather than the parsed frames, which are much more expensive to pickle.
+
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        engine = cast('PCAP_Engine', self._exeng)
+        offset = self.index.offset
+
+        if self._flag_d or self._flag_v:
+            flags = None  # type: Optional[tuple[bool, bool, bool, bool, bool]]
+            record = engine.record_frame  # type: Callable[[Any], Any]
+        else:
+            flags = engine.summary_flags
+            record = engine.record_summary
+
+        size = self.PARALLEL_CHUNK_SIZE
+        pending = collections.deque()  # type: Deque[Future[tuple[Any, ...]]]
+        with ProcessPoolExecutor(max_workers=self._nproc) as executor:
+            for start in range(0, len(offset), size):
+                # NOTE: we limit the number of chunks in flight, such that
+                # parsed chunks do not pile up in memory
+                if len(pending) >= 2 * self._nproc:
+                    for result in pending.popleft().result():
+                        record(result)
+                pending.append(executor.submit(_extract_chunk, self._ifnm, start, offset[start:start+size],
+                                               self._explan, flags, engine.dlink))
+            while pending:
+                for result in pending.popleft().result():
+                    record(result)
+
+
+def _extract_chunk(fin: 'str', start: 'int', offset: 'array.array[int]', plan: 'Optional[Threshold]',
+                   flags: 'Optional[tuple[bool, bool, bool, bool, bool]]', data_link: 'Enum_LinkType') -> 'tuple[Frame, ...] | tuple[FrameSummary, ...]':
+    """Parse a chunk of frames in worker process.
+
+    Args:
+        fin: Input file name.
+        start: Index of first frame (0-based).
+        offset: Offsets of frames in the input file.
+        plan: Compiled termination plan.
+        flags: Post-processing flags, c.f.
+            :attr:`PCAP.summary_flags <pcapkit.foundation.engines.pcap.PCAP.summary_flags>`;
+            :obj:`None` to return the parsed frames instead of their summaries.
+        data_link: Data link layer protocol (from global header).
+
+    Returns:
+        Parsed frames, or their summaries, c.f.
+        :meth:`PCAP.summarise_frame <pcapkit.foundation.engines.pcap.PCAP.summarise_frame>`.
+
+    """
+    from pcapkit.protocols.misc.pcap.frame import Frame as P_Frame
+    from pcapkit.protocols.misc.pcap.header import Header as P_Header
+
+    results = []  # type: list[Any]
+    with open(fin, 'rb') as file:
+        header = P_Header(file)
+        for number, frame_offset in enumerate(offset, start=start+1):
+            file.seek(frame_offset, os.SEEK_SET)
+            frame = P_Frame(file, num=number, header=header.info,
+                            nanosecond=header.nanosecond, _plan=plan)
+            if flags is None:
+                results.append(frame)
+            else:
+                results.append(PCAP_Engine.summarise_frame(frame, flags, data_link=data_link))
+    return tuple(results)
@@ -0,0 +1,612 @@
+# -*- coding: utf-8 -*-
+"""Frame Offset Index
+========================
+
+.. module:: pcapkit.foundation.index
+
+:mod:`pcapkit.foundation.index` contains :class:`~pcapkit.foundation.index.FrameIndex`
+only, which implements a compact index of frame offsets, timestamps and
+lengths of a PCAP or PCAP-NG capture file.
+
+The index is built by scanning the record headers (for PCAP) or the block
+headers (for PCAP-NG) only, i.e., no protocol is decoded during the scan.
+Once built, the index may be saved as a *sidecar* file next to the capture
+file and it will be reused as long as the size and modification time of the
+capture file remain unchanged. It may also be converted to a `NumPy`_
+structured array for vectorised analysis, c.f. :meth:`FrameIndex.to_numpy`.
+
+.. _NumPy: https://numpy.org
+
+"""
+import array
+import io
+import os
+import struct
+import sys
+from typing import TYPE_CHECKING, cast
+
+from pcapkit.corekit.infoclass import Info, info_final
+from pcapkit.utilities.compat import ModuleNotFoundError  # pylint: disable=redefined-builtin
+from pcapkit.utilities.exceptions import FormatError, ModuleNotFound, stacklevel
+from pcapkit.utilities.warnings import FileWarning, warn
+
+__all__ = ['FrameIndex']
+
+if TYPE_CHECKING:
+    from typing import IO, Iterator, Optional
+
+    from numpy import ndarray
+    from typing_extensions import Literal
+
+#: Magic number of the sidecar index file.
+INDEX_MAGIC = b'PCAPKIDX'
+#: Version of the sidecar index file format.
+INDEX_VERSION = 3
+#: Header of the sidecar index file, i.e., magic number, version, capture
+#: format, capture size, capture modification time (in nanoseconds) and
+#: number of frames.
+INDEX_HEADER = struct.Struct('<8sHHQqQ')
+
+#: Default suffix of the sidecar index file.
+INDEX_SUFFIX = '.pcapidx'
+
+#: Sentinel timestamp for frames without timestamp, e.g., PCAP-NG simple packet blocks.
+NO_TIMESTAMP = -(1 << 63)
+
+#: Size of bulk reads when scanning PCAP record headers.
+SCAN_BUFFER_SIZE = 1 << 20
+
+#: Field layout of the NumPy structured array, c.f. :meth:`FrameIndex.to_numpy`.
+TABLE_DTYPE = [
+    ('timestamp', '<i8'),
+    ('incl_len', '<u4'),
+    ('orig_len', '<u4'),
+    ('offset', '<u8'),
+    ('interface', '<u4'),
+]
+
+#: PCAP magic numbers, mapped to byte order and nanosecond flag.
+PCAP_MAGIC = {
+    b'\xa1\xb2\x3c\x4d': ('>', True),
+    b'\xa1\xb2\xc3\xd4': ('>', False),
+    b'\x4d\x3c\xb2\xa1': ('<', True),
+    b'\xd4\xc3\xb2\xa1': ('<', False),
+}
+#: PCAP-NG magic number (block type of section header block).
+PCAPNG_MAGIC = b'\x0a\x0d\x0d\x0a'
+
+#: Capture format codes as saved in the sidecar index file.
+FORMAT_CODE = {'pcap': 1, 'pcapng': 2}
+
+
+@info_final
+class Entry(Info):
+    """Frame index entry."""
+
+    #: Frame number (1-based).
+    number: 'int'
+    #: Offset of the frame record (or packet block) in the capture file.
+    offset: 'int'
+    #: Timestamp in nanoseconds since UNIX-Epoch, if any.
+    timestamp: 'Optional[int]'
+    #: Number of octets of packet saved in file.
+    incl_len: 'int'
+    #: Actual length of packet.
+    orig_len: 'int'
+    #: Interface ID (always ``0`` for PCAP).
+    interface: 'int'
+
+    if TYPE_CHECKING:
+        def __init__(self, number: 'int', offset: 'int', timestamp: 'Optional[int]',
+                     incl_len: 'int', orig_len: 'int', interface: 'int') -> 'None': ...  # pylint: disable=unused-argument,super-init-not-called,multiple-statements,line-too-long,redefined-builtin
+
+
+class FrameIndex:
+    """Frame offset index.
+
+    The index is stored column-wise in :class:`array.array` objects, i.e.,
+    :attr:`offset` (``Q``), :attr:`timestamp` (``q``, in nanoseconds since
+    UNIX-Epoch), :attr:`incl_len` (``I``), :attr:`orig_len` (``I``) and
+    :attr:`interface` (``I``).
+    Frames without timestamp, i.e., PCAP-NG simple packet blocks, are
+    recorded with :data:`NO_TIMESTAMP` in :attr:`timestamp`.
+
+    Args:
+        format: Capture file format.
+        size: Size of the capture file.
+        mtime: Modification time of the capture file (in nanoseconds).
+
+    """
+
+    if TYPE_CHECKING:
+        #: Capture file format.
+        _format: 'Literal["pcap", "pcapng"]'
+        #: Size of the capture file.
+        _size: 'int'
+        #: Modification time of the capture file (in nanoseconds).
+        _mtime: 'int'
+
+        #: Offsets of frames.
+        offset: 'array.array[int]'
+        #: Timestamps of frames (in nanoseconds).
+        timestamp: 'array.array[int]'
+        #: Captured lengths of frames.
+        incl_len: 'array.array[int]'
+        #: Original lengths of frames.
+        orig_len: 'array.array[int]'
+        #: Interface IDs of frames.
+        interface: 'array.array[int]'
+
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def format(self) -> 'Literal["pcap", "pcapng"]':
+        """Capture file format."""
+        return self._format
+
+    @property
+    def size(self) -> 'int':
+        """Size of the capture file."""
+        return self._size
+
+    @property
+    def mtime(self) -> 'int':
+        """Modification time of the capture file (in nanoseconds)."""
+        return self._mtime
+
+    @property
+    def length(self) -> 'int':
+        """Number of frames."""
+        return len(self.offset)
+
+    @property
+    def time_range(self) -> 'Optional[tuple[int, int]]':
+        """Earliest and latest timestamps (in nanoseconds), if any frames with timestamp."""
+        timestamps = [timestamp for timestamp in self.timestamp if timestamp != NO_TIMESTAMP]
+        if not timestamps:
+            return None
+        return min(timestamps), max(timestamps)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    @classmethod
+    def from_file(cls, fin: 'str | IO[bytes]', *, sidecar: 'bool | str' = True,
+                  rebuild: 'bool' = False) -> 'FrameIndex':
+        """Load or build the frame index of a capture file.
+
+        Args:
+            fin: Capture file name or a seekable binary IO object.
+            sidecar: If load from and save to the sidecar index file; a
+                :obj:`str` value to specify the path to the sidecar file.
+            rebuild: If ignore the existing sidecar index file.
+
+        Returns:
+            Frame index of the capture file.
+
+        Notes:
+            The sidecar index file is only available when ``fin`` is a file
+            name, or a binary IO object with a :attr:`~io.FileIO.name`
+            attribute referring to an existing file.
+
+        """
+        path = fin if isinstance(fin, str) else getattr(fin, 'name', None)
+        if not isinstance(path, str) or not os.path.isfile(path):
+            sidecar = False
+
+        if sidecar:
+            path = cast('str', path)
+            side = sidecar if isinstance(sidecar, str) else cls.sidecar_path(path)
+            if not rebuild and (index := cls.load(side, capture=path)) is not None:
+                return index
+
+        if isinstance(fin, str):
+            with open(fin, 'rb') as file:
+                index = cls.scan(file)
+        else:
+            index = cls.scan(fin)
+
+        if sidecar:
+            try:
+                index.dump(side)
+            except OSError as error:
+                warn(f'cannot save sidecar index file {side!r}: {error}',
+                     FileWarning, stacklevel=stacklevel())
+        return index
+
+    @classmethod
+    def scan(cls, file: 'IO[bytes]') -> 'FrameIndex':
+        """Scan the capture file for frame offsets.
+
+        The current stream position of ``file`` is restored after scanning.
+
+        Args:
+            file: Seekable binary IO object of the capture file.
+
+        Returns:
+            Frame index of the capture file.
+
+        Raises:
+            FormatError: If the capture file format is unknown.
+
+        """
+        seek_cur = file.tell()
+        try:
+            file.seek(0, io.SEEK_SET)
+            magic = file.read(4)
+            file.seek(0, io.SEEK_SET)
+
+            try:
+                stat = os.fstat(file.fileno())
+                size, mtime = stat.st_size, stat.st_mtime_ns
+            except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+                size, mtime = file.seek(0, io.SEEK_END), 0
+                file.seek(0, io.SEEK_SET)
+
+            if magic in PCAP_MAGIC:
+                index = cls('pcap', size, mtime)
+                index._scan_pcap(file, *PCAP_MAGIC[magic])
+            elif magic == PCAPNG_MAGIC:
+                index = cls('pcapng', size, mtime)
+                index._scan_pcapng(file)
+            else:
+                raise FormatError(f'unknown file format: {magic!r}')
+        finally:
+            file.seek(seek_cur, io.SEEK_SET)
+        return index
+
+    @classmethod
+    def load(cls, path: 'str', *, capture: 'Optional[str]' = None) -> 'Optional[FrameIndex]':
+        """Load frame index from a sidecar index file.
+
+        Args:
+            path: Path to the sidecar index file.
+            capture: Path to the capture file; if provided, the index will only
+                be returned when the capture file size and modification time
+                match those recorded in the index.
+
+        Returns:
+            Loaded frame index, or :obj:`None` if the sidecar index file does
+            not exist or is stale/invalid.
+
+        """
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        if len(data) < INDEX_HEADER.size:
+            return None
+        magic, version, fmt_code, size, mtime, count = INDEX_HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            return None
+
+        fmt = {code: name for name, code in FORMAT_CODE.items()}.get(fmt_code)
+        if fmt is None:
+            return None
+
+        if capture is not None:
+            try:
+                stat = os.stat(capture)
+            except OSError:
+                return None
+            if stat.st_size != size or stat.st_mtime_ns != mtime:
+                return None
+
+        index = cls(fmt, size, mtime)
+        if len(data) != INDEX_HEADER.size + count * index._itemsize():
+            return None
+
+        offset = INDEX_HEADER.size
+        for column in index._columns():
+            length = count * column.itemsize
+            column.frombytes(data[offset:offset+length])
+            offset += length
+
+        if sys.byteorder != 'little':
+            for column in index._columns():
+                column.byteswap()
+        return index
+
+    def dump(self, path: 'str') -> 'None':
+        """Save frame index to a sidecar index file.
+
+        Args:
+            path: Path to the sidecar index file.
+
+        """
+        with open(path, 'wb') as file:
+            file.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, FORMAT_CODE[self._format],
+                                         self._size, self._mtime, self.length))
+            for column in self._columns():
+                if sys.byteorder != 'little':
+                    column = array.array(column.typecode, column)
+                    column.byteswap()
+                file.write(column.tobytes())
+
+    def to_numpy(self) -> 'ndarray':
+        """Convert the frame index to a NumPy structured array.
+
+        The array has one record per frame, with the fields as described in
+        :data:`TABLE_DTYPE`, i.e., ``timestamp`` (in nanoseconds, or
+        :data:`NO_TIMESTAMP` if absent), ``incl_len``, ``orig_len``,
+        ``offset`` and ``interface``. Each field is filled from the
+        corresponding index column in bulk.
+
+        Returns:
+            Structured array of frame metadata.
+
+        Raises:
+            ModuleNotFound: If `NumPy`_ is not installed.
+
+        """
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ModuleNotFoundError:
+            raise ModuleNotFound("No module named 'numpy'", name='numpy') from None
+
+        table = numpy.empty(len(self.offset), dtype=TABLE_DTYPE)
+        for name, column in zip(('offset', 'timestamp', 'incl_len', 'orig_len', 'interface'), self._columns()):
+            table[name] = numpy.frombuffer(column, dtype=column.typecode)
+        return table
+
+    @staticmethod
+    def iter_pcap(file: 'IO[bytes]', endian: 'str', nanosecond: 'bool',
+                  size: 'int') -> 'Iterator[tuple[int, int, int, int]]':
+        """Iterate over PCAP record headers.
+
+        The file is read in bulk of :data:`SCAN_BUFFER_SIZE` octets, and the
+        record headers are unpacked from the buffer in place. Only frames
+        larger than the buffer cause a seek past their packet data. As the
+        file is always repositioned before reading, it may be shared with
+        other readers between iterations.
+
+        Args:
+            file: Seekable binary IO object of the PCAP file.
+            endian: Struct byte order character.
+            nanosecond: Nanosecond-resolution timestamp flag.
+            size: Size of the PCAP file; a truncated frame at the end of file
+                is not yielded.
+
+        Yields:
+            Offset of the frame record, timestamp (in nanoseconds since
+            UNIX-Epoch), captured length and original length of the frame.
+
+        """
+        record = struct.Struct(f'{endian}IIII')
+        scale = 1 if nanosecond else 1_000
+
+        buf, base = b'', 24  # buffer and its offset in file
+        offset = 24
+        while True:
+            ptr = offset - base
+            if ptr + 16 > len(buf):
+                file.seek(offset, io.SEEK_SET)
+                buf, base, ptr = file.read(SCAN_BUFFER_SIZE), offset, 0
+                if len(buf) < 16:
+                    break
+
+            ts_sec, ts_frac, incl_len, orig_len = record.unpack_from(buf, ptr)
+            if offset + 16 + incl_len > size:
+                # truncated frame at the end of file
+                break
+
+            yield offset, ts_sec * 1_000_000_000 + ts_frac * scale, incl_len, orig_len
+            offset += 16 + incl_len
+
+    @staticmethod
+    def sidecar_path(path: 'str') -> 'str':
+        """Return the default sidecar index file path of a capture file.
+
+        Args:
+            path: Path to the capture file.
+
+        Returns:
+            Path to the sidecar index file.
+
+        """
+        return f'{path}{INDEX_SUFFIX}'
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, format: 'Literal["pcap", "pcapng"]', size: 'int' = 0,  # pylint: disable=redefined-builtin
+                 mtime: 'int' = 0) -> 'None':
+        self._format = format
+        self._size = size
+        self._mtime = mtime
+
+        self.offset = array.array('Q')
+        self.timestamp = array.array('q')
+        self.incl_len = array.array('I')
+        self.orig_len = array.array('I')
+        self.interface = array.array('I')
+
+    def __len__(self) -> 'int':
+        return len(self.offset)
+
+    def __getitem__(self, key: 'int') -> 'Entry':
+        if key < 0:
+            key += len(self.offset)
+        if not 0 <= key < len(self.offset):
+            raise IndexError('frame index out of range')
+        return Entry(
+            number=key + 1,
+            offset=self.offset[key],
+            timestamp=None if (timestamp := self.timestamp[key]) == NO_TIMESTAMP else timestamp,
+            incl_len=self.incl_len[key],
+            orig_len=self.orig_len[key],
+            interface=self.interface[key],
+        )
+
+    def __iter__(self) -> 'Iterator[Entry]':
+        for key in range(len(self.offset)):
+            yield self[key]
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}(format={self._format!r}, length={self.length})'
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _columns(self) -> 'tuple[array.array[int], ...]':
+        """Return index columns in serialisation order."""
+        return self.offset, self.timestamp, self.incl_len, self.orig_len, self.interface
+
+    def _itemsize(self) -> 'int':
+        """Return total item size of a frame entry."""
+        return sum(column.itemsize for column in self._columns())
+
+    def _append(self, offset: 'int', timestamp: 'int', incl_len: 'int', orig_len: 'int',
+                interface: 'int' = 0) -> 'None':
+        """Append a frame entry to the index."""
+        self.offset.append(offset)
+        self.timestamp.append(timestamp)
+        self.incl_len.append(incl_len)
+        self.orig_len.append(orig_len)
+        self.interface.append(interface)
+
+    def _scan_pcap(self, file: 'IO[bytes]', endian: 'str', nanosecond: 'bool') -> 'None':
+        """Scan PCAP record headers.
+
+        Args:
+            file: Binary IO object positioned at the beginning of the file.
+            endian: Struct byte order character.
+            nanosecond: Nanosecond-resolution timestamp flag.
+
+        See Also:
+            :meth:`iter_pcap`
+
+        """
+        for record in self.iter_pcap(file, endian, nanosecond, self._size):
+            self._append(*record)
+
+    def _scan_pcapng(self, file: 'IO[bytes]') -> 'None':
+        """Scan PCAP-NG block headers.
+
+        Only packet blocks, i.e., enhanced packet blocks, simple packet blocks
+        and (obsolete) packet blocks, are recorded as frames. Interface
+        description blocks are inspected for the snapshot length and the
+        ``if_tsresol`` and ``if_tsoffset`` options to compute the timestamps.
+
+        Args:
+            file: Binary IO object positioned at the beginning of the file.
+
+        Raises:
+            FormatError: If the byte order magic is invalid.
+
+        """
+        endian = '<'
+        # interface (snaplen, tsresol, tsoffset) of current section
+        interfaces = []  # type: list[tuple[int, tuple[bool, int], int]]
+
+        offset = 0
+        while True:
+            buf = file.read(12)
+            if len(buf) < 8:
+                break
+
+            if buf[:4] == PCAPNG_MAGIC:
+                if buf[8:12] == b'\x1a\x2b\x3c\x4d':
+                    endian = '>'
+                elif buf[8:12] == b'\x4d\x3c\x2b\x1a':
+                    endian = '<'
+                else:
+                    raise FormatError(f'PCAP-NG: [SHB] invalid byte order magic: {buf[8:12]!r}')
+                interfaces = []
+            block_type, block_len = struct.unpack(f'{endian}II', buf[:8])
+            if block_len < 12 or offset + block_len > self._size:
+                # truncated or malformed block at the end of file
+                break
+
+            # NOTE: we only read the leading fields of packet blocks, since
+            # the packet data is of no interest for the index
+            if block_type == 0x00000001:  # interface description block
+                body = buf[8:] + file.read(block_len - 16)
+            elif block_type in (0x00000002, 0x00000006):  # packet blocks
+                body = buf[8:] + file.read(16)
+            else:
+                body = buf[8:]
+            file.seek(offset + block_len, io.SEEK_SET)
+
+            if block_type == 0x00000001:  # interface description block
+                _, snaplen = struct.unpack_from(f'{endian}HxxI', body)
+                interfaces.append((snaplen, *self._pcapng_interface_options(body[8:], endian)))
+            elif block_type == 0x00000006:  # enhanced packet block
+                iface, ts_high, ts_low, cap_len, orig_len = struct.unpack_from(f'{endian}IIIII', body)
+                self._append(offset, self._pcapng_timestamp(interfaces, iface, (ts_high << 32) | ts_low),
+                             cap_len, orig_len, iface)
+            elif block_type == 0x00000002:  # packet block (obsolete)
+                iface, _, ts_high, ts_low, cap_len, orig_len = struct.unpack_from(f'{endian}HHIIII', body)
+                self._append(offset, self._pcapng_timestamp(interfaces, iface, (ts_high << 32) | ts_low),
+                             cap_len, orig_len, iface)
+            elif block_type == 0x00000003:  # simple packet block
+                orig_len, = struct.unpack_from(f'{endian}I', body)
+                snaplen = interfaces[0][0] if interfaces and interfaces[0][0] else orig_len
+                # NOTE: simple packet blocks carry no timestamp
+                self._append(offset, NO_TIMESTAMP, min(orig_len, snaplen), orig_len)
+
+            offset += block_len
+
+    @staticmethod
+    def _pcapng_interface_options(options: 'bytes', endian: 'str') -> 'tuple[tuple[bool, int], int]':
+        """Extract timestamp options of an interface description block.
+
+        Args:
+            options: Options of the interface description block.
+            endian: Struct byte order character.
+
+        Returns:
+            A tuple of ``if_tsresol`` (as a flag whether the resolution is a
+            power of 2 and the exponent) and ``if_tsoffset`` (in seconds).
+
+        """
+        tsresol, tsoffset = (False, 6), 0
+
+        ptr = 0
+        while ptr + 4 <= len(options):
+            code, length = struct.unpack_from(f'{endian}HH', options, ptr)
+            ptr += 4
+            if code == 0:  # opt_endofopt
+                break
+            if code == 9 and length >= 1:  # if_tsresol
+                tsresol = (bool(options[ptr] & 0x80), options[ptr] & 0x7F)
+            elif code == 14 and length >= 8:  # if_tsoffset
+                tsoffset, = struct.unpack_from(f'{endian}q', options, ptr)
+            ptr += (length + 3) & ~3
+        return tsresol, tsoffset
+
+    @staticmethod
+    def _pcapng_timestamp(interfaces: 'list[tuple[int, tuple[bool, int], int]]',
+                          iface: 'int', timestamp: 'int') -> 'int':
+        """Convert a PCAP-NG timestamp to nanoseconds since UNIX-Epoch.
+
+        Args:
+            interfaces: Interface descriptions of current section.
+            iface: Interface ID.
+            timestamp: Raw timestamp of the packet block.
+
+        Returns:
+            Timestamp in nanoseconds.
+
+        Raises:
+            FormatError: If the interface ID is invalid.
+
+        """
+        if iface >= len(interfaces):
+            raise FormatError(f'PCAP-NG: invalid interface ID: {iface}')
+        _, (power2, exponent), tsoffset = interfaces[iface]
+
+        if power2:
+            nanos = (timestamp * 1_000_000_000) >> exponent
+        elif exponent <= 9:
+            nanos = timestamp * 10 ** (9 - exponent)
+        else:
+            nanos = timestamp // 10 ** (exponent - 9)
+        return nanos + tsoffset * 1_000_000_000
@@ -12,11 +12,11 @@ designed to help and simplify the usage of :mod:`pcapkit`.
 """
 
 from pcapkit.interface.core import (APP, DPKT, INET, JSON, LINK, PCAP, PLIST, RAW, TRANS, TREE,
-                                    PCAPKit, PyShark, Scapy, extract, reassemble, trace)
+                                    MMAP, PCAPKit, PyShark, Scapy, extract, reassemble, trace)
 
 __all__ = [
     'extract', 'reassemble', 'trace',                       # interface functions
     'TREE', 'JSON', 'PLIST', 'PCAP',                        # format macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # layer macros
-    'DPKT', 'Scapy', 'PyShark', 'PCAPKit',                  # engine macros
+    'DPKT', 'Scapy', 'PyShark', 'PCAPKit', 'MMAP',          # engine macros
 ]
@@ -22,7 +22,7 @@ from pcapkit.protocols.protocol import ProtocolBase as Protocol
 from pcapkit.utilities.exceptions import FormatError
 
 if TYPE_CHECKING:
-    from typing import IO, Optional, Type
+    from typing import IO, Optional, Sequence, Type
 
     from typing_extensions import Literal
 
@@ -34,7 +34,7 @@ __all__ = [
     'extract', 'reassemble', 'trace',                       # interface functions
     'TREE', 'JSON', 'PLIST', 'PCAP',                        # format macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # layer macros
-    'DPKT', 'Scapy', 'PyShark', 'PCAPKit',                  # engine macros
+    'DPKT', 'Scapy', 'PyShark', 'PCAPKit', 'MMAP',          # engine macros
 ]
 
 # output file formats
@@ -55,24 +55,30 @@ DPKT = 'dpkt'
 Scapy = 'scapy'
 PCAPKit = 'default'
 PyShark = 'pyshark'
+MMAP = 'mmap'
 
 
-def extract(fin: 'Optional[str | IO[bytes]]' = None, fout: 'Optional[str]' = None, format: 'Optional[Formats]' = None,     # basic settings # pylint: disable=redefined-builtin
+def extract(fin: 'Optional[str | IO[bytes] | Sequence[str]]' = None, fout: 'Optional[str]' = None,                         # basic settings # pylint: disable=line-too-long
+            format: 'Optional[Formats]' = None,                                                                            # basic settings # pylint: disable=redefined-builtin
             auto: 'bool' = True, extension: 'bool' = True, store: 'bool' = True,                                           # internal settings # pylint: disable=line-too-long
             files: 'bool' = False, nofile: 'bool' = False, verbose: 'bool | VerboseHandler' = False,                       # output settings # pylint: disable=line-too-long
             engine: 'Optional[Engines]' = None, layer: 'Optional[Layers] | Type[Protocol]' = None,                         # extraction settings # pylint: disable=line-too-long
-            protocol: 'Optional[Protocols]' = None,                                                                        # extraction settings # pylint: disable=line-too-long
+            protocol: 'Optional[Protocols]' = None, lazy: 'bool' = False,                                                  # extraction settings # pylint: disable=line-too-long
             reassembly: 'bool' = False, reasm_strict: 'bool' = True, reasm_store: 'bool' = True,                           # reassembly settings # pylint: disable=line-too-long
             trace: 'bool' = False, trace_fout: 'Optional[str]' = None, trace_format: 'Optional[Formats]' = None,           # trace settings # pylint: disable=line-too-long
             trace_byteorder: 'Literal["big", "little"]' = sys.byteorder, trace_nanosecond: 'bool' = False,                 # trace settings # pylint: disable=line-too-long
             ip: 'bool' = False, ipv4: 'bool' = False, ipv6: 'bool' = False, tcp: 'bool' = False,                           # reassembly/trace settings # pylint: disable=line-too-long
             buffer_size: 'int' = io.DEFAULT_BUFFER_SIZE, buffer_save: 'bool' = False, buffer_path: 'Optional[str]' = None, # buffer settings # pylint: disable=line-too-long
-            no_eof: 'bool' = False) -> 'Extractor':
+            sidecar: 'bool | str' = True,                                                                                  # index settings # pylint: disable=line-too-long
+            no_eof: 'bool' = False, idle_timeout: 'Optional[float]' = None,                                                # EOF settings # pylint: disable=line-too-long
+            workers: 'Optional[int]' = None, decompress_workers: 'Optional[int]' = None) -> 'Extractor':                    # parallel settings # pylint: disable=line-too-long
     """Extract a PCAP file.
 
     Arguments:
         fin: file name to be read or a binary IO object;
-            if file not exist, raise :exc:`FileNotFound`
+            if file not exist, raise :exc:`FileNotFound`; a :obj:`list`
+            or :obj:`tuple` of PCAP file names to extract them as one frame
+            stream merged by timestamp
         fout: file name to be written
         format: file format of output
 
@@ -89,6 +95,7 @@ def extract(fin: 'Optional[str | IO[bytes]]' = None, fout: 'Optional[str]' = Non
         engine: extraction engine to be used
         layer: extract til which layer
         protocol: extract til which protocol
+        lazy: if decode each layer of the frames lazily upon access
 
         reassembly: if perform reassembly
         reasm_strict: if set strict flag for reassembly
@@ -110,7 +117,18 @@ def extract(fin: 'Optional[str | IO[bytes]]' = None, fout: 'Optional[str]' = Non
         buffer_save: if save buffer to file (for :class:`~pcapkit.corekit.io.SeekableReader` only)
         buffer_path: path name for buffer file if necessary (for :class:`~pcapkit.corekit.io.SeekableReader` only)
 
-        no_eof: if not raise :exc:`EOFError` when reach EOF
+        sidecar: if load from and save to the sidecar index file when building
+            the frame offset index; a :obj:`str` value to specify the path to
+            the sidecar file
+
+        no_eof: if not raise :exc:`EOFError` when reach EOF, but wait for new data instead
+        idle_timeout: seconds to wait for new data under no EOF mode before stopping
+            extraction; :obj:`None` to wait indefinitely
+
+        workers: number of worker processes for multi-process extraction
+            (only for PCAP files under auto mode)
+        decompress_workers: number of worker threads for decompression
+            (only for gzip compressed input files)
 
     Returns:
         An :class:`~pcapkit.foundation.extraction.Extractor` object.
@@ -122,13 +140,14 @@ def extract(fin: 'Optional[str | IO[bytes]]' = None, fout: 'Optional[str]' = Non
     return Extractor(fin=fin, fout=fout, format=format,
                      store=store, files=files, nofile=nofile,
                      auto=auto, verbose=verbose, extension=extension,
-                     engine=engine, layer=layer, protocol=protocol,  # type: ignore[arg-type]
+                     engine=engine, layer=layer, protocol=protocol, lazy=lazy,  # type: ignore[arg-type]
                      ip=ip, ipv4=ipv4, ipv6=ipv6, tcp=tcp,
                      reassembly=reassembly, reasm_store=reasm_store, reasm_strict=reasm_strict,
                      trace=trace, trace_fout=trace_fout, trace_format=trace_format,
                      trace_byteorder=trace_byteorder, trace_nanosecond=trace_nanosecond,
-                     buffer_size=buffer_size, buffer_path=buffer_path, buffer_save=buffer_save,
-                     no_eof=no_eof)
+                     buffer_size=buffer_size, buffer_path=buffer_path, buffer_save=buffer_save, sidecar=sidecar,
+                     no_eof=no_eof, idle_timeout=idle_timeout, workers=workers,
+                     decompress_workers=decompress_workers)
 
 
 def reassemble(protocol: 'str | Type[Protocol]', strict: 'bool' = False) -> 'Reassembly':
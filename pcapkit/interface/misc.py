@@ -27,7 +27,7 @@ if TYPE_CHECKING:
 
     ByteOrder = Literal['little', 'big']
     Formats = Literal['pcap', 'json', 'tree', 'plist']
-    Engines = Literal['default', 'pcapkit', 'dpkt', 'scapy', 'pyshark']
+    Engines = Literal['default', 'pcapkit', 'mmap', 'dpkt', 'scapy', 'pyshark']
 
 __all__ = ['follow_tcp_stream']
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """base class for data models"""
 
+import contextlib
 from typing import TYPE_CHECKING
 
 from pcapkit.corekit.infoclass import Info
@@ -8,18 +9,131 @@ from pcapkit.corekit.infoclass import Info
 __all__ = ['Data']
 
 if TYPE_CHECKING:
-    from typing import Type
+    from typing import Any, Callable, Iterator, Type
 
     from pcapkit.protocols.protocol import ProtocolBase as Protocol
 
 
 class Data(Info):
-    """Base class for data models."""
+    """Base class for data models.
 
-    __excluded__ = ['__next_name__', '__next_type__']
+    Note:
+        When the protocol is decoded lazily, the fields of the next layer
+        are yet to be decoded upon construction. Such fields will be resolved
+        once accessed, or once the data model is iterated or converted.
+
+        Likewise, costly fields of the current layer (e.g., timestamps) may
+        be deferred with a loader until they are first accessed.
+
+    """
+
+    __excluded__ = ['__next_name__', '__next_type__', '__next_load__', '__field_load__']
 
     if TYPE_CHECKING:
         #: Next field name, i.e., the name of the payload field.
         __next_name__: 'str'
         #: Next field type, i.e., the type of the payload field.
         __next_type__: 'Type[Protocol]'
+        #: Loader of the deferred fields under lazy mode.
+        __next_load__: 'Callable[[], None]'
+        #: Loader of the deferred fields of the current layer.
+        __field_load__: 'Callable[[], dict[str, Any]]'
+
+    def __load__(self) -> 'bool':
+        """Resolve the deferred fields under lazy mode.
+
+        Returns:
+            Whether there are any deferred fields resolved.
+
+        """
+        # NOTE: The loaders are always stored in the ``__dict__`` of the
+        # instance, which might not exist if the class has no such fields.
+        if not self.__extended__:
+            return False
+
+        loader = self.__dict__.pop('__field_load__', None)
+        if loader is not None:
+            self.__update__(loader())
+            self.__reorder__()
+            return True
+
+        loader = self.__dict__.pop('__next_load__', None)
+        if loader is None:
+            return False
+        loader()
+
+        # NOTE: The ``packet`` field is injected upon construction of the
+        # protocol, i.e., before the deferred fields are resolved. We move it
+        # back to the end to keep the same field order as eager decoding.
+        if 'packet' in self.__dict__:
+            self.__dict__['packet'] = self.__dict__.pop('packet')
+        return True
+
+    def __reorder__(self) -> 'None':
+        """Reorder the fields as declared in the data model.
+
+        The deferred fields of the current layer are appended upon being
+        resolved. We move the declared fields back to the front, in the
+        same order as the generated ``__init__`` method, such that the
+        field order is the same as eager construction.
+
+        Note:
+            Slotted fields are always ordered as declared, c.f.
+            :attr:`Info.__layout__ <pcapkit.corekit.infoclass.Info.__layout__>`,
+            thus only non-slotted fields are reordered.
+
+        """
+        order = []  # type: list[str]
+        for cls in type(self).mro():  # pragma: no branch
+            if cls is Info:
+                break
+            for key in reversed(cls.__annotations__):
+                if key not in order:
+                    order.append(key)
+
+        mapping = self.__map__
+        fields = self.__dict__.copy()
+        self.__dict__.clear()
+        for key in reversed(order):
+            key = mapping.get(key, key)
+            if key in fields:
+                self.__dict__[key] = fields.pop(key)
+        self.__dict__.update(fields)
+
+    def __getattr__(self, name: 'str') -> 'Any':
+        while self.__load__():
+            with contextlib.suppress(KeyError):
+                return super().__getitem__(name)
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
+    def __getitem__(self, name: 'str') -> 'Any':
+        while True:
+            with contextlib.suppress(KeyError):
+                return super().__getitem__(name)
+            if not self.__load__():
+                raise KeyError(name)
+
+    def __iter__(self) -> 'Iterator[str]':
+        while self.__load__():
+            pass
+        return super().__iter__()
+
+    def __len__(self) -> 'int':
+        while self.__load__():
+            pass
+        return super().__len__()
+
+    def __str__(self) -> 'str':
+        while self.__load__():
+            pass
+        return super().__str__()
+
+    def __repr__(self) -> 'str':
+        while self.__load__():
+            pass
+        return super().__repr__()
+
+    def to_dict(self) -> 'dict[str, Any]':
+        while self.__load__():
+            pass
+        return super().to_dict()
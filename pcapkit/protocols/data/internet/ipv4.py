@@ -3,8 +3,6 @@
 
 from typing import TYPE_CHECKING
 
-from pcapkit.const.ipv4.option_class import OptionClass
-from pcapkit.const.ipv4.tos_del import ToSDelay
 from pcapkit.corekit.infoclass import info_final
 from pcapkit.protocols.data.data import Data
 from pcapkit.protocols.data.protocol import Protocol
@@ -12,15 +10,17 @@ from pcapkit.protocols.data.protocol import Protocol
 if TYPE_CHECKING:
     from datetime import timedelta
     from ipaddress import IPv4Address
-    from typing import Any, Optional
+    from typing import Optional
 
     from typing_extensions import Literal
 
     from pcapkit.const.ipv4.classification_level import ClassificationLevel
+    from pcapkit.const.ipv4.option_class import OptionClass
     from pcapkit.const.ipv4.option_number import OptionNumber
     from pcapkit.const.ipv4.protection_authority import ProtectionAuthority
     from pcapkit.const.ipv4.qs_function import QSFunction
     from pcapkit.const.ipv4.router_alert import RouterAlert
+    from pcapkit.const.ipv4.tos_del import ToSDelay
     from pcapkit.const.ipv4.tos_ecn import ToSECN
     from pcapkit.const.ipv4.tos_pre import ToSPrecedence
     from pcapkit.const.ipv4.tos_rel import ToSReliability
@@ -57,7 +57,9 @@ class ToSField(Data):
     #: Precedence.
     pre: 'ToSPrecedence'
     #: Delay.
-    #del: 'ToSDelay'
+    # NOTE: We cannot define ``del`` due to preserved keyword conflict.
+    # Thus, we directly inject the information into the annotations.
+    __annotations__['del'] = 'ToSDelay'
     #: Throughput.
     thr: 'ToSThroughput'
     #: Reliability.
@@ -65,15 +67,6 @@ class ToSField(Data):
     #: Explicit congestion notification (ECN).
     ecn: 'ToSECN'
 
-    def __new__(cls, *args: 'Any', **kwargs: 'Any') -> 'ToSField':
-        self = super().__new__(cls, *args, **kwargs)
-
-        # NOTE: We cannot define ``del`` due to preserved keyword conflict.
-        # Thus, we directly inject the information into the annotations.
-        cls.__annotations__['del'] = ToSDelay
-
-        return self
-
 
 @info_final
 class Flags(Data):
@@ -130,19 +123,12 @@ class OptionType(Data):
     #: Change flag.
     change: 'bool'
     #: Option class.
-    #class: 'int'
+    # NOTE: We cannot define ``class`` due to preserved keyword conflict.
+    # Thus, we directly inject the information into the annotations.
+    __annotations__['class'] = 'OptionClass'
     #: Number.
     number: 'int'
 
-    def __new__(cls, *args: 'Any', **kwargs: 'Any') -> 'OptionType':
-        self = super().__new__(cls, *args, **kwargs)
-
-        # NOTE: We cannot define ``class`` due to preserved keyword conflict.
-        # Thus, we directly inject the information into the annotations.
-        cls.__annotations__['class'] = OptionClass
-
-        return self
-
 
 class Option(Data):
     """Data model for IPv4 options."""
@@ -312,18 +298,11 @@ class TROption(Option):
     #: Outbound hop count.
     outbound: 'int'
     #: Return hop count.
-    #return: 'int'
+    # NOTE: We cannot define ``return`` due to preserved keyword conflict.
+    # Thus, we directly inject the information into the annotations.
+    __annotations__['return'] = 'int'
     originator: 'IPv4Address'
 
-    def __new__(cls, *args: 'Any', **kwargs: 'Any') -> 'TROption':
-        self = super().__new__(cls, *args, **kwargs)
-
-        # NOTE: We cannot define ``return`` due to preserved keyword conflict.
-        # Thus, we directly inject the information into the annotations.
-        cls.__annotations__['return'] = int
-
-        return self
-
 
 @info_final
 class RTRALTOption(Option):
@@ -8,7 +8,6 @@ from pcapkit.protocols.data.protocol import Protocol
 
 if TYPE_CHECKING:
     from ipaddress import IPv6Address
-    from typing import Any
 
     from typing_extensions import Literal
 
@@ -33,7 +32,9 @@ class IPv6(Protocol):
     #: Version.
     version: 'Literal[6]'
     #: Traffic class.
-    #class: 'int'
+    # NOTE: We cannot define ``class`` due to preserved keyword conflict.
+    # Thus, we directly inject the information into the annotations.
+    __annotations__['class'] = 'int'
     #: Flow label.
     label: 'int'
     #: Payload length.
@@ -56,12 +57,3 @@ class IPv6(Protocol):
         hdr_len: 'int'
         #: Raw payload length (excluding extension headers).
         raw_len: 'int'
-
-    def __new__(cls, *args: 'Any', **kwargs: 'Any') -> 'IPv6':
-        self = super().__new__(cls, *args, **kwargs)
-
-        # NOTE: We cannot define ``class`` due to preserved keyword conflict.
-        # Thus, we directly inject the information into the annotations.
-        cls.__annotations__['class'] = int
-
-        return self
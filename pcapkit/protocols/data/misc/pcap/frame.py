@@ -33,7 +33,16 @@ class FrameInfo(Data):
 
 @info_final
 class Frame(Protocol):
-    """Frame header of PCAP file."""
+    """Frame header of PCAP file.
+
+    Note:
+        When parsed from a PCAP file, :attr:`time` and :attr:`time_epoch`
+        are deferred until first accessed, whilst the timestamp is always
+        available as an integer in :attr:`ts_ns`.
+
+    """
+
+    __excluded__ = ['ts_ns']
 
     #: Metadata information.
     frame_info: 'FrameInfo'
@@ -48,9 +57,15 @@ class Frame(Protocol):
     #: Actual length of packet.
     cap_len: 'int'
 
+    def __post_init__(self) -> 'None':
+        """Post-initialization handling."""
+        self.__update__(ts_ns=int(self.time_epoch * 1_000_000_000))
+
     if TYPE_CHECKING:
         #: Protocol chain.
         protocols: 'str'
+        #: UNIX timestamp (in nanoseconds).
+        ts_ns: 'int'
 
         def __init__(self, frame_info: 'FrameInfo', time: 'datetime', number: 'int', time_epoch: 'Decimal',
                      len: 'int', cap_len: 'int') -> 'None': ...  # pylint: disable=unused-argument,multiple-statements,super-init-not-called,line-too-long,redefined-builtin
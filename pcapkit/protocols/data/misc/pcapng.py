@@ -440,7 +440,16 @@ class EPB_VerdictOption(Option):
 
 @info_final
 class EnhancedPacketBlock(PCAPNG):
-    """Data model for PCAP-NG Enhanced Packet Block (EPB)."""
+    """Data model for PCAP-NG Enhanced Packet Block (EPB).
+
+    Note:
+        When parsed from a PCAP-NG file, :attr:`timestamp` and
+        :attr:`timestamp_epoch` are deferred until first accessed, whilst
+        the timestamp is always available as an integer in :attr:`ts_ns`.
+
+    """
+
+    __excluded__ = ['ts_ns']
 
     #: Section index.
     section_number: 'int'
@@ -463,6 +472,8 @@ class EnhancedPacketBlock(PCAPNG):
     if TYPE_CHECKING:
         #: Protocol chain.
         protocols: 'str'
+        #: UNIX timestamp in UTC timezone (in nanoseconds).
+        ts_ns: 'int'
 
         def __init__(self, type: 'Enum_BlockType', length: 'int', section_number: 'int',
                      number: 'int', interface_id: 'int', timestamp: 'dt_type',
@@ -893,7 +904,16 @@ class PACK_HashOption(Option):
 
 @info_final
 class PacketBlock(PCAPNG):
-    """Data model for PCAP-NG Packet Block (obsolete)."""
+    """Data model for PCAP-NG Packet Block (obsolete).
+
+    Note:
+        When parsed from a PCAP-NG file, :attr:`timestamp` and
+        :attr:`timestamp_epoch` are deferred until first accessed, whilst
+        the timestamp is always available as an integer in :attr:`ts_ns`.
+
+    """
+
+    __excluded__ = ['ts_ns']
 
     #: Section index.
     section_number: 'int'
@@ -918,6 +938,8 @@ class PacketBlock(PCAPNG):
     if TYPE_CHECKING:
         #: Protocol chain.
         protocols: 'str'
+        #: UNIX timestamp in UTC timezone (in nanoseconds).
+        ts_ns: 'int'
 
         def __init__(self, type: 'Enum_BlockType', length: 'int', section_number: 'int', number: 'int',
                      interface_id: 'int', drop_count: 'int', timestamp: 'dt_type',
@@ -181,6 +181,10 @@ class Internet(Protocol[_PT, _ST], Generic[_PT, _ST]):  # pylint: disable=abstra
             be included when :meth:`Info.to_dict <pcapkit.corekit.infoclass.Info.to_dict>` is called.
 
         """
+        if self._exlazy and not self._exload:
+            return self._defer_next_layer(Internet._decode_next_layer, dict_, proto, length, packet=packet,
+                                          version=version, ipv6_exthdr=ipv6_exthdr, payload=payload)
+
         next_ = cast('Protocol',  # type: ignore[redundant-cast]
                      self._import_next_layer(proto, length, packet=packet, version=version,
                                              payload=payload))  # type: ignore[arg-type,misc,call-arg]
@@ -245,5 +249,6 @@ class Internet(Protocol[_PT, _ST], Generic[_PT, _ST]):  # pylint: disable=abstra
                 self.__proto__[proto] = protocol  # update mapping upon import
 
         next_ = protocol(file_, length, version=version, extension=extension,  # type: ignore[abstract]
-                         alias=proto, packet=packet, layer=self._exlayer, protocol=self._exproto)
+                         alias=proto, packet=packet, _plan=self._explan,
+                         _lazy=self._exlazy)
         return next_
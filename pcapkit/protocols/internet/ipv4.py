@@ -98,6 +98,7 @@ from pcapkit.protocols.schema.internet.ipv4 import TROption as Schema_TROption
 from pcapkit.protocols.schema.internet.ipv4 import TSOption as Schema_TSOption
 from pcapkit.protocols.schema.internet.ipv4 import UnassignedOption as Schema_UnassignedOption
 from pcapkit.protocols.schema.schema import Schema
+from pcapkit.protocols.template import checksum as calc_checksum
 from pcapkit.utilities.exceptions import ProtocolError
 from pcapkit.utilities.warnings import ProtocolWarning, RegistryWarning, warn
 
@@ -114,6 +115,7 @@ if TYPE_CHECKING:
     from pcapkit.protocols.data.internet.ipv4 import Option as Data_Option
     from pcapkit.protocols.protocol import ProtocolBase as Protocol
     from pcapkit.protocols.schema.internet.ipv4 import Option as Schema_Option
+    from pcapkit.protocols.template import Layer
 
     Option = OrderedMultiDict[Enum_OptionNumber, Data_Option]
     OptionParser = Callable[[Schema_Option, NamedArg(Option, 'options')], Data_Option]
@@ -501,6 +503,32 @@ class IPv4(IP[Data_IPv4, Schema_IPv4],
             'payload': cls._make_payload(data),
         }
 
+    @classmethod
+    def _fix_template(cls, buffer: 'bytearray', layer: 'Layer', lower: 'Optional[Layer]' = None, *,
+                      checksum: 'bool' = True) -> 'None':
+        """Fix length and checksum fields of a rendered packet template.
+
+        Args:
+            buffer: Rendered packet data, to be fixed in place.
+            layer: Template layer of the current protocol.
+            lower: Template layer of the lower protocol, if any.
+            checksum: Whether to recalculate checksum fields.
+
+        Notes:
+            The total length is set as the length of the header and its
+            payload; and the header checksum is calculated over the header
+            (including options) only.
+
+        """
+        start = layer.offset
+        offset = start + layer.fields['length'][0]
+        buffer[offset:offset + 2] = (len(buffer) - layer.tail - start).to_bytes(2, 'big')
+
+        if checksum:
+            offset = start + layer.fields['chksum'][0]
+            buffer[offset:offset + 2] = b'\x00\x00'
+            buffer[offset:offset + 2] = calc_checksum(buffer[start:start + layer.length]).to_bytes(2, 'big')
+
     def _read_ipv4_addr(self) -> 'IPv4Address':
         """Read IP address.
 
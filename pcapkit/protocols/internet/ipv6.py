@@ -48,6 +48,7 @@ if TYPE_CHECKING:
     from typing_extensions import Literal
 
     from pcapkit.protocols.protocol import ProtocolBase as Protocol
+    from pcapkit.protocols.template import Layer
 
 __all__ = ['IPv6']
 
@@ -265,6 +266,26 @@ class IPv6(IP[Data_IPv6, Schema_IPv6],
             'payload': cls._make_payload(data)
         }
 
+    @classmethod
+    def _fix_template(cls, buffer: 'bytearray', layer: 'Layer', lower: 'Optional[Layer]' = None, *,
+                      checksum: 'bool' = True) -> 'None':
+        """Fix length and checksum fields of a rendered packet template.
+
+        Args:
+            buffer: Rendered packet data, to be fixed in place.
+            layer: Template layer of the current protocol.
+            lower: Template layer of the lower protocol, if any.
+            checksum: Whether to recalculate checksum fields.
+
+        Notes:
+            The payload length is set as the length of extension headers and
+            the payload, i.e., excluding the fixed 40-octet header.
+
+        """
+        start = layer.offset
+        offset = start + layer.fields['length'][0]
+        buffer[offset:offset + 2] = (len(buffer) - layer.tail - start - 40).to_bytes(2, 'big')
+
     def _read_ip_hextet(self) -> 'tuple[int, int, int]':
         """Read first four hextets of IPv6.
 
@@ -408,5 +429,6 @@ class IPv6(IP[Data_IPv6, Schema_IPv6],
                 self.__proto__[proto] = protocol  # update mapping upon import
 
         next_ = protocol(file_, length, version=version, extension=extension,  # type: ignore[abstract]
-                         alias=proto, packet=packet, layer=self._exlayer, protocol=self._exproto)
+                         alias=proto, packet=packet, _plan=self._explan,
+                         _lazy=self._exlazy)
         return next_
@@ -25,15 +25,18 @@ whose structure is described as below:
 import collections
 import datetime
 import decimal
+import functools
 import io
 import sys
 import time
 from typing import TYPE_CHECKING, cast, overload
 
 from pcapkit.const.reg.linktype import LinkType as Enum_LinkType
+from pcapkit.corekit.io import MemoryReader
 from pcapkit.corekit.module import ModuleDescriptor
 from pcapkit.protocols.data.misc.pcap.frame import Frame as Data_Frame
 from pcapkit.protocols.data.misc.pcap.frame import FrameInfo as Data_FrameInfo
+from pcapkit.protocols.data.protocol import Packet as Data_Packet
 from pcapkit.protocols.protocol import ProtocolBase as Protocol
 from pcapkit.protocols.schema.misc.pcap.frame import Frame as Schema_Frame
 from pcapkit.utilities.compat import localcontext
@@ -96,6 +99,11 @@ class Frame(Protocol[Data_Frame, Schema_Frame],
         },
     )  # type: DefaultDict[Enum_LinkType | int, ModuleDescriptor[Protocol] | Type[Protocol]]
 
+    #: bool: If the frame is constructed from an in-memory buffer.
+    _buff = False
+    #: Optional[bytes]: Frame payload materialised as :obj:`bytes`, c.f. :meth:`_get_payload`.
+    _pbuf = None  # type: Optional[bytes]
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -115,6 +123,18 @@ class Frame(Protocol[Data_Frame, Schema_Frame],
         """Global header of the PCAP file."""
         return self._ghdr
 
+    @property
+    def packet(self) -> 'Data_Packet':
+        """Data_Packet data of the protocol.
+
+        The payload is shared with the next layer protocol, c.f. :meth:`_get_payload`.
+
+        """
+        return Data_Packet(
+            header=bytes(self._data[:self.length]),
+            payload=self._get_payload(),
+        )
+
     ##########################################################################
     # Methods.
     ##########################################################################
@@ -217,36 +237,40 @@ class Frame(Protocol[Data_Frame, Schema_Frame],
         _ilen = schema.incl_len
         _olen = schema.orig_len
 
-        with localcontext(prec=64):
-            if self._nsec:
-                _epch = _tsss + decimal.Decimal(_tsus) / 1_000_000_000
-            else:
-                _epch = _tsss + decimal.Decimal(_tsus) / 1_000_000
-        _irat = _epch.as_integer_ratio()
-
-        try:
-            _time = datetime.datetime.fromtimestamp(_irat[0] / _irat[1])
-        except ValueError:
-            warn(f'PCAP: invalid timestamp: {_epch}', ProtocolWarning, stacklevel=stacklevel())
-            _time = datetime.datetime.fromtimestamp(0, datetime.timezone.utc)
+        if self._nsec:
+            _tsns = _tsss * 1_000_000_000 + _tsus
+        else:
+            _tsns = _tsss * 1_000_000_000 + _tsus * 1_000
 
-        frame = Data_Frame(
+        # NOTE: Building the :class:`~datetime.datetime` and
+        # :class:`~decimal.Decimal` timestamps is costly, thus we defer
+        # them until the fields are first accessed.
+        frame = Data_Frame.from_dict(
             frame_info=Data_FrameInfo(
                 ts_sec=_tsss,
                 ts_usec=_tsus,
                 incl_len=_ilen,
                 orig_len=_olen,
             ),
-            time=_time,
             number=self._fnum,
-            time_epoch=_epch,
             len=_ilen,
             cap_len=_olen,
+            ts_ns=_tsns,
+            __field_load__=functools.partial(self._read_timestamp, _tsns),
         )
 
         if not _read:
             # move backward to the beginning of the packet
             self._file.seek(0, io.SEEK_SET)
+        elif self._buff:
+            # NOTE: The frame was constructed from an in-memory buffer, i.e.,
+            # the source stream already holds exactly the frame data, thus we
+            # can simply reuse it without seeking back to re-read the frame.
+            if len(self._data) > self.length + _ilen:
+                self._data = self._data[:self.length + _ilen]
+                self._file = self._make_buffer(self._data)
+            else:
+                self._file.seek(0, io.SEEK_SET)
         else:
             # NOTE: We create a copy of the frame data here for parsing
             # scenarios to keep the original frame data intact.
@@ -311,13 +335,13 @@ class Frame(Protocol[Data_Frame, Schema_Frame],
     ##########################################################################
 
     @overload  # pragma: no cover
-    def __post_init__(self, file: 'IO[bytes] | bytes', length: 'Optional[int]' = ..., *,  # pylint: disable=arguments-differ
+    def __post_init__(self, file: 'IO[bytes] | bytes | memoryview', length: 'Optional[int]' = ..., *,  # pylint: disable=arguments-differ
                       num: 'int', header: 'Data_Header', **kwargs: 'Any') -> 'None': ...
     @overload  # pragma: no cover
     def __post_init__(self, *, num: 'int', header: 'Data_Header',  # pylint: disable=arguments-differ
                       **kwargs: 'Any') -> 'None': ...
 
-    def __post_init__(self, file: 'Optional[IO[bytes] | bytes]' = None, length: 'Optional[int]' = None, *,  # pylint: disable=arguments-differ
+    def __post_init__(self, file: 'Optional[IO[bytes] | bytes | memoryview]' = None, length: 'Optional[int]' = None, *,  # pylint: disable=arguments-differ
                       num: 'int', header: 'Data_Header', **kwargs: 'Any') -> 'None':
         """Initialisation.
 
@@ -350,8 +374,17 @@ class Frame(Protocol[Data_Frame, Schema_Frame],
             self._file = io.BytesIO(self._data)
         else:
             _read = True
-            #: io.BytesIO: Source packet stream.
-            self._file = io.BytesIO(file) if isinstance(file, bytes) else file
+            if isinstance(file, (bytes, memoryview)):
+                #: bytes | memoryview: Raw packet data.
+                self._data = file
+                #: io.BytesIO | pcapkit.corekit.io.MemoryReader: Source packet stream.
+                self._file = self._make_buffer(file)
+            else:
+                #: io.BytesIO: Source packet stream.
+                self._file = file
+
+        #: bool: If the frame is constructed from an in-memory buffer.
+        self._buff = _read and isinstance(file, (bytes, memoryview))
 
         #: pcapkit.corekit.infoclass.Info: Parsed packet data.
         self._info = self.unpack(length, _read=_read, **kwargs)
@@ -384,6 +417,23 @@ class Frame(Protocol[Data_Frame, Schema_Frame],
     # Utilities.
     ##########################################################################
 
+    @staticmethod
+    def _make_buffer(data: 'bytes | memoryview') -> 'IO[bytes]':
+        """Make source packet stream from in-memory buffer.
+
+        Args:
+            data: Raw packet data.
+
+        Returns:
+            An :class:`io.BytesIO` stream for :obj:`bytes`, which shares the
+            buffer with ``data``; or a :class:`~pcapkit.corekit.io.MemoryReader`
+            for :class:`memoryview`, as :class:`io.BytesIO` would copy it.
+
+        """
+        if isinstance(data, bytes):
+            return io.BytesIO(data)
+        return cast('IO[bytes]', MemoryReader(data))
+
     @classmethod
     def _make_data(cls, data: 'Data_Frame') -> 'dict[str, Any]':  # type: ignore[override]
         """Create key-value pairs from ``data`` for protocol construction.
@@ -436,6 +486,51 @@ class Frame(Protocol[Data_Frame, Schema_Frame],
 
         return ts_sec, ts_usec
 
+    @staticmethod
+    def _read_timestamp(timestamp: 'int') -> 'dict[str, Any]':
+        """Read timestamp.
+
+        Args:
+            timestamp: UNIX-Epoch timestamp (in nanoseconds).
+
+        Returns:
+            Timestamp fields of the frame header, i.e., :attr:`time`
+            in :class:`~datetime.datetime` object and :attr:`time_epoch`
+            in :class:`~decimal.Decimal` object.
+
+        """
+        with localcontext(prec=64):
+            _epch = decimal.Decimal(timestamp) / 1_000_000_000
+
+        try:
+            _time = datetime.datetime.fromtimestamp(timestamp / 1_000_000_000)
+        except ValueError:
+            warn(f'PCAP: invalid timestamp: {_epch}', ProtocolWarning, stacklevel=stacklevel())
+            _time = datetime.datetime.fromtimestamp(0, datetime.timezone.utc)
+
+        return {
+            'time': _time,
+            'time_epoch': _epch,
+        }
+
+    def _get_payload(self) -> 'bytes':
+        """Get payload from :attr:`self.__header__ <Protocol.__header__>`.
+
+        Returns:
+            Payload of :attr:`self.__header__ <Protocol.__header__>` as :obj:`bytes`.
+
+        Notes:
+            Should the frame be constructed from a :class:`memoryview` (e.g.,
+            by the :class:`~pcapkit.foundation.engines.mmap.MMAP` engine), the
+            payload is but a slice of it up to this point. As the next layer
+            protocol relies on :obj:`bytes` methods, the payload is copied
+            here, only once, and shared with :attr:`packet`.
+
+        """
+        if self._pbuf is None:
+            self._pbuf = bytes(self.__header__.get_payload())  # pylint: disable=attribute-defined-outside-init
+        return self._pbuf
+
     def _decode_next_layer(self, dict_: 'Data_Frame', proto: 'Optional[int]' = None,
                            length: 'Optional[int]' = None, *, packet: 'Optional[dict[str, Any]]' = None) -> 'Data_Frame':  # pylint: disable=arguments-differ
         r"""Decode next layer protocol.
@@ -456,9 +551,12 @@ class Frame(Protocol[Data_Frame, Schema_Frame],
             be included when :meth:`Info.to_dict <pcapkit.corekit.infoclass.Info.to_dict>` is called.
 
             We also added a new key ``protocols`` to ``dict_`` to store the
-            protocol chain of the current packet (frame).
+            protocol chain of the current packet (frame), c.f. :meth:`_load_protocols`.
 
         """
+        if self._exlazy and not self._exload:
+            return self._defer_next_layer(Frame._decode_next_layer, dict_, proto, length, packet=packet)
+
         next_ = cast('Protocol', self._import_next_layer(proto, length, packet=packet))  # type: ignore[misc,call-arg,redundant-cast]
         info, chain = next_.info, next_.protochain
 
@@ -469,10 +567,26 @@ class Frame(Protocol[Data_Frame, Schema_Frame],
         # write info and protocol chain into dict
         dict_.__update__({
             layer: info,
-            'protocols': chain.chain if chain else '',
             '__next_type__': type(next_),
             '__next_name__': layer,
         })
         self._next = next_  # pylint: disable=attribute-defined-outside-init
         self._protos = chain  # pylint: disable=attribute-defined-outside-init
+
+        if self._exlazy:
+            # NOTE: The protocol chain requires all remaining layers to be
+            # decoded, thus we further defer it under lazy mode.
+            dict_.__update__({'__next_load__': functools.partial(self._load_protocols, dict_)})
+        else:
+            self._load_protocols(dict_)
         return dict_
+
+    def _load_protocols(self, dict_: 'Data_Frame') -> 'None':
+        r"""Write protocol chain of the current packet into info dict.
+
+        Arguments:
+            dict\_: info buffer
+
+        """
+        chain = self._protos
+        dict_.__update__({'protocols': chain.chain if chain else ''})
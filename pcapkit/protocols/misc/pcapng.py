@@ -18,6 +18,7 @@ import collections
 import datetime
 import decimal
 import enum
+import functools
 import io
 import math
 import os
@@ -1220,13 +1221,58 @@ class PCAPNG(Protocol[Data_PCAPNG, Schema_PCAPNG],
             timezone information and :class:`decimal.Decimal` object since
             UNIX-Epoch in UTC timezone.
 
+        """
+        _, loader = self._read_timestamp_ns(timestamp_high, timestamp_low, interface_id=interface_id)
+        fields = loader()
+        return (fields['timestamp'], fields['timestamp_epoch'])
+
+    def _read_timestamp_ns(self, timestamp_high: 'int', timestamp_low: 'int', *,
+                           interface_id: 'int' = 0) -> 'tuple[int, Callable[[], dict[str, Any]]]':
+        """Read timestamp in nanoseconds.
+
+        Args:
+            timestamp_high: Higher 32-bit integer value of timestamp.
+            timestamp_low: Lower 32-bit integer value of timestamp.
+            interface_id: Interface ID that the current block associates with.
+
+        Returns:
+            Tuple of timestamp in nanoseconds since UNIX-Epoch in UTC timezone
+            (rounded down for ``if_tsresol`` of power of 2), and the loader of
+            the ``timestamp`` and ``timestamp_epoch`` fields, c.f.
+            :meth:`_load_timestamp`.
+
         """
         tzone = self._get_timezone(interface_id)
+        resolution = self._get_resolution(interface_id)
+        offset = self._get_offset(interface_id)
 
         timestamp_raw = (timestamp_high << 32) | timestamp_low
+        timestamp_ns = timestamp_raw * 1_000_000_000 // resolution + offset * 1_000_000_000
+
+        loader = functools.partial(self._load_timestamp, timestamp_raw, resolution, offset, tzone,
+                                   block_type=self._type)
+        return (timestamp_ns, loader)
+
+    @staticmethod
+    def _load_timestamp(timestamp_raw: 'int', resolution: 'int', offset: 'int', tzone: 'timezone', *,
+                        block_type: 'Enum_BlockType') -> 'dict[str, Any]':
+        """Load timestamp fields.
+
+        Args:
+            timestamp_raw: Raw 64-bit integer value of timestamp.
+            resolution: Timestamp resolution, in units per second.
+            offset: Timestamp offset, in seconds.
+            tzone: Timezone of the timestamp.
+            block_type: Type of the current block.
+
+        Returns:
+            Timestamp fields of the block, i.e., ``timestamp`` in
+            :class:`~datetime.datetime` object with timezone information
+            and ``timestamp_epoch`` in :class:`decimal.Decimal` object.
+
+        """
         with localcontext(prec=64):
-            timestamp_epoch = decimal.Decimal(timestamp_raw) / self._get_resolution(interface_id) + \
-                self._get_offset(interface_id)
+            timestamp_epoch = decimal.Decimal(timestamp_raw) / resolution + offset
             ts_decimal = timestamp_epoch + decimal.Decimal(
                 tzone.utcoffset(None).total_seconds())
 
@@ -1234,11 +1280,14 @@ class PCAPNG(Protocol[Data_PCAPNG, Schema_PCAPNG],
         try:
             ts_datetime = datetime.datetime.fromtimestamp(ts_ratio[0] / ts_ratio[1], tzone)
         except ValueError:
-            warn(f'PCAP-NG: [Block {self._type}] invalid timestamp: {ts_decimal}',
+            warn(f'PCAP-NG: [Block {block_type}] invalid timestamp: {ts_decimal}',
                  ProtocolWarning, stacklevel=stacklevel())
             ts_datetime = datetime.datetime.fromtimestamp(0, datetime.timezone.utc)
 
-        return (ts_datetime, ts_decimal)
+        return {
+            'timestamp': ts_datetime,
+            'timestamp_epoch': ts_decimal,
+        }
 
     @classmethod
     def _make_data(cls, data: 'Data_PCAPNG') -> 'dict[str, Any]':  # type: ignore[override]
@@ -1369,9 +1418,12 @@ class PCAPNG(Protocol[Data_PCAPNG, Schema_PCAPNG],
             be included when :meth:`Info.to_dict <pcapkit.corekit.infoclass.Info.to_dict>` is called.
 
             We also added a new key ``protocols`` to ``dict_`` to store the
-            protocol chain of the current packet (frame).
+            protocol chain of the current packet (frame), c.f. :meth:`_load_protocols`.
 
         """
+        if self._exlazy and not self._exload:
+            return self._defer_next_layer(PCAPNG._decode_next_layer, dict_, proto, length, packet=packet)
+
         next_ = cast('Protocol', self._import_next_layer(proto, length, packet=packet))  # type: ignore[misc,call-arg,redundant-cast]
         info, chain = next_.info, next_.protochain
 
@@ -1382,14 +1434,30 @@ class PCAPNG(Protocol[Data_PCAPNG, Schema_PCAPNG],
         # write info and protocol chain into dict
         dict_.__update__({
             layer: info,
-            'protocols': chain.chain if chain else '',
             '__next_type__': type(next_),
             '__next_name__': layer,
         })
         self._next = next_  # pylint: disable=attribute-defined-outside-init
         self._protos = chain  # pylint: disable=attribute-defined-outside-init
+
+        if self._exlazy:
+            # NOTE: The protocol chain requires all remaining layers to be
+            # decoded, thus we further defer it under lazy mode.
+            dict_.__update__({'__next_load__': functools.partial(self._load_protocols, dict_)})
+        else:
+            self._load_protocols(dict_)
         return dict_
 
+    def _load_protocols(self, dict_: 'Data_PCAPNG') -> 'None':
+        r"""Write protocol chain of the current packet into info dict.
+
+        Arguments:
+            dict\_: info buffer
+
+        """
+        chain = self._protos
+        dict_.__update__({'protocols': chain.chain if chain else ''})
+
     def _read_block_unknown(self, schema: 'Schema_UnknownBlock', *,
                             header: 'Schema_PCAPNG') -> 'Data_UnknownBlock':
         """Read unknown PCAP-NG block.
@@ -1549,20 +1617,22 @@ class PCAPNG(Protocol[Data_PCAPNG, Schema_PCAPNG],
             Parsed packet data.
 
         """
-        timestamp, timestamp_epoch = self._read_timestamp(schema.timestamp_high, schema.timestamp_low,
-                                                          interface_id=schema.interface_id)
+        timestamp_ns, timestamp_load = self._read_timestamp_ns(schema.timestamp_high, schema.timestamp_low,
+                                                               interface_id=schema.interface_id)
 
-        data = Data_EnhancedPacketBlock(
+        # NOTE: The timestamp fields are deferred until first accessed,
+        # c.f. :meth:`_load_timestamp`.
+        data = Data_EnhancedPacketBlock.from_dict(
             type=header.type,
             length=schema.length,
             section_number=self._sect,
             number=self._fnum,
             interface_id=schema.interface_id,
-            timestamp=timestamp,
-            timestamp_epoch=timestamp_epoch,
             captured_len=schema.captured_len,
             original_len=schema.original_len,
             options=self._read_pcapng_options(schema.options),
+            ts_ns=timestamp_ns,
+            __field_load__=timestamp_load,
         )
         return self._decode_next_layer(data, self._get_linktype(schema.interface_id),
                                        schema.captured_len)  # type: ignore[return-value]
@@ -1898,21 +1968,23 @@ class PCAPNG(Protocol[Data_PCAPNG, Schema_PCAPNG],
         warn('PCAP-NG: Packet Block has been obsolete! Please use Enhanced Packet Block and/or '
              'Simple Packet Block instead.', DeprecatedFormatWarning, stacklevel=stacklevel())
 
-        timestamp, timestamp_epoch = self._read_timestamp(schema.timestamp_high, schema.timestamp_low,
-                                                          interface_id=schema.interface_id)
+        timestamp_ns, timestamp_load = self._read_timestamp_ns(schema.timestamp_high, schema.timestamp_low,
+                                                               interface_id=schema.interface_id)
 
-        data = Data_PacketBlock(
+        # NOTE: The timestamp fields are deferred until first accessed,
+        # c.f. :meth:`_load_timestamp`.
+        data = Data_PacketBlock.from_dict(
             type=header.type,
             length=schema.length,
             section_number=self._sect,
             number=self._fnum,
             interface_id=schema.interface_id,
             drop_count=schema.drop_count,
-            timestamp=timestamp,
-            timestamp_epoch=timestamp_epoch,
             captured_len=schema.captured_length,
             original_len=schema.original_length,
             options=self._read_pcapng_options(schema.options),
+            ts_ns=timestamp_ns,
+            __field_load__=timestamp_load,
         )
         return self._decode_next_layer(data, self.linktype, schema.captured_length)  # type: ignore[return-value]
 
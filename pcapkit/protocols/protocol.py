@@ -30,6 +30,7 @@ import chardet
 
 from pcapkit.corekit.module import ModuleDescriptor
 from pcapkit.corekit.protochain import ProtoChain
+from pcapkit.corekit.threshold import Threshold
 from pcapkit.protocols import data as data_module
 from pcapkit.protocols import schema as schema_module
 from pcapkit.protocols.data.data import Data
@@ -45,11 +46,13 @@ from pcapkit.utilities.warnings import RegistryWarning, warn
 
 if TYPE_CHECKING:
     from enum import IntEnum as StdlibEnum
-    from typing import IO, Any, DefaultDict, Optional, Type
+    from typing import IO, Any, Callable, DefaultDict, Optional, Type
 
     from aenum import IntEnum as AenumEnum
     from typing_extensions import Literal, Self
 
+    from pcapkit.protocols.template import Layer, Template
+
 __all__ = ['ProtocolBase']
 
 _PT = TypeVar('_PT', bound='Data')
@@ -89,6 +92,8 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
         _next: 'ProtocolBase'
         #: Protocol chain instance.
         _protos: 'ProtoChain'
+        #: Deferred next layer decoding under lazy mode.
+        _exnext: 'functools.partial[Any]'
 
         # Internal data storage for cached properties.
         __cached__: 'dict[str, Any]'
@@ -119,6 +124,13 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
         lambda: ModuleDescriptor('pcapkit.protocols.misc.raw', 'Raw'),
     )
 
+    #: bool: If decode next layer lazily upon access.
+    _exlazy = False
+    #: bool: If the deferred next layer is being decoded under lazy mode.
+    _exload = False
+    #: Threshold: Compiled termination plan.
+    _explan = None  # type: Optional[Threshold]
+
     ##########################################################################
     # Properties.
     ##########################################################################
@@ -274,10 +286,19 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
             global packet data to underlying methods. This is useful when
             the packet data is not available in the current instance.
 
+            The header is unpacked directly from :attr:`self._data <Protocol._data>`
+            with :meth:`Schema.unpack_from <pcapkit.protocols.schema.schema.Schema.unpack_from>`,
+            and :attr:`self._file <Protocol._file>` is then advanced accordingly.
+
         """
         if cast('Optional[_ST]', self.__header__) is None:
             packet = kwargs.get('__packet__', {})  # packet data
-            self.__header__ = cast('_ST', self.__schema__.unpack(self._file, length, packet))  # type: ignore[call-arg,misc]
+
+            offset = self._file.tell()
+            header, size = self.__schema__.unpack_from(self._data, offset, length, packet)  # type: ignore[call-arg,misc]
+            self._file.seek(offset + size, io.SEEK_SET)
+
+            self.__header__ = cast('_ST', header)
         return self.read(length, **kwargs)
 
     @staticmethod
@@ -474,6 +495,25 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
 
         return self
 
+    @classmethod
+    def template(cls, *, fix_checksum: 'bool' = True, **kwargs: 'Any') -> 'Template':
+        """Create packet template for bulk crafting.
+
+        Args:
+            fix_checksum: Whether to recalculate checksum fields upon rendering.
+            **kwargs: Arguments for :meth:`make`, where the ``payload`` can
+                be another :class:`~pcapkit.protocols.template.Template`.
+
+        Returns:
+            Packet template.
+
+        See Also:
+            :class:`pcapkit.protocols.template.Template`
+
+        """
+        from pcapkit.protocols.template import Template  # pylint: disable=import-outside-toplevel
+        return Template(cls, fix_checksum=fix_checksum, **kwargs)
+
     ##########################################################################
     # Data models.
     ##########################################################################
@@ -503,6 +543,11 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
                 (:attr:`self._exlayer <pcapkit.protocols.protocol.Protocol._exlayer>`).
             _protocol (Union[str, Protocol, Type[Protocol]]): Parse packet until ``_protocol``
                 (:attr:`self._exproto <pcapkit.protocols.protocol.Protocol._exproto>`).
+            _lazy (bool): Decode next layer lazily upon access
+                (:attr:`self._exlazy <pcapkit.protocols.protocol.Protocol._exlazy>`).
+            _plan (Threshold): Compiled termination plan
+                (:attr:`self._explan <pcapkit.protocols.protocol.Protocol._explan>`),
+                which takes precedence over ``_layer`` and ``_protocol``.
             **kwargs: Arbitrary keyword arguments.
 
         """
@@ -514,6 +559,10 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
         self._exlayer = kwargs.pop('_layer', None)  # type: Optional[str]
         #: str: Parse packet until such protocol.
         self._exproto = kwargs.pop('_protocol', None)  # type: Optional[str | ProtocolBase | Type[ProtocolBase]]
+        #: bool: If decode next layer lazily upon access.
+        self._exlazy = kwargs.pop('_lazy', False)  # type: bool
+        #: Threshold: Compiled termination plan.
+        self._explan = kwargs.pop('_plan', None)  # type: Optional[Threshold]
         #: bool: If terminate parsing next layer of protocol.
         self._sigterm = self._check_term_threshold()
 
@@ -637,7 +686,7 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
 
     def __bytes__(self) -> 'bytes':
         """Returns source data stream in :obj:`bytes`."""
-        return self._data
+        return bytes(self._data)
 
     def __len__(self) -> 'int':
         """Total length of corresponding protocol."""
@@ -657,6 +706,34 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
         """Iterate through :attr:`self._data <pcapkit.protocols.protocol.Protocol._data>`."""
         return io.BytesIO(self._data)
 
+    def __getattr__(self, name: 'str') -> 'Any':
+        """Resolve next layer upon access under lazy mode.
+
+        * :attr:`self._next <pcapkit.protocols.protocol.Protocol._next>` is
+          resolved by decoding the next layer, whose own next layer is again
+          deferred.
+        * :attr:`self._protos <pcapkit.protocols.protocol.Protocol._protos>`
+          is resolved as a :class:`~pcapkit.corekit.protochain.ProtoChain`
+          which decodes the remaining layers once accessed.
+
+        Args:
+            name: Attribute name.
+
+        Raises:
+            AttributeError: If the attribute does not exist.
+
+        """
+        if name in ('_next', '_protos') and '_exnext' in self.__dict__:
+            if name == '_protos':
+                return ProtoChain.from_loader(self._load_protochain)
+            self._load_next_layer()
+            return self._next
+
+        # NOTE: This method is also called when a property raises
+        # :exc:`AttributeError` (e.g., :exc:`UnsupportedCall`), thus we
+        # look up the attribute again to re-raise the original exception.
+        return super().__getattribute__(name)
+
     def __getitem__(self, key: 'str | Protocol | Type[Protocol]') -> 'ProtocolBase':
         """Subscription (``getitem``) support.
 
@@ -1085,6 +1162,24 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
 
         return proto.from_data(data[name])
 
+    @classmethod
+    def _fix_template(cls, buffer: 'bytearray', layer: 'Layer', lower: 'Optional[Layer]' = None, *,
+                      checksum: 'bool' = True) -> 'None':
+        """Fix length and checksum fields of a rendered packet template.
+
+        Args:
+            buffer: Rendered packet data, to be fixed in place.
+            layer: Template layer of the current protocol.
+            lower: Template layer of the lower protocol, if any.
+            checksum: Whether to recalculate checksum fields.
+
+        Notes:
+            This method is called from the innermost layer to the outermost
+            layer, c.f. :meth:`Template.render <pcapkit.protocols.template.Template.render>`.
+            By default, the buffer is left untouched.
+
+        """
+
     def _decode_next_layer(self, dict_: '_PT', proto: 'int', length: 'Optional[int]' = None, *,
                            packet: 'Optional[dict[str, Any]]' = None) -> '_PT':
         r"""Decode next layer protocol.
@@ -1104,7 +1199,13 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
             store the next layer protocol name. These two keys will **NOT**
             be included when :meth:`Info.to_dict <pcapkit.corekit.infoclass.Info.to_dict>` is called.
 
+            Under lazy mode, decoding is deferred to :meth:`_load_next_layer`,
+            c.f. :meth:`_defer_next_layer`.
+
         """
+        if self._exlazy and not self._exload:
+            return self._defer_next_layer(ProtocolBase._decode_next_layer, dict_, proto, length, packet=packet)
+
         next_ = cast('ProtocolBase', self._import_next_layer(proto, length, packet=packet))  # type: ignore[misc,call-arg,redundant-cast]
         info, chain = next_.info, next_.protochain
 
@@ -1122,6 +1223,44 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
         self._protos = ProtoChain(self.__class__, self.alias, basis=chain)  # pylint: disable=attribute-defined-outside-init
         return dict_
 
+    def _defer_next_layer(self, decoder: 'Callable[..., _PT]', dict_: '_PT', *args: 'Any', **kwargs: 'Any') -> '_PT':
+        r"""Defer decoding next layer protocol under lazy mode.
+
+        Implementations of :meth:`_decode_next_layer` shall call this method
+        in the first place under lazy mode, with the implementation itself as
+        ``decoder``, which will be called upon :meth:`_load_next_layer`.
+
+        Arguments:
+            decoder: the (unbound) :meth:`_decode_next_layer` implementation
+            dict\_: info buffer
+            *args: Arbitrary positional arguments for ``decoder``.
+            **kwargs: Arbitrary keyword arguments for ``decoder``.
+
+        Returns:
+            Current protocol with next layer deferred.
+
+        Notes:
+            We added a new key ``__next_load__`` to ``dict_`` to store the
+            loader of the next layer, such that the next layer is decoded
+            once its fields are accessed. This key will **NOT** be included
+            when :meth:`Info.to_dict <pcapkit.corekit.infoclass.Info.to_dict>` is called.
+
+        """
+        self._exnext = functools.partial(decoder, self, dict_, *args, **kwargs)  # pylint: disable=attribute-defined-outside-init
+        dict_.__update__({'__next_load__': self._load_next_layer})
+        return dict_
+
+    def _load_next_layer(self) -> 'None':
+        """Decode next layer protocol deferred under lazy mode, if any."""
+        if (decoder := self.__dict__.pop('_exnext', None)) is not None:
+            self._exload = True  # pylint: disable=attribute-defined-outside-init
+            decoder()
+
+    def _load_protochain(self) -> 'ProtoChain':
+        """Decode the remaining layers and return the protocol chain."""
+        self._load_next_layer()
+        return self._protos
+
     @beholder
     def _import_next_layer(self, proto: 'int', length: 'Optional[int]' = None, *,
                            packet: 'Optional[dict[str, Any]]' = None) -> 'ProtocolBase':
@@ -1154,27 +1293,24 @@ class ProtocolBase(Generic[_PT, _ST], metaclass=ProtocolMeta):
                 self.__proto__[proto] = protocol  # update mapping upon import
 
         next_ = protocol(file_, length, alias=proto, packet=packet,
-                         layer=self._exlayer, protocol=self._exproto)  # type: ignore[abstract]
+                         _plan=self._explan, _lazy=self._exlazy)  # type: ignore[abstract]
         return next_
 
     def _check_term_threshold(self) -> bool:
-        """Check if reached termination threshold."""
-        if self._exlayer is None or (layer := self.__layer__) is None:
-            layer_match = False
-        else:
-            layer_match = layer.upper() == self._exlayer.upper()
+        """Check if reached termination threshold.
 
-        if self._exproto is None:
-            protocol_match = False
-        else:
-            protocol_match = False
-            comp_test = [name.upper() for name in self.id()]
-            for test in self.expand_comp(self._exproto):
-                if test in comp_test:
-                    protocol_match = True
-                    break
-
-        return layer_match or protocol_match
+        The thresholds are compiled beforehand as a
+        :class:`~pcapkit.corekit.threshold.Threshold` plan, thus the check
+        is but a membership test of the protocol class. Should the plan be
+        absent, it will be compiled from ``_layer`` and ``_protocol``, and
+        then passed down the decoding chain.
+
+        """
+        if (plan := self._explan) is None:
+            if self._exlayer is None and self._exproto is None:
+                return False
+            plan = self._explan = Threshold(self._exlayer, self._exproto)
+        return type(self) in plan
 
 
 class Protocol(ProtocolBase, Generic[_PT, _ST]):
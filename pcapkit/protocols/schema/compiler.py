@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""compiled unpacker for schema headers
+
+:mod:`pcapkit.protocols.schema.compiler` contains the compiled unpacker
+:class:`~pcapkit.protocols.schema.compiler.Unpacker`, which parses the
+leading run of fixed-length fields of a :class:`~pcapkit.protocols.schema.schema.Schema`
+with a single :class:`struct.Struct` call, c.f.
+:meth:`Schema.unpack <pcapkit.protocols.schema.schema.Schema.unpack>`.
+
+"""
+import collections.abc
+import struct
+from typing import TYPE_CHECKING
+
+from pcapkit.corekit.fields.field import Field, FieldBase, NoValue
+from pcapkit.corekit.fields.strings import PaddingField
+from pcapkit.utilities.compat import final
+
+__all__ = ['Unpacker']
+
+if TYPE_CHECKING:
+    from typing import Any, Iterator, Optional, Type
+
+    from pcapkit.protocols.schema.schema import Schema
+
+#: Byte order characters of :mod:`struct` format strings.
+BYTE_ORDER = '<>!='
+
+#: Format characters of :mod:`struct` insensitive to byte order.
+NEUTRAL_CODES = frozenset({'b', 'B', 'c', '?'})
+
+#: Maximum number of compiled unpackers per set of packet dependencies,
+#: e.g., per byte order for PCAP frame headers.
+MAX_UNPACKERS = 16
+
+#: Packet data keys whose values vary in the middle of unpacking.
+VOLATILE_KEYS = frozenset({'__length__', '__option_padding__'})
+
+
+@final
+class MappingType:
+    """Placeholder of mapping values in packet dependencies."""
+
+
+#: MappingType: Placeholder of mapping values in packet dependencies.
+MappingValue = MappingType()
+
+
+class Recorder(collections.abc.Mapping):
+    """Read-only view of packet data, which records the keys accessed.
+
+    Args:
+        packet: Packet data.
+        path: Key path of ``packet`` from the root packet data.
+        record: Mapping of accessed key paths to their values.
+
+    """
+
+    def __init__(self, packet: 'collections.abc.Mapping[str, Any]', path: 'tuple[str, ...]',
+                 record: 'dict[tuple[str, ...], Any]') -> 'None':
+        self._packet = packet
+        self._path = path
+
+        #: Mapping of accessed key paths to their values.
+        self.record = record
+        #: Flag if the packet data is accessed in untracked manners.
+        self.untracked = False
+
+    def __getitem__(self, key: 'str') -> 'Any':
+        path = self._path + (key,)
+        try:
+            value = self._packet[key]
+        except KeyError:
+            self.record[path] = NoValue
+            raise
+
+        if isinstance(value, collections.abc.Mapping):
+            self.record[path] = MappingValue
+            return Recorder(value, path, self.record)
+
+        self.record[path] = value
+        return value
+
+    def __iter__(self) -> 'Iterator[str]':
+        self.untracked = True
+        return iter(self._packet)
+
+    def __len__(self) -> 'int':
+        self.untracked = True
+        return len(self._packet)
+
+
+def resolve(packet: 'collections.abc.Mapping[str, Any]', path: 'tuple[str, ...]') -> 'Any':
+    """Resolve value of a key path from packet data.
+
+    Args:
+        packet: Packet data.
+        path: Key path.
+
+    Returns:
+        Value of the key path, with :data:`NoValue` if missing and
+        :data:`MappingValue` if a mapping, as recorded by :class:`Recorder`.
+
+    """
+    value = packet  # type: Any
+    for key in path:
+        if not isinstance(value, collections.abc.Mapping):
+            return NoValue
+        try:
+            value = value[key]
+        except KeyError:
+            return NoValue
+    if isinstance(value, collections.abc.Mapping):
+        return MappingValue
+    return value
+
+
+class Unpacker:
+    """Compiled unpacker of the leading fixed-length fields of a schema.
+
+    The fields are resolved (i.e., with callbacks applied) upon compilation,
+    and their :mod:`struct` format strings are concatenated into a single
+    :class:`struct.Struct`. Compiled unpackers are cached in
+    :attr:`Schema.__compiled__ <pcapkit.protocols.schema.schema.Schema.__compiled__>`
+    by the packet data the field callbacks depend on.
+
+    Args:
+        fields: Resolved fields.
+        byteorder: Byte order character of the format string.
+
+    """
+
+    __slots__ = ('fields', 'lengths', 'struct', 'size')
+
+    #: Resolved fields.
+    fields: 'tuple[Field, ...]'
+    #: Lengths of the fields.
+    lengths: 'tuple[int, ...]'
+    #: Compiled :mod:`struct` object.
+    struct: 'struct.Struct'
+    #: Total length of the fields.
+    size: 'int'
+
+    def __init__(self, fields: 'list[Field]', byteorder: 'str') -> 'None':
+        self.fields = tuple(fields)
+        self.lengths = tuple(field.length for field in fields)
+        self.struct = struct.Struct(byteorder + ''.join(field.template.lstrip(BYTE_ORDER) for field in fields))
+        self.size = self.struct.size
+
+    def __repr__(self) -> 'str':
+        return f'{type(self).__name__}({self.struct.format!r}, fields={[field.name for field in self.fields]!r})'
+
+    @classmethod
+    def from_schema(cls, schema: 'Type[Schema]', packet: 'dict[str, Any]') -> 'Optional[Unpacker]':
+        """Fetch the compiled unpacker of ``schema``.
+
+        Args:
+            schema: Schema class.
+            packet: Packet data.
+
+        Returns:
+            Compiled unpacker; or :obj:`None` if the schema has no leading
+            fixed-length fields.
+
+        """
+        cache = schema.__compiled__
+        for deps, unpackers in cache.items():
+            key = tuple(resolve(packet, path) for path in deps)
+            try:
+                return unpackers[key]
+            except (KeyError, TypeError):
+                continue
+
+        record = {}  # type: dict[tuple[str, ...], Any]
+        unpacker = cls.compile(schema, packet, record)
+
+        deps = tuple(record)
+        key = tuple(record.values())
+        try:
+            unpackers = cache.setdefault(deps, {})
+            if len(unpackers) < MAX_UNPACKERS:
+                unpackers[key] = unpacker
+        except TypeError:
+            # NOTE: The packet dependencies are not hashable, thus we
+            # cannot cache the unpacker, which is only valid for the
+            # current packet data.
+            pass
+        return unpacker
+
+    @classmethod
+    def compile(cls, schema: 'Type[Schema]', packet: 'dict[str, Any]',
+                record: 'dict[tuple[str, ...], Any]') -> 'Optional[Unpacker]':
+        """Compile the unpacker of ``schema``.
+
+        Args:
+            schema: Schema class.
+            packet: Packet data.
+            record: Mapping of key paths of ``packet`` that the field
+                callbacks depend on, to their values.
+
+        Returns:
+            Compiled unpacker; or :obj:`None` if the schema has no leading
+            fixed-length fields.
+
+        Notes:
+            A field is considered as fixed-length, if its callbacks do not
+            depend on the values of any fields from the same schema, nor
+            the ``__length__`` and ``__option_padding__`` keys; and its
+            format string unpacks to a single value in standard size.
+
+        """
+        volatile = VOLATILE_KEYS.union(schema.__fields__)
+
+        fields = []  # type: list[Field]
+        byteorder = None  # type: Optional[str]
+        for field in schema.__fields__.values():
+            if not isinstance(field, Field) or isinstance(field, PaddingField):
+                break
+            if type(field).unpack is not FieldBase.unpack:
+                break
+
+            view = Recorder(packet, (), {})
+            try:
+                resolved = field(view)  # type: ignore[arg-type]
+            except Exception:  # pylint: disable=broad-except
+                break
+            if view.untracked or any(path[0] in volatile for path in view.record):
+                break
+
+            template = resolved.template
+            if template[:1] in BYTE_ORDER:
+                if template[1:] not in NEUTRAL_CODES:
+                    if byteorder is None:
+                        byteorder = template[0]
+                    elif byteorder != template[0]:
+                        break
+            elif not (template.endswith('s') and template[:-1].isdigit()):
+                break
+
+            length = resolved.length
+            if length <= 0 or len(struct.unpack(template, bytes(length))) != 1:
+                break
+
+            record.update(view.record)
+            fields.append(resolved)
+
+        if not fields:
+            return None
+        return cls(fields, byteorder or '>')
+
+    def unpack(self, schema: 'Schema', buffer: 'bytes | memoryview', offset: 'int',
+               packet: 'dict[str, Any]') -> 'None':
+        """Unpack the compiled fields into ``schema``.
+
+        Args:
+            schema: Schema instance.
+            buffer: Data buffer of at least :attr:`size` bytes from ``offset``.
+            offset: Offset of the fields in ``buffer``.
+            packet: Packet data.
+
+        """
+        buffers, attrs = schema.__buffer__, schema.__dict__
+        for field, length, value in zip(self.fields, self.lengths, self.struct.unpack_from(buffer, offset)):
+            name = field.name
+            buffers[name] = bytes(buffer[offset:offset + length])
+            offset += length
+
+            value = field.post_process(value, packet)
+            attrs[name] = value
+            packet[name] = value
+        packet['__length__'] -= self.size
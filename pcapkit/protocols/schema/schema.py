@@ -9,11 +9,13 @@ import itertools
 import sys
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, final
 
+from pcapkit.corekit.codegen import create_fn
 from pcapkit.corekit.fields.collections import ListField, OptionField
-from pcapkit.corekit.fields.field import FieldBase, NoValue
+from pcapkit.corekit.fields.field import FieldBase, NoValue, noop_callback
 from pcapkit.corekit.fields.misc import ConditionalField, ForwardMatchField, PayloadField
 from pcapkit.corekit.fields.strings import PaddingField
 from pcapkit.corekit.infoclass import FinalisedState
+from pcapkit.protocols.schema.compiler import Unpacker
 from pcapkit.utilities.compat import Mapping
 from pcapkit.utilities.decorators import prepare
 from pcapkit.utilities.exceptions import NoDefaultValue, ProtocolUnbound, stacklevel
@@ -62,7 +64,7 @@ def schema_final(cls: '_ST', *, _finalised: 'bool' = True) -> '_ST':
 
     temp = ['__map__', '__map_reverse__', '__builtin__',
             '__fields__', '__buffer__', '__updated__',
-            '__payload__', '__finalised__']
+            '__payload__', '__finalised__', '__compiled__']
     temp.extend(cls.__additional__)
     for obj in cls.mro():
         temp.extend(el for el in dir(obj) if el not in cls.__fields__)
@@ -96,10 +98,7 @@ def schema_final(cls: '_ST', *, _finalised: 'bool' = True) -> '_ST':
                 '    return __init__\n'
             )
 
-        ns = {}  # type: dict[str, Any]
-        exec(init_, None, ns)  # pylint: disable=exec-used # nosec
-
-        cls.__init__ = ns['__create_fn__']()  # type: ignore[misc]
+        cls.__init__ = create_fn(init_, globals())  # type: ignore[misc]
         cls.__init__.__qualname__ = f'{cls.__name__}.__init__'  # type: ignore[misc]
 
     if not _finalised:
@@ -110,6 +109,47 @@ def schema_final(cls: '_ST', *, _finalised: 'bool' = True) -> '_ST':
     return final(cls)
 
 
+def resolve_length(field: 'PayloadField | PaddingField', packet: 'dict[str, Any]') -> 'int':
+    """Resolve length of a payload or padding field.
+
+    Args:
+        field: Field descriptor.
+        packet: Packet data.
+
+    Returns:
+        Field length, i.e., :attr:`field(packet).length <FieldBase.length>`.
+
+    Note:
+        The length is resolved without creating new field instances, unless
+        the field has a custom callback, or the resolved length is invalid.
+
+    """
+    if field._callback is noop_callback:  # pylint: disable=protected-access
+        length_callback = field._length_callback  # pylint: disable=protected-access
+        length = field._length if length_callback is None else length_callback(packet)  # pylint: disable=protected-access
+        # NOTE: Negative length of payload fields means to read all the
+        # remaining data, whilst that of padding fields is invalid.
+        if length >= 0 or isinstance(field, PayloadField):
+            return length
+    return field(packet).length
+
+
+def read_buffer(buffer: 'bytes | memoryview', offset: 'int', size: 'int') -> 'tuple[bytes, int]':
+    """Read data from buffer, as what :meth:`io.BytesIO.read` does.
+
+    Args:
+        buffer: Data buffer.
+        offset: Offset to read from.
+        size: Size of data to read; if negative, read until the end.
+
+    Returns:
+        Data read, and the offset after reading.
+
+    """
+    end = offset + size if size >= 0 else len(buffer)
+    return bytes(buffer[offset:end]), end
+
+
 class SchemaMeta(abc.ABCMeta):
     """Meta class to add dynamic support to :class:`Schema`.
 
@@ -206,6 +246,10 @@ class SchemaMeta(abc.ABCMeta):
         if '__excluded__' not in attrs:
             attrs['__excluded__'] = []
 
+        # NOTE: Compiled unpackers are specific to the fields of each
+        # schema class, thus they shall not be shared with subclasses.
+        attrs['__compiled__'] = {}
+
         for base in bases:
             if hasattr(base, '__additional__'):
                 attrs['__additional__'].extend(name for name in base.__additional__ if name not in attrs['__additional__'])
@@ -237,6 +281,9 @@ class Schema(Mapping[str, _VT], Generic[_VT], metaclass=SchemaMeta):
         __buffer__: 'dict[str, bytes]'
         #: Flag for whether the schema is recently updated.
         __updated__: 'bool'
+        #: Compiled unpackers of leading fixed-length fields, keyed by the
+        #: packet data that the field callbacks depend on.
+        __compiled__: 'dict[tuple[tuple[str, ...], ...], dict[tuple[Any, ...], Optional[Unpacker]]]'
 
     #: Flag for finalised class initialisation.
     __finalised__: 'FinalisedState' = FinalisedState.NONE
@@ -586,6 +633,13 @@ class Schema(Mapping[str, _VT], Generic[_VT], metaclass=SchemaMeta):
             is used to potentially determine the length of the remaining
             padding field data.
 
+            The leading run of fixed-length fields is parsed at once by the
+            compiled :class:`~pcapkit.protocols.schema.compiler.Unpacker`,
+            and the rest of the fields are then parsed one by one.
+
+            In-memory data (i.e., :obj:`bytes` and :class:`io.BytesIO`) is
+            parsed directly from its buffer, c.f. :meth:`unpack_from`.
+
         """
         # force cast arg type since decorator changed their signatures
         if TYPE_CHECKING:
@@ -593,32 +647,58 @@ class Schema(Mapping[str, _VT], Generic[_VT], metaclass=SchemaMeta):
             length = cast('int', length)
             packet = cast('dict[str, Any]', packet)
 
+        if isinstance(data, io.BytesIO):
+            offset = data.tell()
+            with data.getbuffer() as buffer:
+                self, size = cls._unpack_from(buffer, offset, packet)
+            data.seek(offset + size, io.SEEK_SET)
+            return self
+
         self = cls.__new__(cls)
-        for field in self.__fields__.values():
-            field = field(packet)
+        fields = iter(self.__fields__.values())  # type: Iterator[FieldBase]
+
+        unpacker = Unpacker.from_schema(cls, packet)
+        if unpacker is not None and packet['__length__'] >= unpacker.size:
+            buffer = data.read(unpacker.size)
+            if len(buffer) == unpacker.size:
+                unpacker.unpack(self, buffer, 0, packet)
+                fields = itertools.islice(fields, len(unpacker.fields), None)
+            else:
+                # NOTE: The data is truncated, thus we fall back to parse
+                # the fields one by one, as to keep the same behaviours.
+                data.seek(-len(buffer), io.SEEK_CUR)
 
+        for field in fields:
             if isinstance(field, PayloadField):
-                payload_length = field.length or cast('int', packet['__length__'])
+                length = resolve_length(field, packet)
+                payload_length = length or cast('int', packet['__length__'])
 
                 payload = data.read(payload_length)
                 self.__buffer__[field.name] = payload
 
-                packet['__length__'] -= field.length
+                packet['__length__'] -= length
                 packet[field.name] = payload
 
                 setattr(self, field.name, payload)
                 continue
 
             if isinstance(field, PaddingField):
-                byte = data.read(field.length)
+                length = resolve_length(field, packet)
+
+                byte = data.read(length)
                 self.__buffer__[field.name] = byte
 
                 packet[field.name] = byte
-                packet['__length__'] -= field.length
+                packet['__length__'] -= length
 
                 setattr(self, field.name, byte)
                 continue
 
+            # NOTE: Conditional fields are tested upon the field descriptor
+            # directly, and only the underlying field will be resolved.
+            if not isinstance(field, ConditionalField):
+                field = field(packet)
+
             if isinstance(field, ConditionalField):
                 if not field.test(packet):
                     self.__buffer__[field.name] = b''
@@ -630,7 +710,7 @@ class Schema(Mapping[str, _VT], Generic[_VT], metaclass=SchemaMeta):
             byte = data.read(field.length)
             self.__buffer__[field.name] = byte
 
-            value = field.unpack(byte, packet.copy())
+            value = field.unpack(byte, packet)
             setattr(self, field.name, value)
 
             packet[field.name] = value
@@ -650,6 +730,130 @@ class Schema(Mapping[str, _VT], Generic[_VT], metaclass=SchemaMeta):
         self.__updated__ = False
         return self
 
+    @classmethod
+    def unpack_from(cls, buffer: 'bytes | memoryview', offset: 'int' = 0,
+                    length: 'Optional[int]' = None,
+                    packet: 'Optional[dict[str, Any]]' = None) -> 'tuple[Self, int]':
+        """Unpack :class:`Schema` from ``buffer`` starting at ``offset``.
+
+        Args:
+            buffer: Data buffer.
+            offset: Offset of the packed data in ``buffer``.
+            length: Length of data (default to the rest of ``buffer``).
+            packet: Unpacked data.
+
+        Returns:
+            Unpacked data as :class:`Schema`, and the number of bytes consumed.
+
+        Raises:
+            EOFError: If there is no data to unpack.
+
+        This method behaves as :meth:`unpack`, except that fields are parsed
+        directly from ``buffer`` with integer offsets, as to avoid creating
+        intermediate :class:`io.BytesIO` streams.
+
+        """
+        if length is None:
+            length = len(buffer) - offset
+        if length == 0:
+            raise EOFError
+
+        if packet is None:
+            packet = {}
+        packet['__length__'] = length
+
+        cls.pre_unpack(packet)
+        self, size = cls._unpack_from(buffer, offset, packet)
+        return cast('Self', self.post_process(packet)), size
+
+    @classmethod
+    def _unpack_from(cls, buffer: 'bytes | memoryview', offset: 'int',
+                     packet: 'dict[str, Any]') -> 'tuple[Self, int]':
+        """Unpack fields of :class:`Schema` from ``buffer``.
+
+        Args:
+            buffer: Data buffer.
+            offset: Offset of the packed data in ``buffer``.
+            packet: Unpacked data, with ``__length__`` key prepared.
+
+        Returns:
+            Unpacked data as :class:`Schema`, and the number of bytes consumed.
+
+        """
+        start = offset
+
+        self = cls.__new__(cls)
+        fields = iter(self.__fields__.values())  # type: Iterator[FieldBase]
+
+        unpacker = Unpacker.from_schema(cls, packet)
+        if (unpacker is not None and packet['__length__'] >= unpacker.size
+                and len(buffer) - offset >= unpacker.size):
+            unpacker.unpack(self, buffer, offset, packet)
+            fields = itertools.islice(fields, len(unpacker.fields), None)
+            offset += unpacker.size
+
+        for field in fields:
+            if isinstance(field, PayloadField):
+                length = resolve_length(field, packet)
+                payload_length = length or cast('int', packet['__length__'])
+
+                payload, offset = read_buffer(buffer, offset, payload_length)
+                self.__buffer__[field.name] = payload
+
+                packet['__length__'] -= length
+                packet[field.name] = payload
+
+                setattr(self, field.name, payload)
+                continue
+
+            if isinstance(field, PaddingField):
+                length = resolve_length(field, packet)
+
+                byte, offset = read_buffer(buffer, offset, length)
+                self.__buffer__[field.name] = byte
+
+                packet[field.name] = byte
+                packet['__length__'] -= length
+
+                setattr(self, field.name, byte)
+                continue
+
+            # NOTE: Conditional fields are tested upon the field descriptor
+            # directly, and only the underlying field will be resolved.
+            if not isinstance(field, ConditionalField):
+                field = field(packet)
+
+            if isinstance(field, ConditionalField):
+                if not field.test(packet):
+                    self.__buffer__[field.name] = b''
+                    setattr(self, field.name, None)
+                    packet[field.name] = NoValue
+                    continue
+                field = field.field(packet)
+
+            byte, end = read_buffer(buffer, offset, field.length)
+            self.__buffer__[field.name] = byte
+
+            value = field.unpack(byte, packet)
+            setattr(self, field.name, value)
+
+            packet[field.name] = value
+
+            if isinstance(field, OptionField):
+                packet['__option_padding__'] = field.option_padding
+
+            # NOTE: Forward matching fields do not consume any data.
+            if not isinstance(field, ForwardMatchField):
+                packet['__length__'] -= field.length
+                offset = end
+
+            if packet['__length__'] < 0:
+                warn(f'packet length < 0: {packet["__length__"]}',
+                     SchemaWarning, stacklevel=stacklevel())
+
+        self.__updated__ = False
+        return self, min(offset, len(buffer)) - start
+
     @classmethod
     def pre_unpack(cls, packet: 'dict[str, Any]') -> 'None':
         """Prepare ``packet`` data for unpacking process.
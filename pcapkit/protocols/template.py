@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""Packet Template
+=====================
+
+.. module:: pcapkit.protocols.template
+
+:mod:`pcapkit.protocols.template` contains the packet template class
+:class:`~pcapkit.protocols.template.Template` for crafting packets in
+bulk. A packet is constructed only once thru
+:meth:`Protocol.make <pcapkit.protocols.protocol.ProtocolBase.make>`,
+and then rendered with variations by patching its precomputed byte
+offsets, rather than constructing and packing the whole
+:class:`~pcapkit.protocols.schema.schema.Schema` for each packet.
+
+.. code-block:: python
+
+   from pcapkit.const.reg.ethertype import EtherType
+   from pcapkit.const.reg.linktype import LinkType
+   from pcapkit.const.reg.transtype import TransType
+   from pcapkit.protocols.internet.ipv4 import IPv4
+   from pcapkit.protocols.link.ethernet import Ethernet
+   from pcapkit.protocols.transport.tcp import TCP
+
+   template = Ethernet.template(
+       type=EtherType.Internet_Protocol_version_4,
+       payload=IPv4.template(
+           src='10.0.0.1', dst='10.0.0.2', protocol=TransType.TCP, ttl=64,
+           payload=TCP.template(srcport=1234, dstport=80, ack=True),
+       ),
+   )
+   template.dump('out.pcap', (
+       {'ipv4.id': index, 'tcp.seq': index * 100, 'payload': b'x' * (index % 10)}
+       for index in range(1_000_000)
+   ), linktype=LinkType.ETHERNET)
+
+"""
+import struct
+from typing import TYPE_CHECKING
+
+from pcapkit.corekit.fields.collections import ListField
+from pcapkit.corekit.fields.misc import ConditionalField, ForwardMatchField, PayloadField
+from pcapkit.corekit.fields.strings import PaddingField
+from pcapkit.corekit.infoclass import Info, info_final
+from pcapkit.utilities.exceptions import FieldValueError, MissingKeyError
+
+__all__ = ['Template', 'Layer', 'checksum', 'pseudo_header']
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from decimal import Decimal
+    from enum import IntEnum as StdlibIntEnum
+    from typing import Any, Iterable, Iterator, Mapping, Optional, Type
+
+    from aenum import IntEnum as AenumIntEnum
+
+    from pcapkit.const.reg.linktype import LinkType as Enum_LinkType
+    from pcapkit.corekit.fields.field import FieldBase as Field
+    from pcapkit.dumpkit.pcap import PCAPIO
+    from pcapkit.protocols.protocol import ProtocolBase as Protocol
+
+
+def checksum(data: 'bytes | bytearray | memoryview', initial: 'int' = 0) -> 'int':
+    """Calculate the Internet checksum (:rfc:`1071`).
+
+    Args:
+        data: Data to be checksummed.
+        initial: Initial (unfolded) sum, e.g., of the pseudo header.
+
+    Returns:
+        One's complement of the one's complement sum of ``data``.
+
+    """
+    if len(data) % 2:
+        data = bytes(data) + b'\x00'
+    total = initial + sum(struct.unpack(f'!{len(data) // 2}H', data))
+    while total >> 16:
+        total = (total & 0xffff) + (total >> 16)
+    return ~total & 0xffff
+
+
+def pseudo_header(buffer: 'bytearray', lower: 'Optional[Layer]', proto: 'int', length: 'int') -> 'Optional[int]':
+    """Calculate the (unfolded) sum of IPv4/IPv6 pseudo header.
+
+    Args:
+        buffer: Rendered packet data.
+        lower: Template layer of the lower protocol.
+        proto: Transport protocol number.
+        length: Upper-layer packet length.
+
+    Returns:
+        Sum of the pseudo header as 16-bit words, or :obj:`None` if the
+        lower protocol is not IPv4 nor IPv6, i.e., without ``src`` and
+        ``dst`` address fields.
+
+    """
+    if lower is None or 'src' not in lower.fields or 'dst' not in lower.fields:
+        return None
+
+    src_offset, src_size, _ = lower.fields['src']
+    dst_offset, dst_size, _ = lower.fields['dst']
+    if src_size not in (4, 16) or dst_size != src_size:
+        return None
+
+    start = lower.offset
+    addr = bytes(buffer[start + src_offset:start + src_offset + src_size]) + \
+        bytes(buffer[start + dst_offset:start + dst_offset + dst_size])
+    return sum(struct.unpack(f'!{len(addr) // 2}H', addr)) + proto + (length >> 16) + (length & 0xffff)
+
+
+@info_final
+class Layer(Info):
+    """Layer of a packet template."""
+
+    #: Protocol class.
+    protocol: 'Type[Protocol]'
+    #: Offset of the protocol header in the packet.
+    offset: 'int'
+    #: Length of the protocol header.
+    length: 'int'
+    #: Number of trailing octets after the protocol in the packet.
+    tail: 'int'
+    #: Fixed-length header fields, as mapping of field names to their offsets
+    #: (relative to the header), sizes and field descriptors.
+    fields: 'dict[str, tuple[int, int, Field]]'
+    #: Packet data for packing the header fields.
+    context: 'dict[str, Any]'
+
+    if TYPE_CHECKING:
+        def __init__(self, protocol: 'Type[Protocol]', offset: 'int', length: 'int', tail: 'int',
+                     fields: 'dict[str, tuple[int, int, Field]]', context: 'dict[str, Any]') -> 'None': ...  # pylint: disable=unused-argument,super-init-not-called,multiple-statements,line-too-long
+
+
+class Template:
+    """Packet template.
+
+    Args:
+        protocol: Protocol class of the (outermost) layer.
+        fix_checksum: Whether to recalculate checksum fields upon rendering.
+        **kwargs: Arguments for :meth:`protocol.make <pcapkit.protocols.protocol.ProtocolBase.make>`,
+            where the ``payload`` can be another :class:`Template` for the
+            next layer.
+
+    The variations for rendering are mappings of dotted field names, i.e.,
+    the lower-cased protocol name and the field name of its
+    :class:`~pcapkit.protocols.schema.schema.Schema`, such as ``ipv4.id``
+    and ``tcp.seq``, to their new values. The special ``payload`` key
+    replaces the payload of the innermost layer. Length and checksum
+    fields are then fixed thru the
+    :meth:`Protocol._fix_template <pcapkit.protocols.protocol.ProtocolBase._fix_template>`
+    method of each layer.
+
+    Note:
+        Only fixed-length header fields can be patched, i.e., options,
+        padding and other variable-length fields are rendered as is.
+
+    """
+
+    #: Rendered packet data of the template.
+    data: 'bytes'
+    #: Template layers, from the outermost to the innermost.
+    layers: 'tuple[Layer, ...]'
+
+    def __init__(self, protocol: 'Type[Protocol]', /, *, fix_checksum: 'bool' = True, **kwargs: 'Any') -> 'None':
+        inner = kwargs.get('payload')
+        if isinstance(inner, Template):
+            kwargs['payload'] = inner.data
+
+        context = {}  # type: dict[str, Any]
+        schema = protocol.__new__(protocol).make(**kwargs)
+        data = schema.pack(context)
+
+        offset = 0
+        fields = {}  # type: dict[str, tuple[int, int, Field]]
+        payload = (len(data), len(data))
+        for (name, field) in schema.__fields__.items():
+            size = len(schema.__buffer__[name])
+            if isinstance(field, PayloadField):
+                payload = (offset, offset + size)
+            elif size > 0 and not isinstance(field, (ListField, PaddingField, ForwardMatchField)):
+                field = field(context)
+                if isinstance(field, ConditionalField):
+                    field = field.field
+                fields[name] = (offset, size, field)
+            offset += size
+
+        header = Layer(protocol=protocol, offset=0, length=payload[0], tail=0,
+                       fields=fields, context=context)
+        layers = [header]
+        if isinstance(inner, Template):
+            start, stop = payload
+            for layer in inner.layers:
+                layers.append(Layer(protocol=layer.protocol, offset=start + layer.offset, length=layer.length,
+                                    tail=layer.tail + len(data) - stop, fields=layer.fields,
+                                    context=layer.context))
+            payload = (start + inner._payload[0], start + inner._payload[1])
+
+        self.data = data
+        self.layers = tuple(layers)
+
+        #: bool: Whether to recalculate checksum fields.
+        self._checksum = fix_checksum
+        #: tuple[int, int]: Range of the innermost payload.
+        self._payload = payload
+        #: dict[str, tuple[int, int, Field, dict[str, Any]]]: Patchable fields, as
+        #: mapping of dotted field names to their offsets, sizes, field descriptors
+        #: and packet data.
+        self._patches = {}  # type: dict[str, tuple[int, int, Field, dict[str, Any]]]
+
+        # NOTE: We iterate in reversed order, such that the outermost one
+        # takes precedence if the same protocol appears multiple times.
+        for layer in reversed(self.layers):
+            alias = layer.protocol.__name__.lower()
+            for (name, (offset, size, field)) in layer.fields.items():
+                self._patches[f'{alias}.{name}'] = (layer.offset + offset, size, field, layer.context)
+
+    def __len__(self) -> 'int':
+        return len(self.data)
+
+    def __bytes__(self) -> 'bytes':
+        return self.data
+
+    def __repr__(self) -> 'str':
+        chain = ':'.join(layer.protocol.__name__ for layer in self.layers)
+        return f'<{type(self).__name__} {chain} ({len(self.data)} bytes)>'
+
+    def render(self, variation: 'Optional[Mapping[str, Any]]' = None) -> 'bytes':
+        """Render a packet from the template.
+
+        Args:
+            variation: Mapping of dotted field names to their new values,
+                and/or the new ``payload`` of the innermost layer.
+
+        Returns:
+            Rendered packet data.
+
+        Raises:
+            MissingKeyError: If the field name is not patchable.
+            FieldValueError: If the packed field value mismatches the
+                length of the field.
+
+        """
+        buffer = bytearray(self.data)
+
+        if variation:
+            for (key, value) in variation.items():
+                if key == 'payload':
+                    continue
+
+                try:
+                    offset, size, field, context = self._patches[key]
+                except KeyError:
+                    raise MissingKeyError(f'{key!r} is not a patchable field of {self!r}') from None
+
+                data = field.pack(value, context)
+                if len(data) != size:
+                    raise FieldValueError(f'{key!r}: expected {size} bytes, but got {len(data)} bytes')
+                buffer[offset:offset + size] = data
+
+            payload = variation.get('payload')
+            if payload is not None:
+                start, stop = self._payload
+                buffer[start:stop] = payload
+
+        # NOTE: We fix the layers from the innermost to the outermost, such
+        # that the lengths and checksums of the upper layers are finalised
+        # before those of the lower layers are calculated.
+        layers = self.layers
+        for index in range(len(layers) - 1, -1, -1):
+            layers[index].protocol._fix_template(buffer, layers[index], layers[index - 1] if index else None,
+                                                 checksum=self._checksum)
+        return bytes(buffer)
+
+    def render_many(self, variations: 'Iterable[Optional[Mapping[str, Any]]]') -> 'Iterator[bytes]':
+        """Render packets from the template.
+
+        Args:
+            variations: Variations of each packet, c.f. :meth:`render`.
+
+        Yields:
+            Rendered packet data.
+
+        """
+        render = self.render
+        for variation in variations:
+            yield render(variation)
+
+    def dump(self, file: 'str | PCAPIO', variations: 'Iterable[Optional[Mapping[str, Any]]]', *,
+             linktype: 'Optional[Enum_LinkType | StdlibIntEnum | AenumIntEnum | int]' = None,
+             timestamp: 'Optional[float | Decimal | int | datetime]' = None,
+             interval: 'float | Decimal | int' = 0, **kwargs: 'Any') -> 'PCAPIO':
+        """Render packets from the template into a PCAP file.
+
+        Args:
+            file: Output file name, or a :class:`~pcapkit.dumpkit.pcap.PCAPIO` dumper.
+            variations: Variations of each packet, c.f. :meth:`render`.
+            linktype: Data link type of the output file, required if ``file``
+                is a file name.
+            timestamp: UNIX-Epoch timestamp of the first packet.
+            interval: Time interval between packets (in seconds).
+            **kwargs: Arbitrary keyword arguments for
+                :class:`~pcapkit.dumpkit.pcap.PCAPIO`.
+
+        Returns:
+            The PCAP dumper.
+
+        See Also:
+            :meth:`pcapkit.dumpkit.pcap.PCAPIO.dump_packets`
+
+        """
+        from pcapkit.dumpkit.pcap import PCAPIO  # pylint: disable=import-outside-toplevel
+
+        if isinstance(file, PCAPIO):
+            dumper = file
+        else:
+            if linktype is None:
+                raise FieldValueError('linktype is required to create a new PCAP file')
+            dumper = PCAPIO(file, protocol=linktype, **kwargs)
+        return dumper.dump_packets(self.render_many(variations), timestamp=timestamp, interval=interval)
@@ -131,6 +131,8 @@ from pcapkit.protocols.schema.transport.tcp import Timestamps as Schema_Timestam
 from pcapkit.protocols.schema.transport.tcp import UnassignedOption as Schema_UnassignedOption
 from pcapkit.protocols.schema.transport.tcp import UserTimeout as Schema_UserTimeout
 from pcapkit.protocols.schema.transport.tcp import WindowScale as Schema_WindowScale
+from pcapkit.protocols.template import checksum as calc_checksum
+from pcapkit.protocols.template import pseudo_header
 from pcapkit.protocols.transport.transport import Transport
 from pcapkit.utilities.exceptions import ProtocolError
 from pcapkit.utilities.warnings import RegistryWarning, warn
@@ -154,6 +156,7 @@ if TYPE_CHECKING:
     from pcapkit.protocols.schema.transport.tcp import Flags as Schema_Flags
     from pcapkit.protocols.schema.transport.tcp import MPTCPJoin as Schema_MPTCPJoin
     from pcapkit.protocols.schema.transport.tcp import Option as Schema_Option
+    from pcapkit.protocols.template import Layer
 
     Option = OrderedMultiDict[Enum_Option, Data_Option]
     OptionParser = Callable[[Schema_Option, NamedArg(Option, 'options')], Data_Option]
@@ -165,6 +168,42 @@ if TYPE_CHECKING:
 
 __all__ = ['TCP']
 
+#: tuple[str, ...]: TCP flag names, from the most significant bit of the raw
+#: flags octet, c.f. :class:`pcapkit.protocols.schema.transport.tcp.TCP`.
+FLAGS_NAMES = ('cwr', 'ece', 'urg', 'ack', 'psh', 'rst', 'syn', 'fin')
+
+#: list[Optional[tuple[Data_Flags, Enum_Flags]]]: Lookup table of TCP flags
+#: data models and connection control flags, indexed by the raw flags octet.
+#: Entries are filled upon first use, c.f. :func:`_get_flags`.
+FLAGS_TABLE = [None] * 256  # type: list[Optional[tuple[Data_Flags, Enum_Flags]]]
+
+
+def _get_flags(value: 'int') -> 'tuple[Data_Flags, Enum_Flags]':
+    """Get TCP flags from the lookup table.
+
+    Args:
+        value: Raw flags octet.
+
+    Returns:
+        The flags data model and the connection control flags.
+
+    Notes:
+        The returned values are shared among all TCP packets with the
+        same flags, thus should be treated as immutable.
+
+    """
+    entry = FLAGS_TABLE[value]
+    if entry is None:
+        flags = {name: bool(value & (0x80 >> index)) for index, name in enumerate(FLAGS_NAMES)}
+
+        _flag = cast('Enum_Flags', 0)
+        for key, val in flags.items():
+            if val:
+                _flag |= Enum_Flags.get(key.upper())
+
+        entry = FLAGS_TABLE[value] = (Data_Flags(**flags), _flag)
+    return entry
+
 
 class TCP(Transport[Data_TCP, Schema_TCP],
           schema=Schema_TCP, data=Data_TCP):
@@ -437,35 +476,28 @@ class TCP(Transport[Data_TCP, Schema_TCP],
             length = len(self)
         schema = self.__header__
 
+        # NOTE: The flags data model and connection control flags are
+        # looked up by the raw flags octet, which is only missing if the
+        # schema has not been packed yet.
+        _flag_raw = schema.__buffer__['flags']
+        if _flag_raw:
+            _flag_val = _flag_raw[0]
+        else:
+            _flag_val = sum(0x80 >> index for index, name in enumerate(FLAGS_NAMES) if schema.flags[name])
+        flags, self._flags = _get_flags(_flag_val)
+
         tcp = Data_TCP(
             srcport=schema.srcport,
             dstport=schema.dstport,
             seq=schema.seq,
             ack=schema.ack,
             hdr_len=schema.offset['offset'] * 4,
-            flags=Data_Flags(
-                #ns=bool(schema.offset['ns']),
-                cwr=bool(schema.flags['cwr']),
-                ece=bool(schema.flags['ece']),
-                urg=bool(schema.flags['urg']),
-                ack=bool(schema.flags['ack']),
-                psh=bool(schema.flags['psh']),
-                rst=bool(schema.flags['rst']),
-                syn=bool(schema.flags['syn']),
-                fin=bool(schema.flags['fin']),
-            ),
+            flags=flags,
             window_size=schema.window,
             checksum=schema.checksum,
             urgent_pointer=schema.urgent,
         )
 
-        # connection control flags
-        _flag = cast('Enum_Flags', 0)
-        for key, val in schema.flags.items():
-            if val == 1:
-                _flag |= Enum_Flags.get(key.upper())
-        self._flags = _flag
-
         tcp.__update__({
             'connection': self._flags,
         })
@@ -542,11 +574,7 @@ class TCP(Transport[Data_TCP, Schema_TCP],
             'fin': int(fin),
         }  # type: Schema_Flags
 
-        _flag = cast('Enum_Flags', 0)
-        for key, val in flags.items():
-            if val == 1:
-                _flag |= Enum_Flags.get(key.upper())
-        self._flags = _flag
+        _, self._flags = _get_flags(sum(0x80 >> index for index, name in enumerate(FLAGS_NAMES) if flags[name]))
 
         return Schema_TCP(
             srcport=srcport,
@@ -647,6 +675,34 @@ class TCP(Transport[Data_TCP, Schema_TCP],
             'payload': cls._make_payload(data),
         }
 
+    @classmethod
+    def _fix_template(cls, buffer: 'bytearray', layer: 'Layer', lower: 'Optional[Layer]' = None, *,
+                      checksum: 'bool' = True) -> 'None':
+        """Fix length and checksum fields of a rendered packet template.
+
+        Args:
+            buffer: Rendered packet data, to be fixed in place.
+            layer: Template layer of the current protocol.
+            lower: Template layer of the lower protocol, if any.
+            checksum: Whether to recalculate checksum fields.
+
+        Notes:
+            The checksum is calculated with the IPv4/IPv6 pseudo header, and
+            is left untouched if the lower protocol is neither of them.
+
+        """
+        if not checksum:
+            return
+
+        start, stop = layer.offset, len(buffer) - layer.tail
+        initial = pseudo_header(buffer, lower, 6, stop - start)
+        if initial is None:
+            return
+
+        offset = start + layer.fields['checksum'][0]
+        buffer[offset:offset + 2] = b'\x00\x00'
+        buffer[offset:offset + 2] = calc_checksum(buffer[start:stop], initial).to_bytes(2, 'big')
+
     def _read_tcp_options(self, size: 'int') -> 'Option':
         """Read TCP option list.
 
@@ -29,6 +29,8 @@ from pcapkit.const.reg.transtype import TransType as Enum_TransType
 from pcapkit.corekit.module import ModuleDescriptor
 from pcapkit.protocols.data.transport.udp import UDP as Data_UDP
 from pcapkit.protocols.schema.transport.udp import UDP as Schema_UDP
+from pcapkit.protocols.template import checksum as calc_checksum
+from pcapkit.protocols.template import pseudo_header
 from pcapkit.protocols.transport.transport import Transport
 
 if TYPE_CHECKING:
@@ -39,6 +41,7 @@ if TYPE_CHECKING:
     from pcapkit.const.reg.apptype import AppType as Enum_AppType
     from pcapkit.protocols.protocol import ProtocolBase as Protocol
     from pcapkit.protocols.schema.schema import Schema
+    from pcapkit.protocols.template import Layer
 
 __all__ = ['UDP']
 
@@ -212,3 +215,34 @@ class UDP(Transport[Data_UDP, Schema_UDP],
             'checksum': data.checksum,
             'payload': cls._make_payload(data),
         }
+
+    @classmethod
+    def _fix_template(cls, buffer: 'bytearray', layer: 'Layer', lower: 'Optional[Layer]' = None, *,
+                      checksum: 'bool' = True) -> 'None':
+        """Fix length and checksum fields of a rendered packet template.
+
+        Args:
+            buffer: Rendered packet data, to be fixed in place.
+            layer: Template layer of the current protocol.
+            lower: Template layer of the lower protocol, if any.
+            checksum: Whether to recalculate checksum fields.
+
+        Notes:
+            The datagram length is set as the length of the header and its
+            payload; and the checksum is calculated with the IPv4/IPv6 pseudo
+            header, where a computed value of zero is transmitted as all ones.
+
+        """
+        start, stop = layer.offset, len(buffer) - layer.tail
+        offset = start + layer.fields['len'][0]
+        buffer[offset:offset + 2] = (stop - start).to_bytes(2, 'big')
+
+        if checksum:
+            initial = pseudo_header(buffer, lower, 17, stop - start)
+            if initial is None:
+                return
+
+            offset = start + layer.fields['checksum'][0]
+            buffer[offset:offset + 2] = b'\x00\x00'
+            value = calc_checksum(buffer[start:stop], initial)
+            buffer[offset:offset + 2] = (value or 0xffff).to_bytes(2, 'big')
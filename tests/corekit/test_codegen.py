@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import atexit
+import importlib
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from tests._support import purge_modules
+
+RUNTIME_DEPS = ('tbtrim', 'aenum', 'chardet', 'dictdumper')
+HAS_RUNTIME = all(importlib.util.find_spec(name) is not None for name in RUNTIME_DEPS)
+
+SOURCE = (
+    'def __create_fn__():\n'
+    '    def __init__(self, value=DEFAULT):\n'
+    '        self.value = value\n'
+    '    return __init__\n'
+)
+
+
+@unittest.skipUnless(HAS_RUNTIME, 'runtime dependencies not installed')
+class CodegenTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        patcher = mock.patch.dict(os.environ, {'PCAPKIT_CACHE_DIR': self.tempdir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        purge_modules(['pcapkit'])
+
+    def _reload(self):
+        purge_modules(['pcapkit.corekit.codegen'])
+        codegen = importlib.import_module('pcapkit.corekit.codegen')
+        self.addCleanup(atexit.unregister, codegen._dump_cache)
+        return codegen
+
+    def test_generated_code_is_cached_on_disk(self) -> None:
+        codegen = self._reload()
+        self.assertTrue(codegen.CACHE_FILE.startswith(self.tempdir.name))
+
+        init = codegen.create_fn(SOURCE, {'DEFAULT': 42})
+        obj = type('Dummy', (), {'__init__': init})()
+        self.assertEqual(obj.value, 42)
+
+        codegen._dump_cache()
+        self.assertTrue(os.path.isfile(codegen.CACHE_FILE))
+        self.assertEqual(os.listdir(os.path.dirname(codegen.CACHE_FILE)), [os.path.basename(codegen.CACHE_FILE)])
+
+        codegen = self._reload()
+        with mock.patch.object(codegen, 'compile', create=True, side_effect=AssertionError('compiled')):
+            init = codegen.create_fn(SOURCE, {'DEFAULT': 'cached'})
+        self.assertEqual(type('Dummy', (), {'__init__': init})().value, 'cached')
+        self.assertFalse(codegen._CACHE_DIRTY)
+
+    def test_corrupted_or_disabled_cache(self) -> None:
+        codegen = self._reload()
+        os.makedirs(os.path.dirname(codegen.CACHE_FILE))
+        with open(codegen.CACHE_FILE, 'wb') as file:
+            file.write(b'\x00garbage')
+
+        init = codegen.create_fn(SOURCE, {'DEFAULT': 1})
+        self.assertEqual(type('Dummy', (), {'__init__': init})().value, 1)
+        self.assertTrue(codegen._CACHE_DIRTY)
+
+        with mock.patch.dict(os.environ, {'PCAPKIT_CACHE_DIR': ''}):
+            codegen = self._reload()
+            self.assertIsNone(codegen.CACHE_FILE)
+            init = codegen.create_fn(SOURCE, {'DEFAULT': 2})
+            codegen._dump_cache()
+        self.assertEqual(type('Dummy', (), {'__init__': init})().value, 2)
+
+    def test_finalised_classes_use_generated_init(self) -> None:
+        self._reload()
+        from pcapkit.corekit.infoclass import Info, info_final
+
+        @info_final
+        class Point(Info):
+            x: int
+            y: int
+
+        point = Point(1, y=2)
+        self.assertEqual((point.x, point.y), (1, 2))
+        self.assertEqual(Point.__init__.__qualname__, 'Point.__init__')
+
+
+if __name__ == '__main__':
+    unittest.main()
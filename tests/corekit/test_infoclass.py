@@ -59,7 +59,7 @@ class InfoClassTests(unittest.TestCase):
         bag = Bag({'items': 'conflict', 'visible': 1, 'hidden': 2}, extra=3)
         self.assertEqual(bag['items'], 'conflict')
         self.assertEqual(list(bag), ['items', 'visible', 'extra'])
-        self.assertEqual(len(bag), 6)
+        self.assertEqual(len(bag), 4)
         self.assertEqual(str(bag), 'Bag(items=conflict, visible=1, extra=3)')
         self.assertIn('items=', repr(bag))
         self.assertEqual(bag.to_dict(), {'items': 'conflict', 'visible': 1, 'extra': 3})
@@ -99,6 +99,52 @@ class InfoClassTests(unittest.TestCase):
         self.assertEqual(Info.from_dict({'a': 1}, b=2).to_dict(), {'a': 1, 'b': 2})
         self.assertEqual(Info.from_dict(c=3).to_dict(), {'c': 3})
 
+    def test_annotated_fields_are_slotted_and_picklable(self) -> None:
+        import copy
+        import pickle
+
+        from pcapkit.corekit.infoclass import Info, info_final
+        from pcapkit.protocols.data.internet.ipv4 import ToSField
+
+        class BasePoint(Info):
+            x: int
+
+        @info_final
+        class Point(BasePoint):
+            y: int
+
+        self.assertEqual(BasePoint.__slots__, ('x',))
+        self.assertEqual(Point.__slots__, ('y',))
+        self.assertEqual(list(Point.__layout__), ['x', 'y'])
+
+        point = Point(1, 2)
+        self.assertEqual(point.to_dict(), {'x': 1, 'y': 2})
+        self.assertEqual(len(point), 2)
+        self.assertFalse(Point.__extended__)
+
+        partial = Point.from_dict(y=2)
+        self.assertEqual(list(partial), ['y'])
+        with self.assertRaises(KeyError):
+            partial['x']
+        with self.assertRaises(AttributeError):
+            partial.x
+
+        extended = Point.from_dict({'items': 'conflict', 'y': 3, 'x': 4}, z=5)
+        self.assertTrue(Point.__extended__)
+        self.assertEqual(list(extended), ['x', 'y', 'items', 'z'])
+        self.assertEqual(extended['items'], 'conflict')
+        self.assertEqual(Point.__map__, {'items': '_Pointitems'})
+
+        restored = copy.copy(extended)
+        self.assertEqual(restored.to_dict(), extended.to_dict())
+        self.assertEqual(restored['items'], 'conflict')
+
+        tos = ToSField.from_dict({'pre': 1, 'del': 2, 'thr': 3, 'rel': 4, 'ecn': 5})
+        self.assertEqual(list(ToSField.__layout__), ['pre', 'del', 'thr', 'rel', 'ecn'])
+        self.assertEqual(tos['del'], 2)
+        self.assertFalse(ToSField.__extended__)
+        self.assertEqual(pickle.loads(pickle.dumps(tos)), tos)
+
 
 if __name__ == '__main__':
     unittest.main()
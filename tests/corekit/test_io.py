@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import gzip
 import io
 import os
+import struct
 import tempfile
 import unittest
+import zlib
 from unittest import mock
 
 from tests._support import bootstrap_core_modules, load_module, purge_modules
@@ -253,6 +256,103 @@ class SeekableReaderTests(unittest.TestCase):
         self._close_reader(reader)
 
 
+def make_bgzf_member(data: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+    body = compressor.compress(data) + compressor.flush()
+    size = 18 + len(body) + 8
+    return (b'\x1f\x8b\x08\x04' + b'\x00' * 4 + b'\x00\xff' + struct.pack('<H', 6)
+            + b'BC' + struct.pack('<HH', 2, size - 1) + body
+            + struct.pack('<II', zlib.crc32(data), len(data)))
+
+
+class ParallelGzipReaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        purge_modules(['pcapkit'])
+        modules = bootstrap_core_modules()
+        self.exceptions = modules['exceptions']
+        self.io_module = load_module('pcapkit.corekit.io', 'pcapkit/corekit/io.py')
+        self.ParallelGzipReader = self.io_module.ParallelGzipReader
+
+    def test_bgzf_and_plain_members_are_decoded_in_order(self) -> None:
+        chunks = [bytes([index]) * (50 + index) for index in range(20)]
+        data = b''.join(make_bgzf_member(chunk) for chunk in chunks[:10])
+        data += gzip.compress(b''.join(chunks[10:15]))
+        data += b''.join(make_bgzf_member(chunk) for chunk in chunks[15:]) + b'\x00' * 16
+        expected = b''.join(chunks)
+
+        raw = io.BytesIO(data)
+        reader = self.ParallelGzipReader(raw, workers=3, stream_closing=False)
+        self.assertTrue(reader.readable())
+        self.assertFalse(reader.seekable())
+        self.assertEqual(reader.peek(4), expected[:len(reader.peek(4))])
+        self.assertEqual(reader.read(7), expected[:7])
+        self.assertEqual(reader.read1(3), expected[7:10])
+        self.assertEqual(reader.tell(), 10)
+        self.assertEqual(reader.read(), expected[10:])
+        self.assertEqual(reader.read(), b'')
+
+        reader.close()
+        self.assertTrue(reader.closed)
+        self.assertFalse(raw.closed)
+
+        reader = self.ParallelGzipReader(io.BytesIO(data), workers=1)
+        self.assertEqual(reader.read1(), chunks[0])
+        reader.close()
+
+    def test_large_plain_member_is_streamed_and_non_gzip_data_rejected(self) -> None:
+        payload = os.urandom(300_000)
+        raw = io.BytesIO(gzip.compress(payload))
+        reader = self.ParallelGzipReader(raw, workers=2, stream_closing=True)
+        self.assertEqual(reader.read(1000), payload[:1000])
+        self.assertLess(len(reader._buffer), len(payload))
+        self.assertEqual(reader.read(), payload[1000:])
+        reader.close()
+        self.assertTrue(raw.closed)
+
+        reader = self.ParallelGzipReader(io.BytesIO(gzip.compress(b'ab') + b'garbage!!!'))
+        with self.assertRaises(self.exceptions.FormatError):
+            reader.read()
+        reader.close()
+
+
+
+class MemoryReaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        purge_modules(['pcapkit'])
+        modules = bootstrap_core_modules()
+        self.exceptions = modules['exceptions']
+        self.io_module = load_module('pcapkit.corekit.io', 'pcapkit/corekit/io.py')
+        self.MemoryReader = self.io_module.MemoryReader
+
+    def test_read_returns_slices_without_copying(self) -> None:
+        data = bytearray(b'abcdef')
+        reader = self.MemoryReader(memoryview(data))
+
+        head = reader.read(2)
+        self.assertIsInstance(head, memoryview)
+        self.assertEqual(head, b'ab')
+        data[0] = ord('x')
+        self.assertEqual(head, b'xb')
+
+        self.assertEqual(reader.read(), b'cdef')
+        self.assertEqual(reader.read(1), b'')
+        self.assertEqual(reader.tell(), 6)
+
+    def test_seek_and_readinto(self) -> None:
+        reader = self.MemoryReader(b'abcdef')
+
+        self.assertEqual(reader.seek(-2, io.SEEK_END), 4)
+        buffer = bytearray(4)
+        self.assertEqual(reader.readinto(buffer), 2)
+        self.assertEqual(bytes(buffer[:2]), b'ef')
+        self.assertEqual(reader.seek(1), 1)
+        self.assertEqual(reader.read(2), b'bc')
+
+        with self.assertRaises(self.exceptions.SeekError):
+            reader.seek(-1)
+        with self.assertRaises(self.exceptions.SeekError):
+            reader.seek(0, 3)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -95,6 +95,25 @@ class ProtoChainTests(unittest.TestCase):
         with self.assertRaises(self.exceptions.IndexNotFound):
             chain.index('Ethernet', start=1)
 
+    def test_protochain_from_loader_resolves_upon_access(self) -> None:
+        from unittest import mock
+
+        tail = self.protochain.ProtoChain(self.TCP())
+        loader = mock.Mock(return_value=tail)
+        lazy = self.protochain.ProtoChain.from_loader(loader)
+
+        chain = self.protochain.ProtoChain(self.IPv4(), basis=lazy)
+        merged = self.protochain.ProtoChain(self.Ethernet()) + chain
+        loader.assert_not_called()
+
+        self.assertEqual(merged.aliases, ('Ethernet', 'IPv4', 'TCP'))
+        self.assertEqual(chain.chain, 'IPv4:TCP')
+        self.assertEqual(len(lazy), 1)
+        loader.assert_called_once_with()
+
+        with self.assertRaises(AttributeError):
+            lazy.missing  # pylint: disable=pointless-statement
+
 
 if __name__ == '__main__':
     unittest.main()
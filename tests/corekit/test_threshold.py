@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import importlib.util
+import pickle
+import unittest
+
+from tests._support import purge_modules
+
+RUNTIME_DEPS = ('tbtrim', 'aenum', 'chardet', 'dictdumper')
+HAS_RUNTIME = all(importlib.util.find_spec(name) is not None for name in RUNTIME_DEPS)
+
+
+@unittest.skipUnless(HAS_RUNTIME, 'runtime dependencies not installed')
+class ThresholdTests(unittest.TestCase):
+    def setUp(self) -> None:
+        purge_modules(['pcapkit'])
+
+    def test_layer_and_protocol_thresholds(self) -> None:
+        from pcapkit.corekit.threshold import Threshold
+        from pcapkit.protocols.internet.ipv4 import IPv4
+        from pcapkit.protocols.internet.ipv6 import IPv6
+        from pcapkit.protocols.link.ethernet import Ethernet
+        from pcapkit.protocols.misc.raw import Raw
+        from pcapkit.protocols.transport.tcp import TCP
+
+        layer = Threshold('internet')
+        self.assertIn(IPv4, layer.terminal)
+        self.assertIn(IPv6, layer)
+        self.assertNotIn(Ethernet, layer)
+        self.assertNotIn(Raw, layer)
+
+        proto = Threshold(protocol='tcp')
+        self.assertEqual(proto.terminal, frozenset({TCP}))
+        self.assertNotIn(IPv4, proto)
+
+        by_class = Threshold(protocol=IPv4)
+        self.assertIn(IPv4, by_class)
+        self.assertNotIn(IPv6, by_class)
+
+        both = Threshold('link', 'tcp')
+        self.assertIn(Ethernet, both)
+        self.assertIn(TCP, both)
+        self.assertNotIn(IPv4, both)
+
+        self.assertEqual(Threshold().terminal, frozenset())
+        self.assertEqual(repr(both), "Threshold(layer='link', protocol='tcp')")
+
+        copied = pickle.loads(pickle.dumps(both))
+        self.assertEqual(copied.terminal, both.terminal)
+
+    def test_protocol_classes_defined_after_compilation(self) -> None:
+        from pcapkit.corekit.threshold import Threshold
+        from pcapkit.protocols.link.ethernet import Ethernet
+
+        plan = Threshold('link', 'mylink')
+
+        class MyLink(Ethernet):
+            @classmethod
+            def id(cls) -> tuple[str, ...]:
+                return ('MyLink',)
+
+        class Other(Ethernet):
+            __layer__ = None  # type: ignore[assignment]
+
+        self.assertNotIn(MyLink, plan.terminal)
+        self.assertIn(MyLink, plan)
+        self.assertNotIn(Other, plan)
+        self.assertEqual(plan._extra, {MyLink: True, Other: False})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+from tests._support import close_extractor, purge_modules
+
+RUNTIME_DEPS = ('tbtrim', 'aenum', 'chardet', 'dictdumper')
+HAS_RUNTIME = all(importlib.util.find_spec(name) is not None for name in RUNTIME_DEPS)
+
+SAMPLE = 'sample/in.pcap'
+
+
+def split_records(path: str) -> tuple[bytes, list[tuple[int, int, bytes]]]:
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    records = []
+    offset = 24
+    while offset + 16 <= len(data):
+        ts_sec, ts_usec, incl_len, _ = struct.unpack_from('<IIII', data, offset)
+        records.append((ts_sec, ts_usec, data[offset+16:offset+16+incl_len]))
+        offset += 16 + incl_len
+    return data[:24], records
+
+
+def make_pcap(header: bytes, records, *, nanosecond: bool = False) -> bytes:
+    if nanosecond:
+        header = b'\x4d\x3c\xb2\xa1' + header[4:]
+    data = header
+    for ts_sec, ts_usec, payload in records:
+        ts_frac = ts_usec * 1_000 if nanosecond else ts_usec
+        data += struct.pack('<IIII', ts_sec, ts_frac, len(payload), len(payload)) + payload
+    return data
+
+
+@unittest.skipUnless(HAS_RUNTIME, 'runtime dependencies not installed')
+class MergeEngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        purge_modules(['pcapkit'])
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def _extract(self, fin, **kwargs):
+        from pcapkit.interface import extract
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            extractor = extract(fin=fin, store=True, nofile=True, **kwargs)
+        self.addCleanup(close_extractor, extractor)
+        return extractor
+
+    def test_merged_frames_are_ordered_by_timestamp(self) -> None:
+        from pcapkit.foundation.engines.merge import Merge
+
+        header, records = split_records(SAMPLE)
+        odd = self._write('odd.pcap', make_pcap(header, records[1::2]))
+        even = self._write('even.pcap', make_pcap(header, records[0::2], nanosecond=True))
+
+        default = self._extract(SAMPLE)
+        merged = self._extract([odd, even])
+
+        self.assertIsInstance(merged._exeng, Merge)
+        self.assertEqual(len(merged._exeng.headers), 2)
+        self.assertEqual(merged.length, default.length)
+        self.assertEqual([frame.info.number for frame in merged.frame], list(range(1, default.length + 1)))
+        for expected, actual in zip(default.frame, merged.frame):
+            self.assertEqual(actual.info.time_epoch, expected.info.time_epoch)
+            self.assertEqual(actual.info.len, expected.info.len)
+            self.assertEqual(str(actual.protochain), str(expected.protochain))
+            self.assertEqual(bytes(actual.payload), bytes(expected.payload))
+
+    def test_identical_timestamps_keep_input_order(self) -> None:
+        header, records = split_records(SAMPLE)
+        first = self._write('first.pcap', make_pcap(header, [(1, 0, payload) for _, _, payload in records[:2]]))
+        second = self._write('second.pcap', make_pcap(header, [(1, 0, payload) for _, _, payload in records[2:4]]))
+
+        merged = self._extract((second, first))
+        self.assertEqual([bytes(frame.payload) for frame in merged.frame],
+                         [payload for _, _, payload in records[2:4] + records[:2]])
+
+    def test_merge_under_manual_iteration(self) -> None:
+        header, records = split_records(SAMPLE)
+        path = self._write('only.pcap', make_pcap(header, records[:3]))
+
+        merged = self._extract([path], auto=False)
+        self.assertEqual(next(merged).info.number, 1)
+        self.assertEqual(len(list(merged)), 2)
+
+    def test_merge_rejects_unsupported_inputs(self) -> None:
+        from pcapkit.utilities.exceptions import FileNotFound, FormatError, UnsupportedCall
+
+        header, records = split_records(SAMPLE)
+        good = self._write('good.pcap', make_pcap(header, records[:2]))
+        other = self._write('other.pcap', make_pcap(header[:20] + struct.pack('<I', 101), records[2:4]))
+
+        with self.assertRaises(FormatError):
+            self._extract([good, other])
+        with self.assertRaises(FormatError):
+            self._extract([good, 'sample/dhcp.pcapng'])
+        with self.assertRaises(FileNotFound):
+            self._extract([good, os.path.join(self.tmpdir, 'missing.pcap')])
+
+        merged = self._extract([good], auto=False)
+        with self.assertRaises(UnsupportedCall):
+            merged.index  # pylint: disable=pointless-statement
+
+    def test_merge_ignores_parallel_no_eof_and_engine_options(self) -> None:
+        header, records = split_records(SAMPLE)
+        path = self._write('only.pcap', make_pcap(header, records))
+
+        with mock.patch('pcapkit.foundation.extraction.warn') as warn:
+            merged = self._extract([path], workers=2, no_eof=True, engine='mmap')
+        self.assertEqual(merged.length, len(records))
+        self.assertFalse(merged._flag_n)
+        messages = [str(call.args[0]) for call in warn.call_args_list]
+        self.assertTrue(any('no_eof' in message for message in messages))
+        self.assertTrue(any('merge engine' in message for message in messages))
+        self.assertTrue(any('multi-process' in message for message in messages))
+
+
+if __name__ == '__main__':
+    unittest.main()
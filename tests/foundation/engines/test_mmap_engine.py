@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import os
+import threading
+import unittest
+import warnings
+
+from tests._support import close_extractor, purge_modules
+
+RUNTIME_DEPS = ('tbtrim', 'aenum', 'chardet', 'dictdumper')
+HAS_RUNTIME = all(importlib.util.find_spec(name) is not None for name in RUNTIME_DEPS)
+
+SAMPLE = 'sample/in.pcap'
+
+
+@unittest.skipUnless(HAS_RUNTIME, 'runtime dependencies not installed')
+class MMAPEngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        purge_modules(['pcapkit'])
+
+    def _extract(self, fin, **kwargs):
+        from pcapkit.interface import extract
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            extractor = extract(fin=fin, fout='/tmp/pypcapkit-out', format='tree', store=True, nofile=True, **kwargs)
+        self.addCleanup(close_extractor, extractor)
+        return extractor
+
+    def test_mmap_engine_matches_streaming_engine(self) -> None:
+        from pcapkit.foundation.engines.mmap import MMAP
+
+        default = self._extract(SAMPLE)
+        mapped = self._extract(SAMPLE, engine='mmap')
+
+        self.assertIsInstance(mapped._exeng, MMAP)
+        self.assertTrue(mapped._exeng.mapped)
+        self.assertIsNone(mapped._exeng._mmap)
+        self.assertEqual(mapped.length, default.length)
+        for expected, actual in zip(default.frame, mapped.frame):
+            self.assertEqual(actual.info.frame_info, expected.info.frame_info)
+            self.assertEqual(str(actual.protochain), str(expected.protochain))
+            self.assertEqual(bytes(actual.payload), bytes(expected.payload))
+
+    def test_mmap_frames_hold_exact_record_bytes(self) -> None:
+        with open(SAMPLE, 'rb') as file:
+            raw = file.read()
+
+        mapped = self._extract(SAMPLE, engine='mmap')
+        offset = 24
+        for frame in mapped.frame:
+            length = 16 + frame.info.len
+            self.assertIsInstance(frame.data, memoryview)
+            self.assertEqual(frame.data, raw[offset:offset+length])
+            self.assertEqual(bytes(frame), raw[offset:offset+length])
+            self.assertIsInstance(frame.info.packet, bytes)
+            self.assertIs(frame.info.packet, frame.payload.data)
+            offset += length
+        self.assertEqual(offset, len(raw))
+
+    def test_mmap_engine_falls_back_for_pipes(self) -> None:
+        with open(SAMPLE, 'rb') as file:
+            raw = file.read()
+
+        rfd, wfd = os.pipe()
+
+        def writer() -> None:
+            os.write(wfd, raw)
+            os.close(wfd)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        with os.fdopen(rfd, 'rb') as pipe:
+            mapped = self._extract(pipe, engine='mmap')
+        thread.join()
+
+        self.assertFalse(mapped._exeng.mapped)
+        self.assertEqual(mapped.length, 6)
+
+    def test_mmap_engine_rejects_pcapng_input(self) -> None:
+        from pcapkit.utilities.exceptions import FormatError
+
+        with self.assertRaises(FormatError):
+            self._extract('sample/dhcp.pcapng', engine='mmap')
+
+    def test_frame_accepts_memoryview_buffer(self) -> None:
+        from pcapkit.protocols.misc.pcap.frame import Frame
+        from pcapkit.protocols.misc.pcap.header import Header
+
+        with open(SAMPLE, 'rb') as file:
+            raw = file.read()
+        header = Header(io.BytesIO(raw[:24]))
+        view = memoryview(raw)
+        frame = Frame(view[24:], num=1, header=header.info)
+
+        self.assertEqual(frame.data, raw[24:24+16+frame.info.len])
+        view.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
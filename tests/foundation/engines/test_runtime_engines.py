@@ -45,6 +45,8 @@ def make_extractor(**overrides):
         '_flag_r': True,
         '_flag_t': True,
         '_flag_d': True,
+        '_flag_n': False,
+        '_flag_l': False,
         '_ipv4': True,
         '_ipv6': True,
         '_tcp': True,
@@ -54,6 +56,7 @@ def make_extractor(**overrides):
         '_frnum': 0,
         '_exlyr': 'none',
         '_exptl': 'null',
+        '_explan': None,
         '_vfunc': mock.Mock(),
         'magic_number': b'\xa1\xb2\xc3\xd4',
     }
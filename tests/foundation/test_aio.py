@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import pathlib
+import threading
+import unittest
+import warnings
+
+from tests._support import purge_modules
+
+RUNTIME_DEPS = ('tbtrim', 'aenum', 'chardet', 'dictdumper')
+HAS_RUNTIME = all(importlib.util.find_spec(name) is not None for name in RUNTIME_DEPS)
+
+
+@unittest.skipUnless(HAS_RUNTIME, 'runtime dependencies not installed')
+class AsyncExtractorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        purge_modules(['pcapkit'])
+        warnings.simplefilter('ignore')
+        self.addCleanup(warnings.resetwarnings)
+
+    @staticmethod
+    async def _collect(extractor) -> list:
+        async with extractor:
+            return [frame async for frame in extractor]
+
+    def _assert_same_frames(self, sample: str, frames: list) -> None:
+        from pcapkit.foundation.extraction import Extractor
+
+        expected = Extractor(sample, nofile=True)
+        self.assertEqual(len(frames), expected.length)
+        for actual, frame in zip(frames, expected.frame):
+            # NOTE: the raw ``packet`` bytes of the streaming engines extend
+            # beyond the current record, thus not comparable here
+            self.assertEqual({key: value for key, value in actual.info.to_dict().items() if key != 'packet'},
+                             {key: value for key, value in frame.info.to_dict().items() if key != 'packet'})
+            self.assertEqual(str(actual.protochain), str(frame.protochain))
+
+    def test_file_name_and_stream_reader_inputs(self) -> None:
+        from pcapkit.foundation.aio import AsyncExtractor
+
+        extractor = AsyncExtractor('sample/in.pcap', nofile=True)
+        frames = asyncio.run(self._collect(extractor))
+        self._assert_same_frames('sample/in.pcap', frames)
+        self.assertEqual(extractor.length, len(frames))
+        self.assertTrue(extractor.extractor._flag_e)
+
+        async def from_reader() -> list:
+            reader = asyncio.StreamReader()
+            reader.feed_data(pathlib.Path('sample/dhcp.pcapng').read_bytes())
+            reader.feed_eof()
+            return await self._collect(AsyncExtractor(reader, nofile=True))
+
+        self._assert_same_frames('sample/dhcp.pcapng', asyncio.run(from_reader()))
+
+    def test_pipe_input_is_read_without_blocking(self) -> None:
+        from pcapkit.foundation.aio import AsyncExtractor
+
+        raw = pathlib.Path('sample/in.pcap').read_bytes()
+        rfd, wfd = os.pipe()
+
+        def writer() -> None:
+            for offset in range(0, len(raw), 50):
+                os.write(wfd, raw[offset:offset+50])
+            os.close(wfd)
+
+        async def from_pipe() -> list:
+            thread = threading.Thread(target=writer)
+            thread.start()
+            with os.fdopen(rfd, 'rb') as pipe:
+                extractor = AsyncExtractor(pipe, nofile=True)
+                frames = await self._collect(extractor)
+                self.assertIsNotNone(extractor._reader)
+            thread.join()
+            return frames
+
+        self._assert_same_frames('sample/in.pcap', asyncio.run(from_pipe()))
+
+    def test_unknown_format_and_unstarted_extractor(self) -> None:
+        from pcapkit.foundation.aio import AsyncExtractor
+        from pcapkit.utilities.exceptions import FormatError, UnsupportedCall
+
+        async def from_garbage() -> None:
+            reader = asyncio.StreamReader()
+            reader.feed_data(b'\x00' * 32)
+            reader.feed_eof()
+            await AsyncExtractor(reader, nofile=True).start()
+
+        with self.assertRaises(FormatError):
+            asyncio.run(from_garbage())
+
+        extractor = AsyncExtractor('sample/in.pcap', nofile=True, engine='dpkt')
+        self.assertEqual(extractor.length, 0)
+        with self.assertRaises(UnsupportedCall):
+            extractor.extractor  # pylint: disable=pointless-statement
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -96,6 +96,12 @@ class ExtractorTests(unittest.TestCase):
         extractor._flag_e = False
         extractor._flag_a = False
         extractor._flag_n = False
+        extractor._flag_l = False
+        extractor._idle = None
+        extractor._fstat = None
+        extractor._nproc = 1
+        extractor._nthrd = 1
+        extractor._mfnm = None
         return extractor
 
     def test_properties_success_and_unsupported_paths(self) -> None:
@@ -519,6 +525,219 @@ class ExtractorTests(unittest.TestCase):
             self.assertTrue(hasattr(unknown_output, '_ofile'))
             unknown_output._ifile.close()
 
+    def test_get_frame_random_access_through_index(self) -> None:
+        import shutil
+
+        from pcapkit.foundation.extraction import Extractor
+        from pcapkit.utilities.exceptions import UnsupportedCall
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp = pathlib.Path(tmpdir)
+            for sample in ('in.pcap', 'dhcp.pcapng'):
+                capture = temp / sample
+                shutil.copyfile(pathlib.Path('sample') / sample, capture)
+
+                full = Extractor(str(capture), str(temp / 'full'), nofile=True)
+                lazy = Extractor(str(capture), str(temp / 'lazy'), nofile=True, store=False, auto=False)
+
+                self.assertEqual(lazy.index.length, len(full.frame))
+                self.assertTrue((temp / f'{sample}.pcapidx').exists())
+                for number, expected in enumerate(full.frame):
+                    self.assertEqual(lazy.get_frame(number).info.to_dict(), expected.info.to_dict())
+                self.assertEqual(lazy[-1].info.to_dict(), full.frame[-1].info.to_dict())
+                self.assertEqual([frame.info.to_dict() for frame in lazy[1:3]],
+                                 [frame.info.to_dict() for frame in full.frame[1:3]])
+                self.assertEqual(lazy._frnum, 0)
+                self.assertIs(full.get_frame(0), full.frame[0])
+                with self.assertRaises(IndexError):
+                    lazy.get_frame(len(full.frame))
+                lazy._ifile.close()
+
+            with open(temp / 'in.pcap', 'rb') as file:
+                stream = Extractor(file, str(temp / 'stream'), nofile=True, store=False, auto=False)
+                position = file.tell()
+                self.assertEqual(stream.get_frame(2).info.number, 3)
+                self.assertEqual(file.tell(), position)
+
+            nonseekable = NonSeekableBytesIO((temp / 'in.pcap').read_bytes())
+            with mock.patch.object(Extractor, 'run'):
+                wrapped = Extractor(nonseekable, str(temp / 'wrapped'), nofile=True, store=False, auto=False)
+            with self.assertRaises(UnsupportedCall):
+                wrapped.get_frame(0)
+            wrapped._ifile.close()
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy') is not None, 'numpy not installed')
+    def test_frame_table_matches_decoded_frames(self) -> None:
+        from pcapkit.foundation.extraction import Extractor
+
+        for sample in ('in.pcap', 'dhcp.pcapng'):
+            with self.subTest(sample=sample):
+                extractor = Extractor(f'sample/{sample}', nofile=True, sidecar=False)
+                table = extractor.frame_table()
+                self.assertEqual(len(table), len(extractor.frame))
+                self.assertEqual(table['incl_len'].tolist(), [frame.info.captured_len if sample.endswith('ng')
+                                                              else frame.info.len for frame in extractor.frame])
+                self.assertEqual(table['offset'].tolist(), list(extractor.index.offset))
+                self.assertEqual(table['interface'].tolist(), [0] * len(table))
+                extractor._ifile.close()
+
+    def test_index_sidecar_option_is_passed_through(self) -> None:
+        import shutil
+
+        from pcapkit.interface import extract
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp = pathlib.Path(tmpdir)
+            capture = temp / 'in.pcap'
+            shutil.copyfile(pathlib.Path('sample') / 'in.pcap', capture)
+
+            nosidecar = extract(str(capture), str(temp / 'out'), nofile=True, auto=False, sidecar=False)
+            self.assertEqual(nosidecar.index.length, 6)
+            self.assertEqual(sorted(path.name for path in temp.iterdir()), ['in.pcap'])
+            nosidecar._ifile.close()
+
+            custom = extract(str(capture), str(temp / 'out'), nofile=True, auto=False, sidecar=str(temp / 'custom.idx'))
+            self.assertEqual(custom.index.length, 6)
+            self.assertEqual(sorted(path.name for path in temp.iterdir()), ['custom.idx', 'in.pcap'])
+            custom._ifile.close()
+
+    def test_parallel_extraction_matches_single_process(self) -> None:
+        import shutil
+
+        from pcapkit.foundation.extraction import Extractor
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp = pathlib.Path(tmpdir)
+            for sample in ('in.pcap', 'dhcp.pcapng'):
+                shutil.copyfile(pathlib.Path('sample') / sample, temp / sample)
+
+            serial = Extractor(str(temp / 'in.pcap'), str(temp / 'serial'), format='json')
+            parallel = Extractor(str(temp / 'in.pcap'), str(temp / 'parallel'), format='json', workers=2)
+
+            self.assertEqual(parallel.length, serial.length)
+            self.assertEqual([frame.info.to_dict() for frame in parallel.frame],
+                             [frame.info.to_dict() for frame in serial.frame])
+            self.assertEqual((temp / 'parallel.json').read_text(), (temp / 'serial.json').read_text())
+            self.assertTrue(parallel._flag_e)
+
+            options = dict(format='json', store=False, reassembly=True, trace=True, ip=True, tcp=True)
+            expected = Extractor(str(temp / 'in.pcap'), str(temp / 'expected'), **options)
+            with mock.patch.object(Extractor, 'PARALLEL_CHUNK_SIZE', 2):
+                summary = Extractor(str(temp / 'in.pcap'), str(temp / 'summary'), workers=2, **options)
+            self.assertEqual(summary.length, serial.length)
+            self.assertEqual((temp / 'summary.json').read_text(), (temp / 'serial.json').read_text())
+            self.assertEqual(summary.reassembly, expected.reassembly)
+            self.assertEqual(summary.trace, expected.trace)
+
+            with mock.patch('pcapkit.foundation.extraction.warn') as warn:
+                fallback = Extractor(str(temp / 'dhcp.pcapng'), str(temp / 'fallback'), nofile=True, workers=2)
+            self.assertEqual(fallback.length, 4)
+            self.assertTrue(any('multi-process' in str(call.args[0]) for call in warn.call_args_list))
+
+    def test_layer_and_protocol_thresholds_share_compiled_plan(self) -> None:
+        from pcapkit.foundation.extraction import Extractor
+        from pcapkit.protocols.internet.ipv6 import IPv6
+        from pcapkit.protocols.misc.raw import Raw
+
+        default = Extractor('sample/in.pcap', nofile=True)
+        self.assertIsNone(default._explan)
+        self.assertEqual(str(default.frame[0].protochain), 'Ethernet:IPv6:IPv6_ICMP')
+
+        link = Extractor('sample/in.pcap', nofile=True, layer='Link')
+        self.assertEqual(link._explan.layer, 'link')
+        for frame in link.frame:
+            self.assertIs(frame._explan, link._explan)
+            self.assertIs(frame.payload._explan, link._explan)
+            self.assertIsInstance(frame.payload.payload, Raw)
+
+        proto = Extractor('sample/in.pcap', nofile=True, protocol='IPv6')
+        ipv6 = [frame.payload.payload for frame in proto.frame if isinstance(frame.payload.payload, IPv6)]
+        self.assertTrue(ipv6)
+        for packet in ipv6:
+            self.assertIsInstance(packet.payload, Raw)
+        self.assertIs(proto.get_frame(0)._explan, proto._explan)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parallel = Extractor('sample/in.pcap', str(pathlib.Path(tmpdir) / 'out'), format='json',
+                                 protocol='IPv6', workers=2)
+            self.assertEqual([frame.info.to_dict() for frame in parallel.frame],
+                             [frame.info.to_dict() for frame in proto.frame])
+
+    def test_compressed_input_is_decompressed_transparently(self) -> None:
+        import bz2
+        import gzip
+        import lzma
+
+        from pcapkit.foundation.engines.mmap import MMAP
+        from pcapkit.foundation.extraction import Extractor
+        from pcapkit.utilities.exceptions import UnsupportedCall
+        from tests.corekit.test_io import make_bgzf_member
+
+        raw = pathlib.Path('sample/in.pcap').read_bytes()
+        bgzf = b''.join(make_bgzf_member(raw[offset:offset+100]) for offset in range(0, len(raw), 100))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp = pathlib.Path(tmpdir)
+            captures = {
+                'in.pcap.gz': (gzip.compress(raw), 'gzip', 1),
+                'in.pcap.xz': (lzma.compress(raw), 'xz', 1),
+                'in.pcap.bz2': (bz2.compress(raw), 'bz2', 1),
+                'bgzf.pcap.gz': (bgzf, 'gzip', 2),
+            }
+
+            plain = Extractor('sample/in.pcap', nofile=True)
+            self.assertIsNone(plain.compression)
+            for name, (data, compression, workers) in captures.items():
+                (temp / name).write_bytes(data)
+                with mock.patch('pcapkit.foundation.extraction.warn') as warn:
+                    extractor = Extractor(str(temp / name), nofile=True, decompress_workers=workers)
+                self.assertFalse(any('multi-process' in str(call.args[0]) for call in warn.call_args_list))
+
+                self.assertEqual(extractor.compression, compression)
+                self.assertEqual(extractor.magic_number, plain.magic_number)
+                self.assertEqual(extractor.length, plain.length)
+                for expected, actual in zip(plain.frame, extractor.frame):
+                    self.assertEqual(actual.info.frame_info, expected.info.frame_info)
+                    self.assertEqual(str(actual.protochain), str(expected.protochain))
+                with self.assertRaises(UnsupportedCall):
+                    extractor.get_frame(0)
+
+            with mock.patch('pcapkit.foundation.engines.mmap.warn') as warn:
+                mapped = Extractor(str(temp / 'in.pcap.gz'), nofile=True, engine='mmap')
+            self.assertIsInstance(mapped._exeng, MMAP)
+            self.assertFalse(mapped._exeng.mapped)
+            self.assertEqual(mapped.length, plain.length)
+            warn.assert_called_once()
+
+            ifnm, *_ = Extractor.make_name(str(temp / 'in.pcap.xz'), nofile=True)
+            self.assertEqual(ifnm, str(temp / 'in.pcap.xz'))
+
+    def test_no_eof_follows_growing_file_and_stops_when_idle(self) -> None:
+        from pcapkit.foundation.extraction import Extractor
+
+        for sample, cut in (('sample/in.pcap', 24 + 16 + 30), ('sample/dhcp.pcapng', 200)):
+            raw = pathlib.Path(sample).read_bytes()
+            plain = Extractor(sample, nofile=True)
+
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = pathlib.Path(tmpdir) / pathlib.Path(sample).name
+                path.write_bytes(raw[:cut])
+
+                def grow(_: float) -> None:
+                    with path.open('ab') as file:
+                        file.write(raw[path.stat().st_size:path.stat().st_size+100])
+
+                with mock.patch('pcapkit.foundation.extraction.time.sleep', side_effect=grow) as sleep, \
+                        mock.patch('pcapkit.foundation.extraction.warn'):
+                    extractor = Extractor(str(path), nofile=True, no_eof=True, idle_timeout=0.1)
+
+                self.assertTrue(sleep.called)
+                self.assertEqual(extractor.length, plain.length)
+                for expected, actual in zip(plain.frame, extractor.frame):
+                    self.assertEqual(actual.info.to_dict().keys(), expected.info.to_dict().keys())
+                    self.assertEqual(actual.payload.data, expected.payload.data)
+                    self.assertEqual(str(actual.protochain), str(expected.protochain))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+from unittest import mock
+
+from tests._support import purge_modules
+
+RUNTIME_DEPS = ('tbtrim', 'aenum', 'chardet', 'dictdumper')
+HAS_RUNTIME = all(importlib.util.find_spec(name) is not None for name in RUNTIME_DEPS)
+
+
+def make_pcap(records, *, magic=b'\xd4\xc3\xb2\xa1', endian='<') -> bytes:
+    data = magic + struct.pack(f'{endian}HHiIII', 2, 4, 0, 0, 65535, 1)
+    for ts_sec, ts_frac, payload in records:
+        data += struct.pack(f'{endian}IIII', ts_sec, ts_frac, len(payload), len(payload)) + payload
+    return data
+
+
+def make_pcapng(blocks, *, interfaces=1) -> bytes:
+    def block(block_type, body):
+        body += b'\x00' * (-len(body) % 4)
+        return struct.pack('<II', block_type, len(body) + 12) + body + struct.pack('<I', len(body) + 12)
+
+    data = block(0x0A0D0D0A, struct.pack('<IHHq', 0x1A2B3C4D, 1, 0, -1))
+    for _ in range(interfaces):
+        data += block(0x00000001, struct.pack('<HHI', 1, 0, 0))
+    for timestamp, payload, *iface in blocks:
+        if timestamp is None:
+            data += block(0x00000003, struct.pack('<I', len(payload)) + payload)
+        else:
+            data += block(0x00000006, struct.pack('<IIIII', *(iface or [0]), timestamp >> 32, timestamp & 0xFFFFFFFF,
+                                                  len(payload), len(payload)) + payload)
+    return data
+
+
+@unittest.skipUnless(HAS_RUNTIME, 'runtime dependencies not installed')
+class FrameIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        purge_modules(['pcapkit'])
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def test_scan_pcap_records_offsets_timestamps_and_lengths(self) -> None:
+        from pcapkit.foundation.index import FrameIndex
+
+        data = make_pcap([(1, 500_000, b'a' * 10), (2, 0, b'b' * 4)])
+        index = FrameIndex.scan(io.BytesIO(data))
+
+        self.assertEqual(index.format, 'pcap')
+        self.assertEqual(len(index), 2)
+        self.assertEqual(list(index.offset), [24, 24 + 16 + 10])
+        self.assertEqual(list(index.timestamp), [1_500_000_000, 2_000_000_000])
+        self.assertEqual(list(index.incl_len), [10, 4])
+        self.assertEqual(index.time_range, (1_500_000_000, 2_000_000_000))
+        self.assertEqual(index[-1].number, 2)
+        with self.assertRaises(IndexError):
+            index[2]  # pylint: disable=pointless-statement
+
+    def test_scan_handles_big_endian_nanosecond_and_truncated_input(self) -> None:
+        from pcapkit.foundation.index import FrameIndex
+
+        data = make_pcap([(3, 7, b'xy'), (4, 8, b'z' * 20)], magic=b'\xa1\xb2\x3c\x4d', endian='>')
+        index = FrameIndex.scan(io.BytesIO(data[:-5]))
+
+        self.assertEqual(list(index.timestamp), [3_000_000_007])
+        self.assertEqual(index.size, len(data) - 5)
+
+    def test_scan_pcapng_excludes_simple_packet_blocks_from_time_range(self) -> None:
+        from pcapkit.foundation.index import NO_TIMESTAMP, FrameIndex
+
+        data = make_pcapng([(2_000_000, b'a' * 5), (None, b'b' * 6), (3_000_000, b'c' * 7)])
+        index = FrameIndex.scan(io.BytesIO(data))
+
+        self.assertEqual(index.format, 'pcapng')
+        self.assertEqual(list(index.incl_len), [5, 6, 7])
+        self.assertEqual(list(index.timestamp), [2_000_000_000, NO_TIMESTAMP, 3_000_000_000])
+        self.assertIsNone(index[1].timestamp)
+        self.assertEqual(index.time_range, (2_000_000_000, 3_000_000_000))
+
+        index = FrameIndex.scan(io.BytesIO(make_pcapng([(None, b'b' * 6)])))
+        self.assertEqual(len(index), 1)
+        self.assertIsNone(index.time_range)
+
+    def test_scan_pcap_in_bulk_across_buffer_boundaries(self) -> None:
+        from pcapkit.foundation.index import FrameIndex
+
+        records = [(n, 0, bytes([n]) * (n * 7 % 50)) for n in range(200)] + [(200, 0, b'x' * 300)]
+        data = make_pcap(records)
+        with mock.patch('pcapkit.foundation.index.SCAN_BUFFER_SIZE', 64):
+            index = FrameIndex.scan(io.BytesIO(data))
+        self.assertEqual(list(index.offset), list(FrameIndex.scan(io.BytesIO(data)).offset))
+        self.assertEqual(list(index.incl_len), [len(payload) for _, _, payload in records])
+        self.assertEqual(list(index.interface), [0] * len(records))
+
+    def test_scan_pcapng_records_interface_ids(self) -> None:
+        from pcapkit.foundation.index import FrameIndex
+
+        data = make_pcapng([(1_000_000, b'a', 1), (None, b'b'), (2_000_000, b'c', 0)], interfaces=2)
+        index = FrameIndex.scan(io.BytesIO(data))
+        self.assertEqual(list(index.interface), [1, 0, 0])
+        self.assertEqual(index[0].interface, 1)
+
+        path = self._write('capture.pcapng', data)
+        FrameIndex.from_file(path)
+        loaded = FrameIndex.load(FrameIndex.sidecar_path(path), capture=path)
+        self.assertEqual(list(loaded.interface), [1, 0, 0])
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy') is not None, 'numpy not installed')
+    def test_to_numpy_builds_structured_table(self) -> None:
+        from pcapkit.foundation.index import NO_TIMESTAMP, FrameIndex
+
+        data = make_pcapng([(1_000_000, b'a' * 3, 1), (None, b'b' * 4), (2_000_000, b'c' * 5, 0)], interfaces=2)
+        index = FrameIndex.scan(io.BytesIO(data))
+        table = index.to_numpy()
+
+        self.assertEqual(table.dtype.names, ('timestamp', 'incl_len', 'orig_len', 'offset', 'interface'))
+        self.assertEqual(table['timestamp'].tolist(), [1_000_000_000, NO_TIMESTAMP, 2_000_000_000])
+        self.assertEqual(table['incl_len'].tolist(), [3, 4, 5])
+        self.assertEqual(table['offset'].tolist(), list(index.offset))
+        self.assertEqual(table['interface'].tolist(), [1, 0, 0])
+        self.assertEqual(len(FrameIndex('pcap').to_numpy()), 0)
+
+    def test_to_numpy_requires_numpy(self) -> None:
+        from pcapkit.foundation.index import FrameIndex
+        from pcapkit.utilities.exceptions import ModuleNotFound
+
+        with mock.patch.dict('sys.modules', {'numpy': None}):
+            with self.assertRaises(ModuleNotFound):
+                FrameIndex('pcap').to_numpy()
+
+    def test_scan_matches_samples_and_rejects_unknown_format(self) -> None:
+        from pcapkit.foundation.index import FrameIndex
+        from pcapkit.utilities.exceptions import FormatError
+
+        pcap = FrameIndex.from_file('sample/in.pcap', sidecar=False)
+        self.assertEqual(pcap.length, 6)
+        self.assertEqual(pcap[0].timestamp, 1511106545471719000)
+
+        pcapng = FrameIndex.from_file('sample/dhcp.pcapng', sidecar=False)
+        self.assertEqual(pcapng.format, 'pcapng')
+        self.assertEqual(list(pcapng.incl_len), [314, 342, 314, 342])
+        self.assertEqual(pcapng[0].timestamp, 1102274184317453000)
+
+        with self.assertRaises(FormatError):
+            FrameIndex.scan(io.BytesIO(b'\x00' * 32))
+
+    def test_sidecar_is_reused_and_invalidated_on_change(self) -> None:
+        from pcapkit.foundation.index import FrameIndex
+
+        path = self._write('capture.pcap', make_pcap([(1, 0, b'a')]))
+        index = FrameIndex.from_file(path)
+        sidecar = FrameIndex.sidecar_path(path)
+
+        self.assertTrue(os.path.isfile(sidecar))
+        loaded = FrameIndex.load(sidecar, capture=path)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(list(loaded.offset), list(index.offset))
+        self.assertEqual(list(loaded.timestamp), list(index.timestamp))
+
+        with open(path, 'ab') as file:
+            file.write(struct.pack('<IIII', 2, 0, 1, 1) + b'b')
+        self.assertIsNone(FrameIndex.load(sidecar, capture=path))
+        self.assertEqual(FrameIndex.from_file(path).length, 2)
+
+        self._write('capture.pcap.pcapidx', b'garbage')
+        self.assertIsNone(FrameIndex.load(sidecar))
+
+    def test_sidecar_write_failure_warns(self) -> None:
+        from pcapkit.foundation.index import FrameIndex
+        from pcapkit.utilities.warnings import FileWarning
+
+        path = self._write('capture.pcap', make_pcap([(1, 0, b'a')]))
+        missing = os.path.join(self.tmpdir, 'missing', 'capture.pcapidx')
+        with mock.patch('pcapkit.foundation.index.warn') as warn:
+            index = FrameIndex.from_file(path, sidecar=missing)
+
+        self.assertEqual(index.length, 1)
+        warn.assert_called_once()
+        self.assertIs(warn.call_args.args[1], FileWarning)
+
+
+if __name__ == '__main__':
+    unittest.main()
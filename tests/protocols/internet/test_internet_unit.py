@@ -118,6 +118,7 @@ class InternetBaseUnitTests(unittest.TestCase):
     def test_import_next_layer_branches(self) -> None:
         from pcapkit.const.reg.transtype import TransType
         from pcapkit.corekit.module import ModuleDescriptor
+        from pcapkit.corekit.threshold import Threshold
 
         class FakePayload:
             def __init__(self, file_: bytes, length: int, **kwargs: object) -> None:
@@ -136,6 +137,7 @@ class InternetBaseUnitTests(unittest.TestCase):
         proto._sigterm = False
         proto._exlayer = 'Internet'
         proto._exproto = 'dummy'
+        proto._explan = plan = Threshold('Internet', 'dummy')
         proto.__header__ = SimpleNamespace(get_payload=lambda: b'header-payload')
 
         empty = DummyInternet._import_next_layer(proto, TransType.TCP, length=0, payload=b'')
@@ -145,7 +147,7 @@ class InternetBaseUnitTests(unittest.TestCase):
         self.assertIsInstance(direct, FakePayload)
         self.assertEqual(direct.file, b'direct')
         self.assertEqual(direct.length, 6)
-        self.assertEqual(direct.kwargs['layer'], 'Internet')
+        self.assertIs(direct.kwargs['_plan'], plan)
 
         proto._sigterm = True
         raw = DummyInternet._import_next_layer(proto, TransType.get(250), length=3, payload=b'raw')
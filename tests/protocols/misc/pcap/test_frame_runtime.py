@@ -50,6 +50,32 @@ class PcapFrameRuntimeTests(unittest.TestCase):
         self.assertEqual(frame.payload.payload.name, 'Address Resolution Protocol')
         self.assertEqual(frame.payload.payload.payload.name, 'Unknown')
 
+    def test_lazy_frame_decodes_layers_upon_access(self) -> None:
+        from pcapkit.interface import extract
+
+        eager = extract(fin='sample/in.pcap', store=True, nofile=True, engine='mmap')
+        lazy = extract(fin='sample/in.pcap', store=True, nofile=True, engine='mmap', lazy=True)
+        self.assertEqual(lazy.length, eager.length)
+
+        frame = lazy.frame[0]
+        self.assertIn('_exnext', frame.__dict__)
+        self.assertEqual(frame.info.time, eager.frame[0].info.time)
+        self.assertIn('_exnext', frame.__dict__)
+
+        ipv6 = frame['IPv6']
+        self.assertNotIn('_exnext', frame.payload.__dict__)
+        self.assertIn('_exnext', ipv6.__dict__)
+        self.assertEqual(ipv6.info.src, eager.frame[0]['IPv6'].info.src)
+        self.assertIn('_exnext', ipv6.__dict__)
+
+        self.assertTrue('IPv6' in lazy.frame[1])
+        self.assertEqual(lazy.frame[2].info.ethernet.ipv4.src, eager.frame[2].info.ethernet.ipv4.src)
+        self.assertEqual(lazy.frame[3].info['protocols'], eager.frame[3].info.protocols)
+        for expected, actual in zip(eager.frame, lazy.frame):
+            self.assertEqual(str(actual.protochain), str(expected.protochain))
+            self.assertEqual(list(actual.info.to_dict().items()), list(expected.info.to_dict().items()))
+            self.assertEqual(repr(actual), repr(expected))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,7 +8,7 @@ from decimal import Decimal
 from types import SimpleNamespace
 from unittest import mock
 
-from tests._support import purge_modules
+from tests._support import close_extractor, purge_modules
 
 RUNTIME_DEPS = ('tbtrim', 'aenum', 'chardet', 'dictdumper')
 HAS_RUNTIME = all(importlib.util.find_spec(name) is not None for name in RUNTIME_DEPS)
@@ -294,7 +294,11 @@ class PCAPHeaderFrameUnitTests(unittest.TestCase):
                 mock.patch.object(Frame, '_decode_next_layer',
                                   lambda self, info, proto=None, length=None, packet=None: info), \
                 mock.patch('pcapkit.protocols.misc.pcap.frame.warn') as warn:
-            self.assertEqual(Frame.read(bad_time, _read=False).number, 6)
+            info = Frame.read(bad_time, _read=False)
+            self.assertEqual(info.number, 6)
+            self.assertEqual(info.ts_ns, 1_000_000_000)
+            warn.assert_not_called()
+            self.assertEqual(info.time, real_datetime.fromtimestamp(0, datetime.timezone.utc))
         warn.assert_called_once()
 
         decoded = DummyData()
@@ -315,6 +319,32 @@ class PCAPHeaderFrameUnitTests(unittest.TestCase):
         self.assertIs(frame._decode_next_layer(decoded_no_chain, LinkType.NULL, 0), decoded_no_chain)
         self.assertEqual(decoded_no_chain['protocols'], '')
 
+    def test_frame_timestamps_are_deferred_until_accessed(self) -> None:
+        from pcapkit.interface import extract
+        from pcapkit.protocols.data.misc.pcap.frame import Frame as Data_Frame
+        from pcapkit.protocols.data.misc.pcap.frame import FrameInfo as Data_FrameInfo
+
+        extractor = extract(fin='sample/in.pcap', store=True, nofile=True, protocol='Ethernet')
+        self.addCleanup(close_extractor, extractor)
+
+        info = extractor.frame[0].info
+        ts_sec, ts_usec = info.frame_info.ts_sec, info.frame_info.ts_usec
+        self.assertNotIn('time', info.__dict__)
+        self.assertNotIn('time_epoch', info.__dict__)
+        self.assertEqual(info.ts_ns, ts_sec * 1_000_000_000 + ts_usec * 1_000)
+
+        self.assertEqual(info.time_epoch, ts_sec + Decimal(ts_usec) / 1_000_000)
+        self.assertEqual(info.time, datetime.datetime.fromtimestamp(ts_sec + ts_usec / 1_000_000))
+        self.assertEqual(list(info)[:7], ['frame_info', 'time', 'number', 'time_epoch',
+                                          'len', 'cap_len', 'ethernet'])
+        self.assertNotIn('ts_ns', info.to_dict())
+
+        eager = Data_Frame(
+            frame_info=Data_FrameInfo(ts_sec=1, ts_usec=5, incl_len=0, orig_len=0),
+            time=datetime.datetime.fromtimestamp(1), number=1,
+            time_epoch=Decimal('1.000005'), len=0, cap_len=0,
+        )
+        self.assertEqual(eager.ts_ns, 1_000_005_000)
 
 if __name__ == '__main__':
     unittest.main()
@@ -1275,6 +1275,10 @@ class PCAPNGUnitTests(unittest.TestCase):
             datetime.datetime.fromtimestamp(high + low, datetime.timezone.utc),
             decimal.Decimal(high + low + interface_id),
         )
+        pcapng._read_timestamp_ns = lambda high, low, interface_id=0: (
+            (high + low + interface_id) * 1_000_000_000,
+            lambda: dict(zip(('timestamp', 'timestamp_epoch'), pcapng._read_timestamp(high, low, interface_id))),
+        )
         pcapng._decode_next_layer = lambda data, proto=None, length=None, packet=None: data
 
         def header(block_type: BlockType) -> Header:
@@ -1313,7 +1317,10 @@ class PCAPNGUnitTests(unittest.TestCase):
             header=header(BlockType.Enhanced_Packet_Block),
         )
         self.assertEqual(epb.section_number, 2)
+        self.assertEqual(epb.ts_ns, 3_000_000_000)
         self.assertEqual(epb.timestamp_epoch, decimal.Decimal(3))
+        self.assertEqual(list(epb)[:8], ['type', 'length', 'section_number', 'number', 'interface_id',
+                                         'timestamp', 'timestamp_epoch', 'captured_len'])
 
         spb = pcapng._read_block_spb(
             SimplePacketBlock(length=20, original_len=4, packet_data=b'abcd', length2=20),
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import unittest
+
+from tests._support import purge_modules
+
+RUNTIME_DEPS = ('tbtrim', 'aenum', 'chardet', 'dictdumper')
+HAS_RUNTIME = all(importlib.util.find_spec(name) is not None for name in RUNTIME_DEPS)
+
+
+@unittest.skipUnless(HAS_RUNTIME, 'runtime dependencies not installed')
+class CompilerUnitTests(unittest.TestCase):
+    def setUp(self) -> None:
+        purge_modules(['pcapkit'])
+
+    def _make_schema_classes(self):
+        from pcapkit.corekit.fields.misc import PayloadField
+        from pcapkit.corekit.fields.numbers import UInt8Field, UInt16Field
+        from pcapkit.corekit.fields.strings import BytesField
+        from pcapkit.protocols.schema.schema import Schema, schema_final
+
+        def byteorder_callback(field, packet) -> None:
+            field._byteorder = packet.get('byteorder', 'big')
+
+        @schema_final
+        class HeaderSchema(Schema):
+            kind: int = UInt8Field()
+            size: int = UInt16Field(callback=byteorder_callback)
+            tag: bytes = BytesField(length=2)
+            body: bytes = BytesField(length=lambda packet: packet['size'])
+            payload: bytes = PayloadField(length=lambda packet: packet['__length__'])
+
+        return HeaderSchema
+
+    def test_leading_fixed_length_fields_are_compiled(self) -> None:
+        HeaderSchema = self._make_schema_classes()
+
+        schema = HeaderSchema.unpack(b'\x01\x00\x02AB\xaa\xbbtail', None, None)
+        self.assertEqual(schema.kind, 1)
+        self.assertEqual(schema.size, 2)
+        self.assertEqual(schema.tag, b'AB')
+        self.assertEqual(schema.body, b'\xaa\xbb')
+        self.assertEqual(schema.payload, b'tail')
+        self.assertEqual(schema.__buffer__['size'], b'\x00\x02')
+        self.assertEqual(schema.pack(), b'\x01\x00\x02AB\xaa\xbbtail')
+
+        (deps, unpackers), = HeaderSchema.__compiled__.items()
+        self.assertEqual(deps, (('byteorder',),))
+        unpacker, = unpackers.values()
+        self.assertEqual(unpacker.struct.format, '>BH2s')
+        self.assertEqual([field.name for field in unpacker.fields], ['kind', 'size', 'tag'])
+
+    def test_unpackers_are_cached_by_packet_dependencies(self) -> None:
+        HeaderSchema = self._make_schema_classes()
+
+        big = HeaderSchema.unpack(b'\x01\x00\x01ABx', None, {'byteorder': 'big'})
+        little = HeaderSchema.unpack(b'\x01\x01\x00ABx', None, {'byteorder': 'little'})
+        again = HeaderSchema.unpack(b'\x01\x02\x00ABxy', None, {'byteorder': 'little'})
+        self.assertEqual((big.size, little.size, again.size), (1, 1, 2))
+        self.assertEqual(again.body, b'xy')
+
+        unpackers = HeaderSchema.__compiled__[(('byteorder',),)]
+        self.assertEqual(sorted(unpacker.struct.format for unpacker in unpackers.values()), ['<BH2s', '>BH2s'])
+
+    def test_truncated_data_falls_back_to_generic_path(self) -> None:
+        from pcapkit.protocols.schema.compiler import Unpacker
+
+        HeaderSchema = self._make_schema_classes()
+
+        data = io.BytesIO(b'\x01\x00')
+        schema = HeaderSchema.unpack(data, None, None)
+        self.assertEqual(schema.kind, 1)
+        self.assertEqual(data.tell(), 2)
+
+        schema = HeaderSchema.unpack(b'\x01\x00\x00ABpayload', 3, None)
+        self.assertEqual(schema.kind, 1)
+        self.assertEqual(schema.size, 0)
+        self.assertIsNotNone(Unpacker.from_schema(HeaderSchema, {}))
+
+    def test_compilation_stops_at_dependent_fields(self) -> None:
+        from pcapkit.corekit.fields.numbers import UInt8Field, UInt16Field
+        from pcapkit.corekit.fields.strings import BytesField, PaddingField
+        from pcapkit.protocols.schema.compiler import Unpacker
+        from pcapkit.protocols.schema.schema import Schema, schema_final
+
+        @schema_final
+        class DependentSchema(Schema):
+            size: int = UInt8Field()
+            body: bytes = BytesField(length=lambda packet: packet['size'])
+
+        @schema_final
+        class RemainderSchema(Schema):
+            rest: bytes = BytesField(length=lambda packet: packet['__length__'])
+
+        @schema_final
+        class MixedSchema(Schema):
+            first: int = UInt16Field(byteorder='big')
+            second: int = UInt16Field(byteorder='little')
+
+        @schema_final
+        class PaddedSchema(Schema):
+            pad: bytes = PaddingField(length=1)
+            value: int = UInt8Field()
+
+        self.assertEqual([field.name for field in Unpacker.from_schema(DependentSchema, {}).fields], ['size'])
+        self.assertIsNone(Unpacker.from_schema(RemainderSchema, {'__length__': 4}))
+        self.assertEqual([field.name for field in Unpacker.from_schema(MixedSchema, {}).fields], ['first'])
+        self.assertIsNone(Unpacker.from_schema(PaddedSchema, {}))
+
+        schema = MixedSchema.unpack(b'\x00\x01\x01\x00', None, None)
+        self.assertEqual((schema.first, schema.second), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
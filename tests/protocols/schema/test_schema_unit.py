@@ -331,5 +331,86 @@ class SchemaUnitTests(unittest.TestCase):
         self.assertEqual(observed_padding, [1])
 
 
+    def test_static_fields_are_resolved_once_and_shared(self) -> None:
+        from pcapkit.corekit.fields.misc import ConditionalField, PayloadField, SchemaField
+        from pcapkit.corekit.fields.numbers import UInt8Field, UInt16Field
+        from pcapkit.corekit.fields.strings import PaddingField
+        from pcapkit.protocols.schema.schema import Schema, schema_final
+
+        static = UInt16Field()
+        self.assertTrue(static.static)
+        self.assertIs(static({}), static({'other': 1}))
+
+        dynamic = UInt16Field(callback=lambda field, packet: setattr(field, '_byteorder', packet['order']))
+        self.assertFalse(dynamic.static)
+        self.assertEqual(dynamic({'order': 'little'}).template, '<H')
+        self.assertEqual(dynamic({'order': 'big'}).template, '>H')
+        self.assertEqual(dynamic.template, '>H')
+
+        observed: list[dict] = []
+
+        @schema_final
+        class InnerSchema(Schema):
+            value: int = UInt8Field(length=1, callback=lambda field, packet: observed.append(dict(packet['__packet__'])))
+
+        @schema_final
+        class OuterSchema(Schema):
+            flag: int = UInt8Field()
+            maybe: int = ConditionalField(UInt8Field(), lambda packet: packet['flag'] == 1)
+            inner: InnerSchema = SchemaField(length=1, schema=InnerSchema, packet={'extra': True})
+            pad: bytes = PaddingField(length=lambda packet: packet['flag'])
+            payload: bytes = PayloadField(length=lambda packet: packet['__length__'])
+
+        packet: dict = {}
+        unpacked = OuterSchema.unpack(b'\x01\x02\x03\x00tail', None, packet)
+        self.assertEqual((unpacked.maybe, unpacked.inner.value, unpacked.pad, unpacked.payload),
+                         (2, 3, b'\x00', b'tail'))
+        self.assertTrue(observed[-1]['extra'])
+        self.assertNotIn('extra', packet)
+        self.assertEqual(packet['__length__'], 0)
+
+        unpacked = OuterSchema.unpack(b'\x00\x03tail', None, None)
+        self.assertIsNone(unpacked.maybe)
+        self.assertEqual((unpacked.inner.value, unpacked.pad, unpacked.payload), (3, b'', b'tail'))
+
+
+    def test_unpack_from_buffer_offsets_and_consumed_length(self) -> None:
+        import io
+
+        from pcapkit.corekit.fields.misc import ForwardMatchField, PayloadField
+        from pcapkit.corekit.fields.numbers import UInt8Field, UInt16Field
+        from pcapkit.corekit.fields.strings import BytesField
+        from pcapkit.protocols.schema.schema import Schema, schema_final
+
+        @schema_final
+        class BufferSchema(Schema):
+            kind: int = UInt8Field()
+            peek: int = ForwardMatchField(UInt8Field())
+            size: int = UInt16Field()
+            body: bytes = BytesField(length=lambda packet: packet['size'])
+            payload: bytes = PayloadField(length=lambda packet: packet['__length__'])
+
+        data = b'junk\x07\x00\x02abtail'
+        schema, size = BufferSchema.unpack_from(memoryview(data), 4)
+        self.assertEqual(size, len(data) - 4)
+        self.assertEqual((schema.kind, schema.peek, schema.size, schema.body, schema.payload),
+                         (7, 0, 2, b'ab', b'tail'))
+        self.assertIsInstance(schema.__buffer__['body'], bytes)
+        self.assertEqual(schema, BufferSchema.unpack(data[4:], None, None))
+
+        schema, size = BufferSchema.unpack_from(data, 4, 5)
+        self.assertEqual(size, 5)
+        self.assertEqual(schema.payload, b'')
+
+        stream = io.BytesIO(data)
+        stream.seek(4)
+        BufferSchema.unpack(stream, 5, None)
+        self.assertEqual(stream.tell(), 9)
+        stream.write(b'!')  # buffer export released
+
+        with self.assertRaises(EOFError):
+            BufferSchema.unpack_from(data, len(data))
+
+
 if __name__ == '__main__':
     unittest.main()
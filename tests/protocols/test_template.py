@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import struct
+import tempfile
+import unittest
+
+from tests._support import close_extractor, purge_modules
+
+RUNTIME_DEPS = ('tbtrim', 'aenum', 'chardet', 'dictdumper')
+HAS_RUNTIME = all(importlib.util.find_spec(name) is not None for name in RUNTIME_DEPS)
+
+
+@unittest.skipUnless(HAS_RUNTIME, 'runtime dependencies not installed')
+class TemplateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        purge_modules(['pcapkit'])
+
+    def _make_tcp_template(self):
+        from pcapkit.const.reg.ethertype import EtherType
+        from pcapkit.const.reg.transtype import TransType
+        from pcapkit.protocols.internet.ipv4 import IPv4
+        from pcapkit.protocols.link.ethernet import Ethernet
+        from pcapkit.protocols.transport.tcp import TCP
+
+        return Ethernet.template(
+            type=EtherType.Internet_Protocol_version_4,
+            payload=IPv4.template(
+                src='192.0.2.1', dst='198.51.100.2', protocol=TransType.TCP, ttl=64,
+                payload=TCP.template(srcport=1234, dstport=8080, ack=True, payload=b'body'),
+            ),
+        )
+
+    def test_checksum_matches_known_ipv4_header(self) -> None:
+        from pcapkit.protocols.template import checksum
+
+        header = bytes.fromhex('450000730000400040110000c0a80001c0a800c7')
+        self.assertEqual(checksum(header), 0xb861)
+        self.assertEqual(checksum(header[:10] + b'\xb8\x61' + header[12:]), 0)
+        self.assertEqual(checksum(b'\x01'), checksum(b'\x01\x00'))
+
+    def test_render_patches_fields_and_fixes_lengths_and_checksums(self) -> None:
+        from pcapkit.protocols.link.ethernet import Ethernet
+        from pcapkit.protocols.template import checksum
+
+        template = self._make_tcp_template()
+        self.assertEqual(repr(template), '<Template Ethernet:IPv4:TCP (58 bytes)>')
+        self.assertEqual([layer.offset for layer in template.layers], [0, 14, 34])
+
+        data = template.render({'ethernet.src': bytes.fromhex('020000000001'), 'ipv4.id': 7, 'tcp.seq': 100,
+                                'tcp.dstport': 80, 'payload': b'longer-body'})
+        self.assertEqual(len(data), 14 + 20 + 20 + 11)
+
+        ipv4 = data[14:34]
+        segment = data[34:]
+        self.assertEqual(struct.unpack('!H', ipv4[2:4])[0], 20 + 20 + 11)
+        self.assertEqual(checksum(ipv4), 0)
+        self.assertEqual(checksum(ipv4[12:20] + struct.pack('!HH', 6, len(segment)) + segment), 0)
+
+        frame = Ethernet(data)
+        self.assertEqual(frame.info.src, '02:00:00:00:00:01')
+        self.assertEqual(frame.info.ipv4.id, 7)
+        self.assertEqual(frame.info.ipv4.len, 20 + 20 + 11)
+        self.assertEqual(frame.info.ipv4.tcp.seq, 100)
+        self.assertEqual(int(frame.info.ipv4.tcp.dstport), 80)
+        self.assertTrue(frame.info.ipv4.tcp.flags.ack)
+
+        # template itself is left untouched
+        self.assertEqual(template.render(), template.render(None))
+        self.assertEqual(list(template.render_many([{'ipv4.id': 1}, {'ipv4.id': 2}]))[1][18:20], b'\x00\x02')
+
+    def test_render_ipv6_udp_and_invalid_variations(self) -> None:
+        from pcapkit.const.reg.transtype import TransType
+        from pcapkit.protocols.internet.ipv6 import IPv6
+        from pcapkit.protocols.template import checksum
+        from pcapkit.protocols.transport.udp import UDP
+        from pcapkit.utilities.exceptions import MissingKeyError
+
+        template = IPv6.template(src='2001:db8::1', dst='2001:db8::2', next=TransType.UDP,
+                                 payload=UDP.template(srcport=5353, dstport=53))
+        data = template.render({'udp.srcport': 1000, 'payload': b'abcde'})
+
+        segment = data[40:]
+        self.assertEqual(struct.unpack('!H', data[4:6])[0], 13)
+        self.assertEqual(struct.unpack('!HH', segment[:4]), (1000, 53))
+        self.assertEqual(struct.unpack('!H', segment[4:6])[0], 13)
+        self.assertEqual(checksum(data[8:40] + struct.pack('!IHBB', len(segment), 0, 0, 17) + segment), 0)
+
+        unchecked = IPv6.template(src='2001:db8::1', dst='2001:db8::2', next=TransType.UDP, fix_checksum=False,
+                                  payload=UDP.template(srcport=5353, dstport=53))
+        self.assertEqual(unchecked.render()[46:48], b'\x00\x00')
+
+        with self.assertRaises(MissingKeyError):
+            template.render({'udp.nonexistent': 1})
+
+    def test_dump_writes_pcap_frames(self) -> None:
+        from pcapkit.const.reg.linktype import LinkType
+        from pcapkit.interface import extract
+
+        template = self._make_tcp_template()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, 'template.pcap')
+            dumper = template.dump(fname, ({'ipv4.id': index, 'payload': b'x' * index} for index in range(3)),
+                                   linktype=LinkType.ETHERNET, timestamp=1000.5, interval=0.25)
+            self.assertEqual(dumper._fnum, 4)
+
+            extractor = extract(fin=fname, store=True, nofile=True)
+            self.addCleanup(close_extractor, extractor)
+
+            self.assertEqual(extractor.length, 3)
+            for index, frame in enumerate(extractor.frame):
+                self.assertEqual(float(frame.info.time_epoch), 1000.5 + index * 0.25)
+                self.assertEqual(frame.info.len, 54 + index)
+                self.assertEqual(frame.info.ethernet.ipv4.id, index)
+                self.assertEqual(frame.info.ethernet.ipv4.len, 40 + index)
+
+
+if __name__ == '__main__':
+    unittest.main()